@@ -0,0 +1,29 @@
+"""
+Optional mypyc build for the input transformer.
+
+Project metadata lives in pyproject.toml; this file only exists to add the
+compiled extension when explicitly requested. Default builds are pure Python.
+
+    pip install mypy
+    WAFT_MYPYC=1 pip install --no-build-isolation .
+
+The compiled module shadows src/waft/core/input_transformer.py; when it is not
+built, the pure-Python module is imported as usual.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("WAFT_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        # Only the transformer is compiled; its imports are type-checked silently
+        "--follow-imports=silent",
+        "--ignore-missing-imports",
+        "src/waft/core/input_transformer.py",
+    ])
+
+setup(ext_modules=ext_modules)
@@ -10,7 +10,7 @@ import inspect
 from abc import ABC, abstractmethod
 from hashlib import sha256
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from .state import (
@@ -65,7 +65,7 @@ class BaseAgent(ABC):
         self.genome_id = self._compute_genome_id()
         self.generation = 0
         self.parent_id = None
-        self.lineage_path = [self.genome_id]  # Start with self
+        self.lineage_path: Tuple[str, ...] = (self.genome_id,)  # Start with self
 
         # Assign anatomical archetype deterministically from genome_id
         symbol = AnatomicalArchetype.assign_symbol(self.genome_id)
@@ -169,7 +169,7 @@ class BaseAgent(ABC):
             payload=payload,
             fitness_metrics=fitness_metrics,
             agent_id=self.state.agent_id,
-            lineage_path=self.lineage_path.copy()
+            lineage_path=self.lineage_path
         )
 
         # Add to flight recorder
@@ -230,7 +230,7 @@ class BaseAgent(ABC):
         # Set lineage
         child.parent_id = self.genome_id
         child.generation = self.generation + 1
-        child.lineage_path = self.lineage_path + [child.genome_id]
+        child.lineage_path = self.lineage_path + (child.genome_id,)
 
         # Record child spawn event
         child._record_event(
@@ -322,14 +322,10 @@ class BaseAgent(ABC):
             }
         }
         
-        # Add to journal and short_term_memory
+        # Add to journal and short_term_memory (a deque bounded to the last 10)
         self.state.journal.append(thought)
         self.state.short_term_memory.append(thought)
         
-        # Keep short_term_memory bounded (last 10 entries)
-        if len(self.state.short_term_memory) > 10:
-            self.state.short_term_memory.pop(0)
-        
         # Execute OODA cycle
         observe_result = await self.observe()
         decide_result = await self.decide(self.state)
@@ -344,8 +340,6 @@ class BaseAgent(ABC):
             }
             self.state.journal.append(reflection)
             self.state.short_term_memory.append(reflection)
-            if len(self.state.short_term_memory) > 10:
-                self.state.short_term_memory.pop(0)
             
             return {
                 "status": "stopped",
@@ -380,10 +374,6 @@ class BaseAgent(ABC):
         self.state.journal.append(reflection)
         self.state.short_term_memory.append(reflection)
         
-        # Keep short_term_memory bounded
-        if len(self.state.short_term_memory) > 10:
-            self.state.short_term_memory.pop(0)
-        
         return {
             "status": "completed",
             "thought": thought,
@@ -881,7 +871,7 @@ class BaseAgent(ABC):
         # Set lineage (child of both parents)
         child.parent_id = parent_a.genome_id  # Primary parent
         child.generation = max(parent_a.generation, parent_b.generation) + 1
-        child.lineage_path = parent_a.lineage_path + [child.genome_id]
+        child.lineage_path = parent_a.lineage_path + (child.genome_id,)
 
         # Override anatomical symbol (inherited or mutated)
         child.state.anatomical_symbol = child_symbol
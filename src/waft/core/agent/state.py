@@ -4,12 +4,16 @@ Agent State Models: The DNA of Waft agents.
 Defines the Pydantic models for agent state, configuration, and evolutionary events.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from collections import deque
+from pydantic import BaseModel, Field, field_validator
+from typing import Deque, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
 
+SHORT_TERM_MEMORY_SIZE = 10  # Most recent journal entries kept in short-term memory
+
+
 class MessageRole(str, Enum):
     """Message roles compatible with AG2 protocol."""
     USER = "user"
@@ -57,7 +61,10 @@ class AgentState(BaseModel):
 
     # Private Journal (The Cogito)
     journal: List[Dict[str, Any]] = Field(default_factory=list, description="Private journal entries (Thoughts and Reflections)")
-    short_term_memory: List[Dict[str, Any]] = Field(default_factory=list, description="Short-term memory buffer (recent thoughts/reflections)")
+    short_term_memory: Deque[Dict[str, Any]] = Field(
+        default_factory=lambda: deque(maxlen=SHORT_TERM_MEMORY_SIZE),
+        description="Short-term memory buffer (recent thoughts/reflections, oldest dropped first)",
+    )
 
     # Agent Identity
     agent_id: str = Field(description="Unique agent identifier")
@@ -103,6 +110,12 @@ class AgentState(BaseModel):
     state_version: int = Field(default=1, description="State schema version")
     last_updated: datetime = Field(default_factory=datetime.utcnow)
 
+    @field_validator("short_term_memory")
+    @classmethod
+    def _bound_short_term_memory(cls, value: Deque[Dict[str, Any]]) -> Deque[Dict[str, Any]]:
+        """Keep validated short-term memory bounded (validation drops maxlen)."""
+        return deque(value, maxlen=SHORT_TERM_MEMORY_SIZE)
+
 
 class AgentConfig(BaseModel):
     """
@@ -200,4 +213,4 @@ class EvolutionaryEvent(BaseModel):
     agent_id: str = Field(description="Agent identifier")
 
     # Lineage
-    lineage_path: List[str] = Field(default_factory=list, description="Path from genesis to this genome (list of genome_ids)")
+    lineage_path: Tuple[str, ...] = Field(default_factory=tuple, description="Path from genesis to this genome (tuple of genome_ids)")
@@ -0,0 +1,117 @@
+"""
+Context Cache - Short-lived memoization of gathered project context.
+
+Proceed and recap gather the same git context (status, branch, ...) and are
+often run back to back. This cache lets them share one result for a couple of
+seconds, or until a cheap validity stamp (such as the .git/index mtime)
+changes.
+"""
+
+import copy
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class ContextCache:
+    """Thread-safe TTL cache keyed by arbitrary hashable keys."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        # key -> (monotonic time computed, validity stamp, value)
+        self._entries: Dict[Hashable, Tuple[float, Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        ttl: float,
+        fn: Callable[[], Any],
+        stamp: Any = None,
+    ) -> Any:
+        """
+        Return the cached value for key, computing it if stale or missing.
+
+        Args:
+            key: Cache key (e.g. ("git_ctx", project path))
+            ttl: Maximum age of a cached value in seconds
+            fn: Zero-argument function computing the value
+            stamp: Validity stamp; a cached value is only reused while the
+                stamp passed in is equal to the one stored with it
+
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < ttl and entry[1] == stamp:
+                return entry[2]
+
+        # Compute outside the lock so slow work (subprocesses) does not block
+        # other keys; concurrent misses on the same key just compute twice
+        value = fn()
+        with self._lock:
+            self._entries[key] = (now, stamp, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop one cached entry, or all entries when key is None.
+
+        Args:
+            key: Cache key to drop
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+# Shared by ProceedManager, RecapManager and anything else gathering context
+SHARED_CONTEXT_CACHE = ContextCache()
+
+
+def mtime_memoize(watch_paths: Iterable[str], ttl: float = 2.0) -> Callable:
+    """
+    Memoize a no-argument method of an object with a `project_path` attribute.
+
+    Results live in SHARED_CONTEXT_CACHE keyed by method and project path, so
+    separate instances for the same project share them. A result is reused
+    for at most `ttl` seconds and only while the modification times of
+    `watch_paths` (relative to the project path) are unchanged. Callers get a
+    deep copy and may modify it.
+
+    Args:
+        watch_paths: Paths whose mtimes invalidate the cached result
+        ttl: Maximum age of a cached result in seconds
+
+    Returns:
+        Decorator
+    """
+    watch_paths = tuple(watch_paths)
+
+    def decorator(method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        @functools.wraps(method)
+        def wrapper(self) -> Any:
+            root = os.fspath(self.project_path)
+            stamp = []
+            for rel_path in watch_paths:
+                try:
+                    stamp.append(os.stat(os.path.join(root, rel_path)).st_mtime_ns)
+                except OSError:
+                    stamp.append(None)
+            result = SHARED_CONTEXT_CACHE.get_or_compute(
+                (method.__qualname__, os.path.abspath(root)),
+                ttl=ttl,
+                fn=lambda: method(self),
+                stamp=tuple(stamp),
+            )
+            return copy.deepcopy(result)
+
+        return wrapper
+
+    return decorator
@@ -132,7 +132,7 @@ class ContinueManager:
                     check=False,
                 )
                 if result.returncode == 0:
-                    uncommitted = [line[3:].strip() for line in result.stdout.strip().split("\n") if line.strip()]
+                    uncommitted = [line[3:] for line in result.stdout.splitlines() if line]
                     git_info["uncommitted_files"] = uncommitted[:20]  # Limit to 20
                     git_info["uncommitted_count"] = len(uncommitted)
             except Exception:
@@ -2,10 +2,87 @@
 GitHub Integration - Commands for GitHub repository management.
 """
 
+import importlib.util
+import itertools
+import os
+import re
 import subprocess
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple
+
+from .context_cache import SHARED_CONTEXT_CACHE
+
+# How long a gathered git context may be reused (seconds)
+GIT_CONTEXT_TTL = 2.0
+
+# dulwich (pure-Python git) reads repositories in-process when no git
+# executable is available. It is only located here, not imported: the import
+# alone costs more than a `git status` spawn, so it is deferred until needed.
+DULWICH_AVAILABLE = importlib.util.find_spec("dulwich") is not None
+
+
+# Branch header prefixes `git status -b` uses before the first commit
+_UNBORN_BRANCH_PREFIXES = ("No commits yet on ", "Initial commit on ")
+
+# Upstream divergence suffix of a `git status -b` header, e.g. "[ahead 2, behind 1]"
+_AHEAD_RE = re.compile(r"\[ahead (\d+)")
+
+
+def parse_branch_header(header: str) -> str:
+    """
+    Extract the branch name from a `git status --porcelain -b` header line.
+
+    Args:
+        header: First output line, e.g. "## main...origin/main [ahead 1]"
+
+    Returns:
+        Branch name, or "" when HEAD is detached (like `git branch --show-current`)
+    """
+    text = header[3:] if header.startswith("## ") else header
+    for prefix in _UNBORN_BRANCH_PREFIXES:
+        if text.startswith(prefix):
+            return text[len(prefix):].strip()
+    if text.startswith("HEAD (no branch)"):
+        return ""
+    # Branch names cannot contain "..." or spaces, so the name ends at either
+    return text.split("...", 1)[0].split(" ", 1)[0]
+
+
+def parse_ahead_count(header: str) -> int:
+    """
+    Extract how many commits HEAD is ahead of its upstream from a header line.
+
+    Args:
+        header: First `git status --porcelain -b` line, e.g.
+            "## main...origin/main [ahead 2, behind 1]"
+
+    Returns:
+        Commits ahead of upstream (0 without an upstream or when not ahead)
+    """
+    match = _AHEAD_RE.search(header)
+    return int(match.group(1)) if match else 0
+
+
+def _porcelain_z_paths(fields: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    Yield entry paths from `git status --porcelain -z` fields.
+
+    Each field is "XY path". Renames and copies are followed by an extra
+    field holding the source path, which is skipped.
+
+    Args:
+        fields: NUL-separated output fields (after any "## " header)
+
+    Yields:
+        Path bytes for each entry
+    """
+    for field in fields:
+        if len(field) <= 3:
+            continue
+        if field[0] in b"RC" or field[1] in b"RC":
+            next(fields, None)
+        yield field[3:]
 
 
 class GitHubManager:
@@ -28,7 +105,7 @@ class GitHubManager:
         """Get GitHub remote URL if configured."""
         try:
             result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
+                ["git", "--no-optional-locks", "remote", "get-url", "origin"],
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
@@ -54,6 +131,36 @@ class GitHubManager:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
+    def get_current_branch(self) -> Optional[str]:
+        """
+        Read the current branch name from HEAD without running git.
+
+        Handles worktrees/submodules where .git is a "gitdir:" pointer file.
+
+        Returns:
+            Branch name, "" when HEAD is detached (like `git branch
+            --show-current`), or None if HEAD cannot be read
+        """
+        git_path = self.project_path / ".git"
+        try:
+            if git_path.is_file():
+                pointer = git_path.read_text(encoding="utf-8").strip()
+                if not pointer.startswith("gitdir:"):
+                    return None
+                git_dir = self.project_path / pointer[len("gitdir:"):].strip()
+            else:
+                git_dir = git_path
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+
+        if not head.startswith("ref:"):
+            return ""  # Detached: HEAD holds a commit id
+        ref = head[len("ref:"):].strip()
+        if ref.startswith("refs/heads/"):
+            return ref[len("refs/heads/"):]
+        return ref
+
     def get_status(self) -> Dict[str, Any]:
         """Get repository status."""
         status = {
@@ -63,19 +170,22 @@ class GitHubManager:
 
         if self.is_initialized():
             try:
-                # Get branch name
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                status["branch"] = result.stdout.strip()
+                # Get branch name (read from .git/HEAD, no subprocess)
+                branch = self.get_current_branch()
+                if branch is None:
+                    result = subprocess.run(
+                        ["git", "--no-optional-locks", "branch", "--show-current"],
+                        cwd=self.project_path,
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    )
+                    branch = result.stdout.strip()
+                status["branch"] = branch
 
                 # Get commit count
                 result = subprocess.run(
-                    ["git", "rev-list", "--count", "HEAD"],
+                    ["git", "--no-optional-locks", "rev-list", "--count", "HEAD"],
                     cwd=self.project_path,
                     capture_output=True,
                     text=True,
@@ -87,4 +197,170 @@ class GitHubManager:
 
         return status
 
+    def get_working_tree_info(self, max_files: Optional[int] = 20) -> Dict[str, Any]:
+        """
+        Get branch name, upstream lead and uncommitted files with one git call.
+
+        `git status --porcelain -b` prints the branch and its ahead/behind
+        counts as a "## " header line before the file entries, so one process
+        replaces separate `git branch --show-current`, `git status --porcelain`
+        and `git rev-list --count @{u}..HEAD` calls.
+
+        Args:
+            max_files: Maximum number of uncommitted file paths to return
+                (None for all)
+
+        Returns:
+            Dictionary with 'branch' (None if git failed), 'commits_ahead',
+            'uncommitted_count' and 'uncommitted_files'
+        """
+        info: Dict[str, Any] = {
+            "branch": None,
+            "commits_ahead": 0,
+            "uncommitted_count": 0,
+            "uncommitted_files": [],
+        }
+
+        try:
+            result = subprocess.run(
+                # --no-optional-locks: a read-only status must not rewrite
+                # .git/index, which would also invalidate get_git_context.
+                # -z: NUL-separated, unquoted paths, parsed as bytes
+                ["git", "--no-optional-locks", "status", "--porcelain", "-z", "-b"],
+                cwd=self.project_path,
+                capture_output=True,
+                check=False,
+            )
+        except FileNotFoundError:
+            # No git executable: fall back to reading the repository in-process
+            return self._dulwich_working_tree_info(max_files) or info
+        except (OSError, subprocess.SubprocessError):
+            return info
+
+        if result.returncode != 0:
+            return info
+
+        fields = iter(result.stdout.split(b"\0"))
+        first = next(fields, b"")
+        if first.startswith(b"## "):
+            header = first.decode("utf-8", "replace")
+            info["branch"] = parse_branch_header(header)
+            info["commits_ahead"] = parse_ahead_count(header)
+        else:
+            fields = itertools.chain((first,), fields)
+
+        paths = _porcelain_z_paths(fields)
+        # Decode only the paths that are returned; the rest are just counted
+        info["uncommitted_files"] = [
+            path.decode("utf-8", "replace") for path in itertools.islice(paths, max_files)
+        ]
+        info["uncommitted_count"] = len(info["uncommitted_files"]) + sum(1 for _ in paths)
+        return info
+
+    def _dulwich_working_tree_info(self, max_files: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        In-process equivalent of get_working_tree_info using dulwich.
+
+        Upstream tracking is not resolved, so 'commits_ahead' is always 0.
+
+        Args:
+            max_files: Maximum number of uncommitted file paths to return
+                (None for all)
+
+        Returns:
+            Same dictionary as get_working_tree_info, or None if dulwich is not
+            installed or cannot read the repository
+        """
+        if not DULWICH_AVAILABLE:
+            return None
 
+        try:
+            from dulwich.porcelain import status as dulwich_status
+            from dulwich.repo import Repo
+
+            with Repo(str(self.project_path)) as repo:
+                chain, _sha = repo.refs.follow(b"HEAD")
+                head_ref = chain[-1]
+                status = dulwich_status(repo)
+        except Exception:
+            return None
+
+        # Detached HEAD resolves to itself; report "" like `git branch --show-current`
+        branch = ""
+        if head_ref.startswith(b"refs/heads/"):
+            branch = head_ref[len(b"refs/heads/"):].decode("utf-8", "replace")
+
+        # A path staged and then modified again is one entry, as in `git status`
+        paths = set(status.unstaged)
+        paths.update(status.untracked)
+        for staged in status.staged.values():
+            paths.update(staged)
+        uncommitted = sorted(os.fsdecode(path) for path in paths)
+
+        return {
+            "branch": branch,
+            "commits_ahead": 0,
+            "uncommitted_count": len(uncommitted),
+            "uncommitted_files": uncommitted[:max_files],
+        }
+
+    def get_git_context(self, max_files: int = 20) -> Dict[str, Any]:
+        """
+        Get git initialization, branch and uncommitted files, cached briefly.
+
+        Results are shared through SHARED_CONTEXT_CACHE for GIT_CONTEXT_TTL
+        seconds, so back-to-back proceed/recap runs call git once. A change to
+        .git/index or .git/HEAD (staging, commits, checkouts) invalidates the
+        cached value immediately.
+
+        Args:
+            max_files: Maximum number of uncommitted file paths to return
+
+        Returns:
+            Dictionary with 'initialized', 'branch', 'commits_ahead',
+            'uncommitted_count' and 'uncommitted_files' (a fresh copy; callers
+            may modify it)
+        """
+        if not self.is_initialized():
+            # Nothing to run or cache: skip the stamp stats and cache lock
+            return {
+                "initialized": False,
+                "branch": "unknown",
+                "commits_ahead": 0,
+                "uncommitted_count": 0,
+                "uncommitted_files": [],
+            }
+
+        key = ("git_ctx", str(self.project_path.resolve()), max_files)
+        context = SHARED_CONTEXT_CACHE.get_or_compute(
+            key,
+            ttl=GIT_CONTEXT_TTL,
+            fn=lambda: self._compute_git_context(max_files),
+            stamp=self._git_state_stamp(),
+        )
+        return {**context, "uncommitted_files": list(context["uncommitted_files"])}
+
+    def _compute_git_context(self, max_files: int) -> Dict[str, Any]:
+        """Gather the uncached git context for an initialized repository."""
+        context: Dict[str, Any] = {
+            "initialized": True,
+            "branch": "unknown",
+            "commits_ahead": 0,
+            "uncommitted_count": 0,
+            "uncommitted_files": [],
+        }
+        tree_info = self.get_working_tree_info(max_files=max_files)
+        if tree_info["branch"] is not None:
+            context.update(tree_info)
+        return context
+
+    def _git_state_stamp(self) -> Tuple[Optional[int], Optional[int]]:
+        """Modification times of .git/index and .git/HEAD (None when missing)."""
+        git_dir = os.path.join(self.project_path, ".git")
+        stamp = []
+        for name in ("index", "HEAD"):
+            try:
+                stamp.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
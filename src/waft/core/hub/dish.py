@@ -30,6 +30,9 @@ class PetriDish:
     Provides spatial organization and neighborhood queries for organism interaction.
     """
     
+    # Grid buckets cover 2**BUCKET_SHIFT x 2**BUCKET_SHIFT cells (32x32)
+    BUCKET_SHIFT = 5
+    
     def __init__(self, dish_id: str, biome_id: str, width: int = 100, height: int = 100):
         """
         Initialize PetriDish.
@@ -54,6 +57,10 @@ class PetriDish:
         # Items: (x, y) -> List[Item] (items can exist in cells)
         self.items: Dict[Tuple[int, int], List[Item]] = {}
         
+        # Spatial index: organism_id -> (x, y), and coarse bucket -> organism_ids
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._grid_buckets: Dict[Tuple[int, int], List[str]] = {}
+        
         # Initialize empty lattice
         for x in range(width):
             for y in range(height):
@@ -120,6 +127,8 @@ class PetriDish:
         organism_id = organism.state.agent_id
         self.organisms[organism_id] = organism
         self.lattice[position] = organism_id
+        self._positions[organism_id] = position
+        self._grid_buckets.setdefault(self._bucket_key(position), []).append(organism_id)
         
         return True
     
@@ -136,11 +145,13 @@ class PetriDish:
         if organism_id not in self.organisms:
             return False
         
-        # Find and clear position in lattice
-        for position, oid in self.lattice.items():
-            if oid == organism_id:
-                self.lattice[position] = None
-                break
+        # Clear position in lattice and spatial index
+        position = self._positions.pop(organism_id, None)
+        if position is not None:
+            self.lattice[position] = None
+            bucket = self._grid_buckets.get(self._bucket_key(position))
+            if bucket is not None:
+                bucket.remove(organism_id)
         
         # Remove from organisms dict
         del self.organisms[organism_id]
@@ -157,10 +168,7 @@ class PetriDish:
         Returns:
             (x, y) position or None if not found
         """
-        for position, oid in self.lattice.items():
-            if oid == organism_id:
-                return position
-        return None
+        return self._positions.get(organism_id)
     
     def get_neighborhood(
         self, 
@@ -194,6 +202,47 @@ class PetriDish:
         
         return neighborhood
     
+    def get_neighbors(
+        self,
+        position: Tuple[int, int],
+        radius: int = 1
+    ) -> List[Tuple[int, int, str]]:
+        """
+        Get occupied cells around position (Moore neighborhood).
+        
+        Small radii probe the lattice directly; larger radii scan only the
+        grid buckets overlapping the neighborhood.
+        
+        Args:
+            position: (x, y) center position
+            radius: Neighborhood radius (default: 1)
+            
+        Returns:
+            List of (x, y, organism_id) tuples for occupied neighboring cells
+        """
+        x, y = position
+        shift = self.BUCKET_SHIFT
+        buckets = [
+            self._grid_buckets.get((bx, by), ())
+            for bx in range((x - radius) >> shift, ((x + radius) >> shift) + 1)
+            for by in range((y - radius) >> shift, ((y + radius) >> shift) + 1)
+        ]
+        
+        if (2 * radius + 1) ** 2 <= sum(len(bucket) for bucket in buckets):
+            return [
+                (nx, ny, organism_id)
+                for nx, ny, organism_id in self.get_neighborhood(position, radius)
+                if organism_id is not None
+            ]
+        
+        neighbors = []
+        for bucket in buckets:
+            for organism_id in bucket:
+                nx, ny = self._positions[organism_id]
+                if (nx, ny) != position and abs(nx - x) <= radius and abs(ny - y) <= radius:
+                    neighbors.append((nx, ny, organism_id))
+        return neighbors
+    
     def get_empty_cell(self) -> Optional[Tuple[int, int]]:
         """
         Find an empty cell in the lattice.
@@ -214,3 +263,8 @@ class PetriDish:
         """Check if position is within lattice bounds."""
         x, y = position
         return 0 <= x < self.width and 0 <= y < self.height
+    
+    def _bucket_key(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        """Get grid bucket key for a lattice position."""
+        x, y = position
+        return (x >> self.BUCKET_SHIFT, y >> self.BUCKET_SHIFT)
@@ -6,12 +6,13 @@ TheReaper: Manager of mortality (fitness death, boundary death).
 """
 
 import asyncio
+import time
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 from pathlib import Path
 
 from ..agent.base import BaseAgent
-from ..agent.state import EvolutionaryEventType
+from ..agent.state import EvolutionaryEvent, EvolutionaryEventType
 from .dish import PetriDish
 from ..science.observer import TheObserver
 
@@ -60,116 +61,157 @@ class TheSlicer:
         slice_number = self.slice_count
         self.active_slices[organism_id] = slice_number
         
-        slice_start = datetime.utcnow()
+        slice_start_ns = time.perf_counter_ns()
         
         try:
-            # Calculate social context (quorum sensing)
-            organism_position = dish.get_organism_position(organism_id)
-            neighbor_count = 0
-            population_density = 0.0
-            
-            if organism_position:
-                # Get neighborhood (radius 1 = 8 neighbors)
-                neighborhood = dish.get_neighborhood(organism_position, radius=1)
-                neighbor_count = sum(1 for _, _, oid in neighborhood if oid is not None)
-                
-                # Population density = organisms / total_cells
-                total_cells = dish.width * dish.height
-                population_density = dish.get_organism_count() / total_cells if total_cells > 0 else 0.0
-            
-            # Prepare social context for step()
-            organism_position = dish.get_organism_position(organism_id)
-            context = {
-                "neighbor_count": neighbor_count,
-                "population_density": population_density,
-                "total_population": dish.get_organism_count(),
-                "dish_id": dish.dish_id,
-                "biome_id": dish.biome_id,
-                "position": organism_position
-            }
-            
-            # Execute step() which records Thought before action and Reflection after
-            step_result = await organism.step(context=context)
-            
-            # Extract results from step
-            observe_result = step_result.get("observe", {})
-            decide_result = step_result.get("decide", {})
-            act_result = step_result.get("act", {})
-            reflect_result = step_result.get("reflect", {})
-            
-            # Check if organism wants to stop
-            if step_result.get("status") == "stopped":
-                return {
-                    "slice_number": slice_number,
-                    "organism_id": organism_id,
-                    "status": "stopped",
-                    "reason": "organism_requested_stop",
-                    "thought": step_result.get("thought"),
-                    "reflection": step_result.get("reflection")
-                }
-            
-            # Check gestation (reproduction) - after OODA cycle
-            spawned_child = organism.check_gestation(slice_number, dish)
-            if spawned_child:
-                # Child spawned - log birth event
-                self._log_metabolic_action(
-                    organism,
-                    dish,
-                    slice_number,
-                    0.0,  # Duration for birth
-                    {"action": "child_born", "child_genome": spawned_child.genome_id, "child_name": spawned_child.scientific_name}
-                )
-            
-            slice_end = datetime.utcnow()
-            slice_duration = (slice_end - slice_start).total_seconds()
+            return await self._grant_time_slice_inner(organism, dish, slice_number, slice_start_ns)
+        except Exception as e:
+            return self._slice_error(organism, dish, slice_number, slice_start_ns, e)
+    
+    async def _grant_time_slice_inner(
+        self,
+        organism: BaseAgent,
+        dish: PetriDish,
+        slice_number: int,
+        slice_start_ns: int
+    ) -> dict:
+        """
+        Execute one OODA cycle for an organism (happy path, no error handling).
+        
+        Args:
+            organism: DigitalOrganism to grant slice to
+            dish: PetriDish containing the organism
+            slice_number: Slice number assigned by grant_time_slice
+            slice_start_ns: perf_counter_ns() reading at slice start
             
-            # Log metabolic action
-            self._log_metabolic_action(
-                organism=organism,
-                dish=dish,
-                slice_number=slice_number,
-                duration=slice_duration,
-                actions={
-                    "observe": observe_result,
-                    "decide": decide_result,
-                    "act": act_result,
-                    "reflect": reflect_result
-                }
-            )
+        Returns:
+            Result dictionary with slice execution details
+        """
+        organism_id = organism.state.agent_id
+        
+        # Calculate social context (quorum sensing)
+        organism_position = dish.get_organism_position(organism_id)
+        neighbor_count = 0
+        population_density = 0.0
+        
+        if organism_position:
+            # Get occupied neighbors (radius 1 = up to 8 neighbors)
+            neighbor_count = len(dish.get_neighbors(organism_position, radius=1))
             
+            # Population density = organisms / total_cells
+            total_cells = dish.width * dish.height
+            population_density = dish.get_organism_count() / total_cells if total_cells > 0 else 0.0
+        
+        # Prepare social context for step()
+        context = {
+            "neighbor_count": neighbor_count,
+            "population_density": population_density,
+            "total_population": dish.get_organism_count(),
+            "dish_id": dish.dish_id,
+            "biome_id": dish.biome_id,
+            "position": organism_position
+        }
+        
+        # Execute step() which records Thought before action and Reflection after
+        step_result = await organism.step(context=context)
+        
+        # Extract results from step
+        observe_result = step_result.get("observe", {})
+        decide_result = step_result.get("decide", {})
+        act_result = step_result.get("act", {})
+        reflect_result = step_result.get("reflect", {})
+        
+        # Check if organism wants to stop
+        if step_result.get("status") == "stopped":
             return {
                 "slice_number": slice_number,
                 "organism_id": organism_id,
-                "status": "completed",
-                "duration": slice_duration,
-                "actions": {
-                    "observe": observe_result,
-                    "decide": decide_result,
-                    "act": act_result,
-                    "reflect": reflect_result
-                }
+                "status": "stopped",
+                "reason": "organism_requested_stop",
+                "thought": step_result.get("thought"),
+                "reflection": step_result.get("reflection")
             }
-            
-        except Exception as e:
-            slice_end = datetime.utcnow()
-            slice_duration = (slice_end - slice_start).total_seconds()
-            
-            # Log error
+        
+        # Check gestation (reproduction) - after OODA cycle
+        spawned_child = organism.check_gestation(slice_number, dish)
+        if spawned_child:
+            # Child spawned - log birth event
             self._log_metabolic_action(
-                organism=organism,
-                dish=dish,
-                slice_number=slice_number,
-                duration=slice_duration,
-                error=str(e)
+                organism,
+                dish,
+                slice_number,
+                0.0,  # Duration for birth
+                {"action": "child_born", "child_genome": spawned_child.genome_id, "child_name": spawned_child.scientific_name}
             )
-            
-            return {
-                "slice_number": slice_number,
-                "organism_id": organism_id,
-                "status": "error",
-                "error": str(e),
-                "duration": slice_duration
+        
+        slice_duration = (time.perf_counter_ns() - slice_start_ns) / 1e9
+        
+        # Log metabolic action
+        self._log_metabolic_action(
+            organism=organism,
+            dish=dish,
+            slice_number=slice_number,
+            duration=slice_duration,
+            actions={
+                "observe": observe_result,
+                "decide": decide_result,
+                "act": act_result,
+                "reflect": reflect_result
             }
+        )
+        
+        return {
+            "slice_number": slice_number,
+            "organism_id": organism_id,
+            "status": "completed",
+            "duration": slice_duration,
+            "actions": {
+                "observe": observe_result,
+                "decide": decide_result,
+                "act": act_result,
+                "reflect": reflect_result
+            }
+        }
+    
+    def _slice_error(
+        self,
+        organism: BaseAgent,
+        dish: PetriDish,
+        slice_number: int,
+        slice_start_ns: int,
+        error: BaseException
+    ) -> dict:
+        """
+        Log a failed time slice and build its error result.
+        
+        Args:
+            organism: DigitalOrganism whose slice failed
+            dish: PetriDish containing the organism
+            slice_number: Slice number of the failed slice
+            slice_start_ns: perf_counter_ns() reading at slice start
+            error: Exception raised during the slice
+            
+        Returns:
+            Result dictionary with status "error"
+        """
+        slice_duration = (time.perf_counter_ns() - slice_start_ns) / 1e9
+        
+        # Log error
+        self._log_metabolic_action(
+            organism=organism,
+            dish=dish,
+            slice_number=slice_number,
+            duration=slice_duration,
+            error=str(error)
+        )
+        
+        return {
+            "slice_number": slice_number,
+            "organism_id": organism.state.agent_id,
+            "status": "error",
+            "error": str(error),
+            "duration": slice_duration
+        }
     
     async def process_dish(self, dish: PetriDish) -> List[dict]:
         """
@@ -183,10 +225,13 @@ class TheSlicer:
         """
         results = []
         
-        # Get all organisms (create copy to avoid modification during iteration)
-        organisms = list(dish.organisms.values())
+        # Snapshot organism IDs (organisms may be born or reaped mid-pulse)
+        organism_ids = tuple(dish.organisms)
         
-        for organism in organisms:
+        for organism_id in organism_ids:
+            organism = dish.organisms.get(organism_id)
+            if organism is None:
+                continue  # Reaped earlier in this pulse
             result = await self.grant_time_slice(organism, dish)
             results.append(result)
         
@@ -225,8 +270,6 @@ class TheSlicer:
         Metabolic actions are OODA cycles - the basic unit of organism activity.
         """
         # Create metabolic event (using EvolutionaryEvent structure)
-        from ..agent.state import EvolutionaryEvent
-        
         event = EvolutionaryEvent(
             timestamp=datetime.utcnow(),
             genome_id=organism.genome_id,
@@ -243,7 +286,7 @@ class TheSlicer:
                 "error": error
             },
             agent_id=organism.state.agent_id,
-            lineage_path=organism.lineage_path.copy()
+            lineage_path=organism.lineage_path
         )
         
         self.observer.observe_event(event)
@@ -274,7 +317,7 @@ class TheReaper:
             "boundary": 0
         }
     
-    async def check_fitness_death(self, organism: BaseAgent) -> bool:
+    def check_fitness_death(self, organism: BaseAgent) -> bool:
         """
         Check if organism should die due to low fitness.
         
@@ -315,7 +358,7 @@ class TheReaper:
         """
         return self.biome.check_membrane_breach(organism, action)
     
-    async def reap(
+    def reap(
         self, 
         organism: BaseAgent, 
         dish: PetriDish, 
@@ -337,8 +380,6 @@ class TheReaper:
         organism_id = organism.state.agent_id
         
         # Record death event
-        from ..agent.state import EvolutionaryEvent
-        
         event = EvolutionaryEvent(
             timestamp=datetime.utcnow(),
             genome_id=organism.genome_id,
@@ -352,7 +393,7 @@ class TheReaper:
                 "biome_id": dish.biome_id
             },
             agent_id=organism_id,
-            lineage_path=organism.lineage_path.copy()
+            lineage_path=organism.lineage_path
         )
         
         organism._record_event(
@@ -372,7 +413,7 @@ class TheReaper:
         
         return removed
     
-    async def reap_fitness_deaths(self, dish: PetriDish) -> List[str]:
+    def reap_fitness_deaths(self, dish: PetriDish) -> List[str]:
         """
         Reap all organisms in dish that have low fitness.
         
@@ -383,11 +424,14 @@ class TheReaper:
             List of reaped organism IDs
         """
         reaped = []
-        organisms = list(dish.organisms.values())
-        
-        for organism in organisms:
-            if await self.check_fitness_death(organism):
-                await self.reap(
+        organism_ids = tuple(dish.organisms)
+        
+        for organism_id in organism_ids:
+            organism = dish.organisms.get(organism_id)
+            if organism is None:
+                continue
+            if self.check_fitness_death(organism):
+                self.reap(
                     organism=organism,
                     dish=dish,
                     death_type="fitness",
@@ -397,7 +441,7 @@ class TheReaper:
         
         return reaped
     
-    async def reap_boundary_breach(
+    def reap_boundary_breach(
         self,
         organism: BaseAgent,
         dish: PetriDish,
@@ -417,7 +461,7 @@ class TheReaper:
         is_breach, reason = self.check_boundary_death(organism, action)
         
         if is_breach:
-            await self.reap(
+            self.reap(
                 organism=organism,
                 dish=dish,
                 death_type="boundary",
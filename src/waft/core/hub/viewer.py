@@ -5,6 +5,7 @@ Renders the PetriDish lattice as a 2D ASCII grid with ANSI colors,
 showing organisms, items, and a sidebar with population statistics.
 """
 
+import io
 import os
 from typing import Dict, Tuple, Optional
 from ..hub.dish import PetriDish
@@ -13,6 +14,11 @@ from ..agent.items import Item
 from ..science.taxonomy import LineagePoet
 
 
+# First genome byte -> culture index (0=Sanskrit, 1=Norse, 2=Latin, 3=Cyber)
+_CULTURE_COLOR_TABLE = bytes(first_byte >> 6 for first_byte in range(256))
+_CULTURE_NAMES = tuple(LineagePoet._get_culture_name(index << 6) for index in range(4))
+
+
 class PetriViewer:
     """
     Real-time renderer for PetriDish lattice visualization.
@@ -35,6 +41,9 @@ class PetriViewer:
     CYBER_COLOR = "\033[92m"     # Green
     DEFAULT_COLOR = "\033[37m"   # White
     
+    # Indexed by _CULTURE_COLOR_TABLE
+    CULTURE_COLORS = (SANSKRIT_COLOR, NORSE_COLOR, LATIN_COLOR, CYBER_COLOR)
+    
     # Item symbols
     SCINT_SHARD = "·"
     VOID_STONE = "■"
@@ -48,6 +57,10 @@ class PetriViewer:
             use_colors: Whether to use ANSI colors (default: True)
         """
         self.use_colors = use_colors and os.getenv("TERM") != "dumb"
+        
+        # Previous frame for render_diff: (dish_id, width, height) and sparse cells
+        self._prev_frame_key: Optional[Tuple[str, int, int]] = None
+        self._prev_cells: Dict[Tuple[int, int], str] = {}
     
     def _get_culture_color(self, genome_id: str) -> str:
         """
@@ -65,17 +78,7 @@ class PetriViewer:
         if len(genome_id) < 2:
             return self.DEFAULT_COLOR
         
-        first_byte_hex = genome_id[:2]
-        first_byte = int(first_byte_hex, 16)
-        
-        if 0x00 <= first_byte <= 0x3F:  # Sanskrit
-            return self.SANSKRIT_COLOR
-        elif 0x40 <= first_byte <= 0x7F:  # Norse
-            return self.NORSE_COLOR
-        elif 0x80 <= first_byte <= 0xBF:  # Latin
-            return self.LATIN_COLOR
-        else:  # Cyber/Tech
-            return self.CYBER_COLOR
+        return self.CULTURE_COLORS[_CULTURE_COLOR_TABLE[int(genome_id[:2], 16)]]
     
     def _get_item_symbol(self, item: Item) -> str:
         """
@@ -106,51 +109,137 @@ class PetriViewer:
         Returns:
             Formatted string with ASCII grid and optional sidebar
         """
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
+        reset = self.RESET
         
         # Header
-        lines.append(f"{self.BOLD}PetriDish: {dish.dish_id}{self.RESET}")
-        lines.append(f"Size: {dish.width}×{dish.height}")
-        lines.append("")
-        
-        # Render grid
-        grid_lines = []
+        write(f"{self.BOLD}PetriDish: {dish.dish_id}{reset}\n")
+        write(f"Size: {dish.width}×{dish.height}\n\n")
         
         # Add coordinate labels for first row
-        header = "   " + "".join([str(x % 10) if x < 10 else " " for x in range(dish.width)])
-        grid_lines.append(header)
+        write("   ")
+        for x in range(dish.width):
+            write(str(x % 10) if x < 10 else " ")
+        write("\n")
+        
+        # Render grid
+        lattice = dish.lattice
+        organisms = dish.organisms
+        items = dish.items
         
         for y in range(dish.height):
-            row = [f"{y:2d} "]  # Row label
+            write(f"{y:2d} ")  # Row label
+            current_color = ""
             for x in range(dish.width):
                 pos = (x, y)
                 
                 # Check for organism
-                organism_id = dish.lattice.get(pos)
-                if organism_id and organism_id in dish.organisms:
-                    organism = dish.organisms[organism_id]
-                    symbol = organism.state.anatomical_symbol
+                organism_id = lattice.get(pos)
+                if organism_id and organism_id in organisms:
+                    organism = organisms[organism_id]
                     color = self._get_culture_color(organism.genome_id)
-                    row.append(f"{color}{symbol}{self.RESET}")
+                    # Only emit an escape code when the color run changes
+                    if color != current_color:
+                        write(color or reset)
+                        current_color = color
+                    write(organism.state.anatomical_symbol)
+                    continue
+                
+                if current_color:
+                    write(reset)
+                    current_color = ""
+                
                 # Check for items
-                elif pos in dish.items and len(dish.items[pos]) > 0:
-                    item = dish.items[pos][0]  # Show first item
-                    symbol = self._get_item_symbol(item)
-                    row.append(symbol)
+                if pos in items and len(items[pos]) > 0:
+                    item = items[pos][0]  # Show first item
+                    write(self._get_item_symbol(item))
                 else:
-                    row.append(" ")  # Empty cell
+                    write(" ")  # Empty cell
             
-            grid_lines.append("".join(row))
-        
-        lines.extend(grid_lines)
-        lines.append("")
+            if current_color:
+                write(reset)
+            write("\n")
         
         # Sidebar
         if sidebar:
-            sidebar_lines = self._generate_sidebar(dish)
-            lines.extend(sidebar_lines)
+            write("\n")
+            write("\n".join(self._generate_sidebar(dish)))
+        
+        return buf.getvalue()
+    
+    def render_diff(self, dish: PetriDish, sidebar: bool = True) -> str:
+        """
+        Render only the cells that changed since the previous call.
+        
+        The first frame (or a frame for a different dish/size) clears the
+        screen and returns a full render. Later frames return ANSI
+        cursor-positioned updates for changed cells plus a redrawn sidebar.
+        Without colors (dumb terminals) this falls back to render().
+        
+        Args:
+            dish: PetriDish to render
+            sidebar: Whether to include sidebar (default: True)
+            
+        Returns:
+            String to write to the terminal without a trailing newline
+        """
+        if not self.use_colors:
+            return self.render(dish, sidebar=sidebar)
+        
+        cells = self._render_cells(dish)
+        frame_key = (dish.dish_id, dish.width, dish.height)
+        prev_cells = self._prev_cells
+        first_frame = frame_key != self._prev_frame_key
+        self._prev_frame_key = frame_key
+        self._prev_cells = cells
+        
+        if first_frame:
+            return "\033[2J\033[H" + self.render(dish, sidebar=sidebar)
+        
+        buf = io.StringIO()
+        write = buf.write
+        
+        # Grid row y is on terminal line y + 5 (title, size, blank, x-axis labels);
+        # column x is at x + 4 after the 3-character row label
+        for x, y in prev_cells.keys() - cells.keys():
+            write(f"\033[{y + 5};{x + 4}H ")
+        for (x, y), cell in cells.items():
+            if prev_cells.get((x, y)) != cell:
+                write(f"\033[{y + 5};{x + 4}H{cell}")
+        
+        if sidebar:
+            # Sidebar starts after the last grid row and a blank line; its
+            # length can change, so clear to the end of the screen first
+            write(f"\033[{dish.height + 6};1H\033[J")
+            write("\n".join(self._generate_sidebar(dish)))
         
-        return "\n".join(lines)
+        return buf.getvalue()
+    
+    def _render_cells(self, dish: PetriDish) -> Dict[Tuple[int, int], str]:
+        """
+        Render non-empty cells of the dish as a sparse mapping.
+        
+        Args:
+            dish: PetriDish to render
+            
+        Returns:
+            Dictionary mapping (x, y) to the rendered cell string
+        """
+        cells: Dict[Tuple[int, int], str] = {}
+        
+        for pos, items in dish.items.items():
+            if items:
+                cells[pos] = self._get_item_symbol(items[0])  # Show first item
+        
+        # Organisms are drawn over items
+        for organism_id, organism in dish.organisms.items():
+            pos = dish.get_organism_position(organism_id)
+            if pos is not None:
+                color = self._get_culture_color(organism.genome_id)
+                cells[pos] = f"{color}{organism.state.anatomical_symbol}{self.RESET}"
+        
+        return cells
     
     def _generate_sidebar(self, dish: PetriDish) -> list:
         """
@@ -169,23 +258,23 @@ class PetriViewer:
         pop_count = dish.get_organism_count()
         lines.append(f"Population: {pop_count}")
         
+        # Energy, latest birth and distributions in a single pass
+        total_energy, latest_birth, culture_dist, symbol_dist = self._collect_stats(dish)
+        
         # Energy Average
         if pop_count > 0:
-            total_energy = sum(org.state.energy for org in dish.organisms.values())
             avg_energy = total_energy / pop_count
             lines.append(f"Energy Avg: {avg_energy:.1f}%")
         else:
             lines.append("Energy Avg: N/A")
         
         # Latest Birth Event
-        latest_birth = self._get_latest_birth(dish)
         if latest_birth:
             lines.append(f"Latest Birth: {latest_birth}")
         else:
             lines.append("Latest Birth: None")
         
         # Culture Distribution
-        culture_dist = self._get_culture_distribution(dish)
         if culture_dist:
             lines.append("")
             lines.append("Cultures:")
@@ -193,7 +282,6 @@ class PetriViewer:
                 lines.append(f"  {culture}: {count}")
         
         # Anatomical Distribution
-        symbol_dist = self._get_symbol_distribution(dish)
         if symbol_dist:
             lines.append("")
             lines.append("Archetypes:")
@@ -204,64 +292,41 @@ class PetriViewer:
         
         return lines
     
-    def _get_latest_birth(self, dish: PetriDish) -> Optional[str]:
-        """
-        Get latest birth event from organisms.
-        
-        Args:
-            dish: PetriDish to check
-            
-        Returns:
-            Scientific name of most recently spawned organism or None
-        """
-        if not dish.organisms:
-            return None
-        
-        # Find organism with highest generation (most recent)
-        latest = max(dish.organisms.values(), key=lambda o: o.generation)
-        return latest.scientific_name
-    
-    def _get_culture_distribution(self, dish: PetriDish) -> Dict[str, int]:
+    def _collect_stats(
+        self, dish: PetriDish
+    ) -> Tuple[float, Optional[str], Dict[str, int], Dict[str, int]]:
         """
-        Get culture distribution in dish.
+        Collect sidebar statistics in one walk over the dish's organisms.
         
         Args:
             dish: PetriDish to analyze
             
         Returns:
-            Dictionary mapping culture names to counts
+            (total_energy, latest_birth, culture_distribution, symbol_distribution)
+            where latest_birth is the scientific name of the highest-generation
+            organism (or None if the dish is empty)
         """
-        distribution = {}
+        total_energy = 0.0
+        latest = None
+        culture_dist: Dict[str, int] = {}
+        symbol_dist: Dict[str, int] = {}
         
         for organism in dish.organisms.values():
-            if len(organism.genome_id) < 2:
-                continue
+            total_energy += organism.state.energy
             
-            first_byte_hex = organism.genome_id[:2]
-            first_byte = int(first_byte_hex, 16)
-            culture = LineagePoet._get_culture_name(first_byte)
+            if latest is None or organism.generation > latest.generation:
+                latest = organism
             
-            distribution[culture] = distribution.get(culture, 0) + 1
-        
-        return distribution
-    
-    def _get_symbol_distribution(self, dish: PetriDish) -> Dict[str, int]:
-        """
-        Get anatomical symbol distribution in dish.
-        
-        Args:
-            dish: PetriDish to analyze
+            genome_id = organism.genome_id
+            if len(genome_id) >= 2:
+                culture = _CULTURE_NAMES[_CULTURE_COLOR_TABLE[int(genome_id[:2], 16)]]
+                culture_dist[culture] = culture_dist.get(culture, 0) + 1
             
-        Returns:
-            Dictionary mapping symbols to counts
-        """
-        distribution = {}
-        
-        for organism in dish.organisms.values():
             symbol = organism.state.anatomical_symbol
-            distribution[symbol] = distribution.get(symbol, 0) + 1
+            symbol_dist[symbol] = symbol_dist.get(symbol, 0) + 1
         
-        return distribution
+        latest_birth = latest.scientific_name if latest is not None else None
+        return total_energy, latest_birth, culture_dist, symbol_dist
     
     def clear_screen(self):
         """Clear terminal screen."""
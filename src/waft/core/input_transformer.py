@@ -6,11 +6,383 @@ the strict DecisionMatrix. Acts as a protective layer that handles "dirty"
 data and converts it to clean, validated objects.
 """
 
-from typing import Dict, List, Any, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 from .decision_matrix import (
     DecisionMatrix, Alternative, Criterion, Score
 )
 
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+
+# JSON Schema for "clean" input: names are strings and every weight/score is
+# already a number. Dirty input (numeric strings, int names, ...) fails this
+# schema and takes the general sanitizing path instead.
+_DESCRIPTION_SCHEMA = {"type": ["string", "null"]}
+TYPED_INPUT_SCHEMA = {
+    "type": "object",
+    "required": ["alternatives", "criteria", "scores"],
+    "properties": {
+        "alternatives": {
+            "type": "array",
+            "items": {
+                "anyOf": [
+                    {"type": "string"},
+                    {
+                        "type": "object",
+                        "required": ["name"],
+                        "properties": {
+                            "name": {"type": "string"},
+                            "description": _DESCRIPTION_SCHEMA,
+                        },
+                    },
+                ]
+            },
+        },
+        "criteria": {
+            "type": "object",
+            "additionalProperties": {
+                "anyOf": [
+                    {"type": "number"},
+                    {
+                        "type": "object",
+                        "required": ["weight"],
+                        "properties": {
+                            "weight": {"type": "number"},
+                            "description": _DESCRIPTION_SCHEMA,
+                        },
+                    },
+                ]
+            },
+        },
+        "scores": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "additionalProperties": {"type": "number"},
+            },
+        },
+        "methodology": {"type": "string"},
+    },
+}
+
+# Compiled once at import; None when fastjsonschema is not installed
+_validate_typed_input = (
+    fastjsonschema.compile(TYPED_INPUT_SCHEMA) if FASTJSONSCHEMA_AVAILABLE else None
+)
+
+
+@lru_cache(maxsize=32)
+def _name_set(names: Tuple[str, ...]) -> FrozenSet[str]:
+    """Membership set for a tuple of sanitized names, shared across matrices of the same shape."""
+    return frozenset(names)
+
+
+def _validate_schema(data: Dict[str, Any]) -> None:
+    """Validate that required keys exist in input data."""
+    required_keys = ['alternatives', 'criteria', 'scores']
+    missing_keys = [key for key in required_keys if key not in data]
+
+    if missing_keys:
+        raise ValueError(f"Missing required keys: {', '.join(missing_keys)}")
+
+
+def _extract_alternatives(alternatives_data: Any) -> List[Alternative]:
+    """
+    Extract and sanitize alternatives from input data.
+
+    Supports:
+    - List[str]: ["Option A", "Option B"]
+    - List[Dict]: [{"name": "Option A", "description": "..."}]
+    """
+    if not isinstance(alternatives_data, list):
+        raise ValueError(f"alternatives must be a list, got {type(alternatives_data).__name__}")
+
+    alternatives = []
+    for item in alternatives_data:
+        if isinstance(item, str):
+            # Simple string: sanitize and create Alternative
+            name = _sanitize_name(item)
+            alternatives.append(Alternative(name=name))
+        elif isinstance(item, dict):
+            # Dictionary: extract name and optional description
+            if 'name' not in item:
+                raise ValueError("Alternative dict must have 'name' key")
+            name = _sanitize_name(item['name'])
+            description = item.get('description')
+            if description:
+                description = description.strip()
+            alternatives.append(Alternative(name=name, description=description))
+        else:
+            raise ValueError(f"Alternative must be str or dict, got {type(item).__name__}")
+
+    return alternatives
+
+
+def _extract_criteria(criteria_data: Any) -> List[Criterion]:
+    """
+    Extract and sanitize criteria from input data.
+
+    Supports:
+    - Dict[str, float]: {"Cost": 0.5, "Quality": 0.5}
+    - Dict[str, Dict]: {"Cost": {"weight": 0.5, "description": "..."}}
+    """
+    if not isinstance(criteria_data, dict):
+        raise ValueError(f"criteria must be a dict, got {type(criteria_data).__name__}")
+
+    criteria = []
+    for name, value in criteria_data.items():
+        name = _sanitize_name(name)
+
+        if isinstance(value, (int, float, str)):
+            # Simple weight value (int, float, or numeric string)
+            weight = _cast_to_float(value, f"weight for criterion '{name}'")
+            criteria.append(Criterion(name=name, weight=weight))
+        elif isinstance(value, dict):
+            # Dictionary with weight and optional description
+            if 'weight' not in value:
+                raise ValueError(f"Criterion '{name}' dict must have 'weight' key")
+            weight = _cast_to_float(
+                value['weight'],
+                f"weight for criterion '{name}'"
+            )
+            description = value.get('description')
+            if description:
+                description = description.strip()
+            criteria.append(Criterion(name=name, weight=weight, description=description))
+        else:
+            raise ValueError(
+                f"Criterion '{name}' value must be number, numeric string, or dict, "
+                f"got {type(value).__name__}"
+            )
+
+    return criteria
+
+
+def _extract_scores(
+    scores_data: Any,
+    alternative_names: Iterable[str],
+    criterion_names: Iterable[str]
+) -> List[Score]:
+    """
+    Extract and sanitize scores from input data.
+
+    Expected format: Dict[str, Dict[str, Any]]
+    {
+        "Alternative A": {"Criterion 1": 10, "Criterion 2": 5},
+        "Alternative B": {"Criterion 1": 5, "Criterion 2": 10}
+    }
+    """
+    if not isinstance(scores_data, dict):
+        raise ValueError(f"scores must be a dict, got {type(scores_data).__name__}")
+
+    # Hashed membership checks instead of list scans per score cell
+    # (frozenset() of a frozenset returns it unchanged, no copy)
+    alternative_set = frozenset(alternative_names)
+    criterion_set = frozenset(criterion_names)
+
+    # Criterion keys repeat for every alternative; sanitize each once
+    sanitized_criteria: Dict[Any, str] = {}
+
+    # Local bindings: LOAD_FAST in the per-cell loop instead of LOAD_GLOBAL
+    sanitize = _sanitize_name
+    cast = _cast_to_float
+    make_score = Score
+
+    scores = []
+    for alt_name, crit_scores in scores_data.items():
+        alt_name = sanitize(alt_name)
+
+        # Validate alternative exists
+        if alt_name not in alternative_set:
+            raise ValueError(f"Alternative '{alt_name}' in scores not found in alternatives list")
+
+        if not isinstance(crit_scores, dict):
+            raise ValueError(
+                f"Scores for alternative '{alt_name}' must be a dict, "
+                f"got {type(crit_scores).__name__}"
+            )
+
+        for raw_crit_name, score_value in crit_scores.items():
+            crit_name = sanitized_criteria.get(raw_crit_name)
+            if crit_name is None:
+                crit_name = sanitize(raw_crit_name)
+                sanitized_criteria[raw_crit_name] = crit_name
+
+            # Validate criterion exists
+            if crit_name not in criterion_set:
+                raise ValueError(
+                    f"Criterion '{crit_name}' in scores not found in criteria list"
+                )
+
+            # Cast score to float; the error context is only formatted on failure
+            score_type = type(score_value)
+            if score_type is float:
+                score_float = score_value
+            elif score_type is int:
+                score_float = float(score_value)
+            else:
+                score_float = cast(
+                    score_value,
+                    lambda a=alt_name, c=crit_name: f"score for alternative '{a}' on criterion '{c}'"
+                )
+
+            scores.append(make_score(
+                alternative_name=alt_name,
+                criterion_name=crit_name,
+                value=score_float
+            ))
+
+    return scores
+
+
+def _sanitize_name(name: Any) -> str:
+    """
+    Sanitize a name by converting to string and trimming whitespace.
+
+    Args:
+        name: Name to sanitize (can be str, int, etc.)
+
+    Returns:
+        Sanitized string (trimmed and interned)
+
+    Raises:
+        ValueError: If name cannot be converted to string
+    """
+    # Fast path: JSON-decoded names are already exact str
+    if type(name) is str:
+        name_str = name.strip()
+    else:
+        try:
+            name_str = str(name).strip()
+        except Exception as e:
+            raise ValueError(f"Invalid name value: {name}") from e
+
+    if not name_str:
+        raise ValueError(f"Invalid name value: {name} (empty after sanitization)")
+    # Interned: names repeat across cells and matrices, so equal names share
+    # one object and dict/set lookups hit the identity shortcut
+    return sys.intern(name_str)
+
+
+def _cast_to_float(value: Any, context: Union[str, Callable[[], str]] = "") -> float:
+    """
+    Safely cast a value to float.
+
+    Supports:
+    - int -> float
+    - float -> float
+    - str (numeric) -> float
+
+    Args:
+        value: Value to cast
+        context: Context string for error messages, or a zero-argument
+            callable returning it (only called when the cast fails)
+
+    Returns:
+        Float value
+
+    Raises:
+        ValueError: If value cannot be converted to float
+    """
+    # Fast path: exact types as produced by json.load
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+
+    # General path (str, and subclasses such as bool)
+    if callable(context):
+        context = context()
+    if isinstance(value, float):
+        return value
+    elif isinstance(value, int):
+        return float(value)
+    elif isinstance(value, str):
+        # Try to convert string to float
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(
+                f"Invalid number string for {context}: '{value}' "
+                f"(cannot convert to float)"
+            )
+    else:
+        raise ValueError(
+            f"Invalid type for {context}: {type(value).__name__} "
+            f"(expected int, float, or numeric string)"
+        )
+
+
+def _transform_typed(data: Dict[str, Any]) -> DecisionMatrix:
+    """
+    Build a DecisionMatrix from input already validated against TYPED_INPUT_SCHEMA.
+
+    Types are guaranteed by the schema, so only name sanitization and the
+    cross-reference checks between scores and alternatives/criteria remain.
+    """
+    sanitize = _sanitize_name
+    make_score = Score
+
+    alternatives = []
+    for item in data['alternatives']:
+        if type(item) is str:
+            alternatives.append(Alternative(name=sanitize(item)))
+        else:
+            description = item.get('description')
+            if description:
+                description = description.strip()
+            alternatives.append(Alternative(name=sanitize(item['name']), description=description))
+
+    criteria = []
+    for name, value in data['criteria'].items():
+        name = sanitize(name)
+        if type(value) is dict:
+            description = value.get('description')
+            if description:
+                description = description.strip()
+            criteria.append(Criterion(name=name, weight=float(value['weight']), description=description))
+        else:
+            criteria.append(Criterion(name=name, weight=float(value)))
+
+    alternative_set = _name_set(tuple(alt.name for alt in alternatives))
+    criterion_set = _name_set(tuple(crit.name for crit in criteria))
+    sanitized_criteria: Dict[str, str] = {}
+
+    scores = []
+    for alt_name, crit_scores in data['scores'].items():
+        alt_name = sanitize(alt_name)
+        if alt_name not in alternative_set:
+            raise ValueError(f"Alternative '{alt_name}' in scores not found in alternatives list")
+
+        for raw_crit_name, score_value in crit_scores.items():
+            crit_name = sanitized_criteria.get(raw_crit_name)
+            if crit_name is None:
+                crit_name = sanitize(raw_crit_name)
+                sanitized_criteria[raw_crit_name] = crit_name
+            if crit_name not in criterion_set:
+                raise ValueError(
+                    f"Criterion '{crit_name}' in scores not found in criteria list"
+                )
+            scores.append(make_score(
+                alternative_name=alt_name,
+                criterion_name=crit_name,
+                value=float(score_value)
+            ))
+
+    return DecisionMatrix(
+        alternatives=alternatives,
+        criteria=criteria,
+        scores=scores,
+        methodology=data.get('methodology', 'WSM')
+    )
+
 
 class InputTransformer:
     """
@@ -40,20 +412,29 @@ class InputTransformer:
                        or contains invalid values (with context)
         """
         try:
+            # 0. Fast path: input that already matches the typed schema
+            if _validate_typed_input is not None:
+                try:
+                    _validate_typed_input(data)
+                except fastjsonschema.JsonSchemaException:
+                    pass  # Dirty input: sanitize and cast below
+                else:
+                    return _transform_typed(data)
+            
             # 1. Schema Check: Ensure required keys exist
-            InputTransformer._validate_schema(data)
+            _validate_schema(data)
             
             # 2. Extract and sanitize alternatives
-            alternatives = InputTransformer._extract_alternatives(data['alternatives'])
+            alternatives = _extract_alternatives(data['alternatives'])
             
             # 3. Extract and sanitize criteria
-            criteria = InputTransformer._extract_criteria(data['criteria'])
+            criteria = _extract_criteria(data['criteria'])
             
             # 4. Extract and sanitize scores
-            scores = InputTransformer._extract_scores(
+            scores = _extract_scores(
                 data['scores'],
-                [alt.name for alt in alternatives],
-                [crit.name for crit in criteria]
+                _name_set(tuple(alt.name for alt in alternatives)),
+                _name_set(tuple(crit.name for crit in criteria))
             )
             
             # 5. Get methodology (optional, defaults to "WSM")
@@ -78,198 +459,137 @@ class InputTransformer:
             raise ValueError(f"Invalid data type in input: {str(e)}") from e
     
     @staticmethod
-    def _validate_schema(data: Dict[str, Any]) -> None:
-        """Validate that required keys exist in input data."""
-        required_keys = ['alternatives', 'criteria', 'scores']
-        missing_keys = [key for key in required_keys if key not in data]
-        
-        if missing_keys:
-            raise ValueError(f"Missing required keys: {', '.join(missing_keys)}")
-    
-    @staticmethod
-    def _extract_alternatives(alternatives_data: Any) -> List[Alternative]:
+    def transform_input_many(data_iter: Iterable[Dict[str, Any]]) -> List[DecisionMatrix]:
         """
-        Extract and sanitize alternatives from input data.
+        Transform a batch of raw input dictionaries.
         
-        Supports:
-        - List[str]: ["Option A", "Option B"]
-        - List[Dict]: [{"name": "Option A", "description": "..."}]
-        """
-        if not isinstance(alternatives_data, list):
-            raise ValueError(f"alternatives must be a list, got {type(alternatives_data).__name__}")
+        The compiled schema validator and the name-set cache are shared by
+        every item, so batches whose matrices repeat the same alternatives and
+        criteria reuse their membership sets.
         
-        alternatives = []
-        for item in alternatives_data:
-            if isinstance(item, str):
-                # Simple string: sanitize and create Alternative
-                name = InputTransformer._sanitize_name(item)
-                alternatives.append(Alternative(name=name))
-            elif isinstance(item, dict):
-                # Dictionary: extract name and optional description
-                if 'name' not in item:
-                    raise ValueError("Alternative dict must have 'name' key")
-                name = InputTransformer._sanitize_name(item['name'])
-                description = item.get('description')
-                if description:
-                    description = description.strip()
-                alternatives.append(Alternative(name=name, description=description))
-            else:
-                raise ValueError(f"Alternative must be str or dict, got {type(item).__name__}")
+        Args:
+            data_iter: Iterable of dictionaries in the transform_input format
+        
+        Returns:
+            List of validated DecisionMatrix objects, in input order
         
-        return alternatives
+        Raises:
+            ValueError: For the first invalid item, prefixed with its index
+        """
+        transform = InputTransformer.transform_input
+        matrices = []
+        for index, data in enumerate(data_iter):
+            try:
+                matrices.append(transform(data))
+            except ValueError as e:
+                raise ValueError(f"Item {index}: {str(e)}") from e
+        return matrices
     
     @staticmethod
-    def _extract_criteria(criteria_data: Any) -> List[Criterion]:
+    def transform_saved(data: Dict[str, Any]) -> DecisionMatrix:
         """
-        Extract and sanitize criteria from input data.
+        Transform a saved (DecisionPersistence) dictionary into a DecisionMatrix.
         
-        Supports:
-        - Dict[str, float]: {"Cost": 0.5, "Quality": 0.5}
-        - Dict[str, Dict]: {"Cost": {"weight": 0.5, "description": "..."}}
-        """
-        if not isinstance(criteria_data, dict):
-            raise ValueError(f"criteria must be a dict, got {type(criteria_data).__name__}")
+        Applies the same sanitization, type casting and name checks as
+        transform_input, but reads the saved list-of-dicts layout directly
+        instead of converting it to the input layout first.
         
-        criteria = []
-        for name, value in criteria_data.items():
-            name = InputTransformer._sanitize_name(name)
-            
-            if isinstance(value, (int, float, str)):
-                # Simple weight value (int, float, or numeric string)
-                weight = InputTransformer._cast_to_float(value, f"weight for criterion '{name}'")
-                criteria.append(Criterion(name=name, weight=weight))
-            elif isinstance(value, dict):
-                # Dictionary with weight and optional description
-                if 'weight' not in value:
-                    raise ValueError(f"Criterion '{name}' dict must have 'weight' key")
-                weight = InputTransformer._cast_to_float(
-                    value['weight'],
-                    f"weight for criterion '{name}'"
-                )
-                description = value.get('description')
-                if description:
-                    description = description.strip()
-                criteria.append(Criterion(name=name, weight=weight, description=description))
-            else:
-                raise ValueError(
-                    f"Criterion '{name}' value must be number, numeric string, or dict, "
-                    f"got {type(value).__name__}"
-                )
+        Args:
+            data: Dictionary with keys:
+                - 'alternatives': List[Dict[str, Any]] (or List[str])
+                - 'criteria': List[Dict[str, Any]] with 'name' and 'weight'
+                - 'scores': List[Dict[str, Any]] with 'alternative_name',
+                  'criterion_name' and 'value'
+                - 'methodology': str (optional, defaults to "WSM")
         
-        return criteria
-    
-    @staticmethod
-    def _extract_scores(
-        scores_data: Any,
-        alternative_names: List[str],
-        criterion_names: List[str]
-    ) -> List[Score]:
-        """
-        Extract and sanitize scores from input data.
+        Returns:
+            Validated DecisionMatrix object
         
-        Expected format: Dict[str, Dict[str, Any]]
-        {
-            "Alternative A": {"Criterion 1": 10, "Criterion 2": 5},
-            "Alternative B": {"Criterion 1": 5, "Criterion 2": 10}
-        }
+        Raises:
+            ValueError: If saved data is invalid (with context)
         """
-        if not isinstance(scores_data, dict):
-            raise ValueError(f"scores must be a dict, got {type(scores_data).__name__}")
-        
-        scores = []
-        for alt_name, crit_scores in scores_data.items():
-            alt_name = InputTransformer._sanitize_name(alt_name)
+        try:
+            sanitize = _sanitize_name
+            cast = _cast_to_float
             
-            # Validate alternative exists
-            if alt_name not in alternative_names:
-                raise ValueError(f"Alternative '{alt_name}' in scores not found in alternatives list")
+            # 1. Alternatives
+            alternatives_data = data.get('alternatives', [])
+            if not isinstance(alternatives_data, list):
+                raise ValueError(f"alternatives must be a list, got {type(alternatives_data).__name__}")
             
-            if not isinstance(crit_scores, dict):
-                raise ValueError(
-                    f"Scores for alternative '{alt_name}' must be a dict, "
-                    f"got {type(crit_scores).__name__}"
-                )
+            alternatives = []
+            for alt in alternatives_data:
+                if isinstance(alt, dict):
+                    description = alt.get('description')
+                    description = description.strip() if description else None
+                    alternatives.append(Alternative(name=sanitize(alt['name']), description=description))
+                elif isinstance(alt, str):
+                    alternatives.append(Alternative(name=sanitize(alt)))
+                else:
+                    raise ValueError(f"Alternative must be str or dict, got {type(alt).__name__}")
+            
+            # 2. Criteria (keyed by raw name: later duplicates replace earlier ones)
+            criteria_data = data.get('criteria', [])
+            if not isinstance(criteria_data, list):
+                raise ValueError(f"criteria must be a list, got {type(criteria_data).__name__}")
+            
+            criteria_by_name: Dict[Any, Criterion] = {}
+            for crit in criteria_data:
+                if not isinstance(crit, dict):
+                    raise ValueError(f"Criterion must be a dict, got {type(crit).__name__}")
+                name = sanitize(crit['name'])
+                weight = cast(crit['weight'], f"weight for criterion '{name}'")
+                description = crit.get('description')
+                description = description.strip() if description else None
+                criteria_by_name[crit['name']] = Criterion(name=name, weight=weight, description=description)
+            criteria = list(criteria_by_name.values())
             
-            for crit_name, score_value in crit_scores.items():
-                crit_name = InputTransformer._sanitize_name(crit_name)
+            # 3. Scores (keyed by raw name pair: later duplicates replace earlier ones)
+            scores_data = data.get('scores', [])
+            if not isinstance(scores_data, list):
+                raise ValueError(f"scores must be a list, got {type(scores_data).__name__}")
+            
+            raw_scores: Dict[tuple, Any] = {}
+            for score in scores_data:
+                if isinstance(score, dict):
+                    raw_scores[(score['alternative_name'], score['criterion_name'])] = score['value']
+            
+            alternative_set = _name_set(tuple(alt.name for alt in alternatives))
+            criterion_set = _name_set(tuple(crit.name for crit in criteria))
+            
+            scores = []
+            for (raw_alt_name, raw_crit_name), raw_value in raw_scores.items():
+                alt_name = sanitize(raw_alt_name)
+                if alt_name not in alternative_set:
+                    raise ValueError(f"Alternative '{alt_name}' in scores not found in alternatives list")
                 
-                # Validate criterion exists
-                if crit_name not in criterion_names:
+                crit_name = sanitize(raw_crit_name)
+                if crit_name not in criterion_set:
                     raise ValueError(
                         f"Criterion '{crit_name}' in scores not found in criteria list"
                     )
                 
-                # Cast score to float
-                score_float = InputTransformer._cast_to_float(
-                    score_value,
-                    f"score for alternative '{alt_name}' on criterion '{crit_name}'"
+                value = cast(
+                    raw_value,
+                    lambda a=alt_name, c=crit_name: f"score for alternative '{a}' on criterion '{c}'"
                 )
-                
                 scores.append(Score(
                     alternative_name=alt_name,
                     criterion_name=crit_name,
-                    value=score_float
+                    value=value
                 ))
-        
-        return scores
-    
-    @staticmethod
-    def _sanitize_name(name: Any) -> str:
-        """
-        Sanitize a name by converting to string and trimming whitespace.
-        
-        Args:
-            name: Name to sanitize (can be str, int, etc.)
-        
-        Returns:
-            Sanitized string (trimmed)
-        
-        Raises:
-            ValueError: If name cannot be converted to string
-        """
-        try:
-            name_str = str(name).strip()
-            if not name_str:
-                raise ValueError("Name cannot be empty after sanitization")
-            return name_str
-        except Exception as e:
-            raise ValueError(f"Invalid name value: {name}") from e
-    
-    @staticmethod
-    def _cast_to_float(value: Any, context: str = "") -> float:
-        """
-        Safely cast a value to float.
-        
-        Supports:
-        - int -> float
-        - float -> float
-        - str (numeric) -> float
-        
-        Args:
-            value: Value to cast
-            context: Context string for error messages
-        
-        Returns:
-            Float value
-        
-        Raises:
-            ValueError: If value cannot be converted to float
-        """
-        if isinstance(value, float):
-            return value
-        elif isinstance(value, int):
-            return float(value)
-        elif isinstance(value, str):
-            # Try to convert string to float
-            try:
-                return float(value)
-            except ValueError:
-                raise ValueError(
-                    f"Invalid number string for {context}: '{value}' "
-                    f"(cannot convert to float)"
-                )
-        else:
-            raise ValueError(
-                f"Invalid type for {context}: {type(value).__name__} "
-                f"(expected int, float, or numeric string)"
+            
+            # 4. Create DecisionMatrix (this will trigger Iron Core validation)
+            return DecisionMatrix(
+                alternatives=alternatives,
+                criteria=criteria,
+                scores=scores,
+                methodology=data.get('methodology', 'WSM')
             )
+            
+        except ValueError as e:
+            raise ValueError(f"Error in input data: {str(e)}") from e
+        except KeyError as e:
+            raise ValueError(f"Missing required key in input data: {str(e)}") from e
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid data type in input: {str(e)}") from e
@@ -7,8 +7,27 @@ The "memory" is the persistent structure that organizes project knowledge:
 - standards/ - Project standards and protocols
 """
 
+import itertools
+import os
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+
+# Directory mtimes come from a coarse kernel clock, so a file created a few
+# milliseconds after a scan may leave the mtime unchanged. Listings of folders
+# modified this recently are not cached (the same "racy" rule git uses).
+_RACY_WINDOW_NS = 2_000_000_000
+
+_GITKEEP_CONTENT = b"# This file ensures the folder is tracked by git\n"
+
+
+def _suffix(name: str) -> str:
+    """Final extension of a file name, with the same rules as Path.suffix."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
 
 
 class MemoryManager:
@@ -29,6 +48,8 @@ class MemoryManager:
         """
         self.project_path = project_path
         self.pyrite_path = project_path / "_pyrite"
+        # folder path -> (st_mtime_ns, files) from the last scandir
+        self._listing_cache: Dict[str, Tuple[int, List[Path]]] = {}
 
     def create_structure(self) -> None:
         """Create the full _pyrite directory structure."""
@@ -38,15 +59,18 @@ class MemoryManager:
         # Create _pyrite root (with parents=True to ensure project_path exists)
         self.pyrite_path.mkdir(parents=True, exist_ok=True)
 
-        # Create required subfolders
         for folder in self.REQUIRED_FOLDERS:
-            (self.pyrite_path / folder).mkdir(parents=True, exist_ok=True)
+            # Create required subfolder
+            folder_path = self.pyrite_path / folder
+            folder_path.mkdir(exist_ok=True)
 
-        # Create .gitkeep files to ensure folders are tracked
-        for folder in self.REQUIRED_FOLDERS:
-            gitkeep = self.pyrite_path / folder / ".gitkeep"
-            if not gitkeep.exists():
-                gitkeep.write_text("# This file ensures the folder is tracked by git\n")
+            # Create .gitkeep so the folder is tracked; exclusive-create mode
+            # replaces the separate exists() check and never clobbers a file
+            try:
+                with open(folder_path / ".gitkeep", "xb") as gitkeep:
+                    gitkeep.write(_GITKEEP_CONTENT)
+            except FileExistsError:
+                pass
 
     def verify_structure(self) -> Dict:
         """
@@ -78,68 +102,130 @@ class MemoryManager:
 
         return result
 
-    def get_active_files(self) -> list[Path]:
+    def _list_file_paths(self, folder: str, limit: Optional[int] = None) -> list[str]:
+        """
+        List the regular files in a folder as path strings, excluding .gitkeep.
+
+        Uses os.scandir so the file-type check comes from the directory entry
+        instead of a stat per file, and reuses the previous listing while the
+        folder's mtime is unchanged.
+
+        Args:
+            folder: Folder to list
+            limit: Maximum number of paths to return; an uncached scan stops
+                reading the directory once it has this many (and is then
+                not cached, being partial)
+
+        Returns:
+            List of file path strings (a new list; callers may modify it)
+        """
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        except OSError:
+            self._listing_cache.pop(folder, None)
+            return []
+
+        cached = self._listing_cache.get(folder)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1][:limit]
+
+        with os.scandir(folder) as entries:
+            paths = (
+                entry.path for entry in entries
+                if entry.name != ".gitkeep" and entry.is_file(follow_symlinks=False)
+            )
+            if limit is not None:
+                return list(itertools.islice(paths, limit))
+            paths = list(paths)
+
+        if time.time_ns() - mtime_ns > _RACY_WINDOW_NS:
+            self._listing_cache[folder] = (mtime_ns, paths)
+        else:
+            self._listing_cache.pop(folder, None)
+        return list(paths)
+
+    def _list_files(self, folder: Path, limit: Optional[int] = None) -> list[Path]:
+        """List the regular files in a folder (at most limit), excluding .gitkeep."""
+        return [Path(p) for p in self._list_file_paths(os.fspath(folder), limit)]
+
+    def get_active_files(self, limit: Optional[int] = None) -> list[Path]:
         """
         Get all files in the active directory.
 
+        Args:
+            limit: Maximum number of files to return (default: all)
+
         Returns:
             List of file paths in _pyrite/active/
         """
-        active_path = self.pyrite_path / "active"
-        if not active_path.exists():
-            return []
-        return [f for f in active_path.iterdir() if f.is_file() and f.name != ".gitkeep"]
+        return self._list_files(self.pyrite_path / "active", limit)
 
-    def get_backlog_files(self) -> list[Path]:
+    def get_backlog_files(self, limit: Optional[int] = None) -> list[Path]:
         """
         Get all files in the backlog directory.
 
+        Args:
+            limit: Maximum number of files to return (default: all)
+
         Returns:
             List of file paths in _pyrite/backlog/
         """
-        backlog_path = self.pyrite_path / "backlog"
-        if not backlog_path.exists():
-            return []
-        return [f for f in backlog_path.iterdir() if f.is_file() and f.name != ".gitkeep"]
+        return self._list_files(self.pyrite_path / "backlog", limit)
 
-    def get_standards_files(self) -> list[Path]:
+    def get_standards_files(self, limit: Optional[int] = None) -> list[Path]:
         """
         Get all files in the standards directory.
 
+        Args:
+            limit: Maximum number of files to return (default: all)
+
         Returns:
             List of file paths in _pyrite/standards/
         """
-        standards_path = self.pyrite_path / "standards"
-        if not standards_path.exists():
-            return []
-        return [f for f in standards_path.iterdir() if f.is_file() and f.name != ".gitkeep"]
+        return self._list_files(self.pyrite_path / "standards", limit)
 
-    def get_all_files(self, recursive: bool = False) -> list[Path]:
+    def get_all_file_paths(self, recursive: bool = False) -> list[str]:
         """
-        Get all files in _pyrite directory.
+        Get all files in _pyrite directory as path strings.
+
+        Same listing as get_all_files, without building a Path per file.
 
         Args:
             recursive: If True, include files in subdirectories
 
         Returns:
-            List of file paths in _pyrite/
+            List of file path strings in _pyrite/
         """
-        if not self.pyrite_path.exists():
+        pyrite = os.fspath(self.pyrite_path)
+        if not os.path.exists(pyrite):
             return []
 
         if recursive:
-            # Recursive: use rglob to find all files
-            return [
-                f for f in self.pyrite_path.rglob("*")
-                if f.is_file() and f.name != ".gitkeep"
-            ]
+            # Recursive: os.walk is scandir-based, so directories and files are
+            # told apart from the directory entries without a stat per file
+            join = os.path.join
+            paths = []
+            for root, _dirs, names in os.walk(pyrite):
+                paths.extend(join(root, name) for name in names if name != ".gitkeep")
+            return paths
         else:
             # Non-recursive: combine all category files
-            return (
-                self.get_active_files() +
-                self.get_backlog_files() +
-                self.get_standards_files()
-            )
+            paths = []
+            for folder in ("active", "backlog", "standards"):
+                paths.extend(self._list_file_paths(os.path.join(pyrite, folder)))
+            return paths
+
+    def get_all_files(self, recursive: bool = False) -> list[Path]:
+        """
+        Get all files in _pyrite directory.
+
+        Args:
+            recursive: If True, include files in subdirectories
+
+        Returns:
+            List of file paths in _pyrite/
+        """
+        return [Path(p) for p in self.get_all_file_paths(recursive=recursive)]
 
     def get_files_by_extension(self, extension: str, recursive: bool = False) -> list[Path]:
         """
@@ -152,8 +238,10 @@ class MemoryManager:
         Returns:
             List of matching file paths
         """
-        all_files = self.get_all_files(recursive=recursive)
         # Ensure extension starts with dot
         ext = extension if extension.startswith(".") else f".{extension}"
-        return [f for f in all_files if f.suffix == ext]
-
+        # Filter on the strings; only matches become Path objects
+        return [
+            Path(p) for p in self.get_all_file_paths(recursive=recursive)
+            if _suffix(os.path.basename(p)) == ext
+        ]
@@ -6,12 +6,39 @@ Uses InputTransformer for validation when loading to ensure security.
 """
 
 import json
+import math
+import mmap
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Set, TextIO
 from datetime import datetime
 
 from .decision_matrix import DecisionMatrix
 from .input_transformer import InputTransformer
+from ..utils import write_file_atomic
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Files at least this large are memory-mapped for parsing instead of read()
+_MMAP_THRESHOLD = 64 * 1024
+
+# Parent directories already created (or found) by save, so repeat saves
+# into the same folder skip the mkdir call
+_known_dirs: Set[str] = set()
+
+
+def _loads(buf: Any) -> Any:
+    """Parse JSON bytes with orjson, falling back to json for NaN/Infinity."""
+    try:
+        return orjson.loads(buf)
+    except orjson.JSONDecodeError:
+        # json.dump writes NaN/Infinity, which orjson rejects
+        return json.loads(bytes(buf))
 
 
 class DecisionPersistence:
@@ -34,13 +61,53 @@ class DecisionPersistence:
         Raises:
             IOError: If file cannot be written
         """
-        # Convert matrix to dictionary
-        data = DecisionPersistence._to_dict(matrix)
+        # Write to a temporary sibling, then rename over the target: readers
+        # never see a half-written file and a failed write leaves the old one
+        parent = os.fspath(filepath.parent)
+        if parent not in _known_dirs:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            _known_dirs.add(parent)
+        
+        def write(tmp_path: Path) -> None:
+            try:
+                DecisionPersistence._write_json(matrix, tmp_path)
+            except FileNotFoundError:
+                # Parent removed since it was cached; recreate it and retry once
+                _known_dirs.discard(parent)
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                _known_dirs.add(parent)
+                DecisionPersistence._write_json(matrix, tmp_path)
+        
+        write_file_atomic(filepath, write)
+    
+    @staticmethod
+    def _write_json(matrix: DecisionMatrix, filepath: Path) -> None:
+        """
+        Write a DecisionMatrix as indented JSON to filepath.
         
-        # Write to JSON file with formatting
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Both backends produce the _to_dict layout, but the text is not
+        byte-identical: orjson writes exponent floats as 1e-7 and 1e20 where
+        json writes 1e-07 and 1e+20. Either form loads back to the same values.
+        orjson would write NaN and infinity as null, so matrices holding them
+        go through the stdlib writer, which keeps them as NaN/Infinity.
+        """
+        if ORJSON_AVAILABLE and DecisionPersistence._is_finite(matrix):
+            # orjson serializes the dataclasses natively, in field order, giving
+            # the _to_dict layout (not its exact text) without building the dict tree
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(matrix, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                DecisionPersistence._stream_save(matrix, f)
+    
+    @staticmethod
+    def _is_finite(matrix: DecisionMatrix) -> bool:
+        """Whether every criterion weight and score value is a finite number."""
+        isfinite = math.isfinite
+        return (
+            all(isfinite(crit.weight) for crit in matrix.criteria)
+            and all(isfinite(score.value) for score in matrix.scores)
+        )
     
     @staticmethod
     def load(filepath: Path) -> DecisionMatrix:
@@ -64,18 +131,62 @@ class DecisionPersistence:
             json.JSONDecodeError: If file is not valid JSON
         """
         # Read JSON file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Convert from saved format to InputTransformer format
-        transformer_data = DecisionPersistence._from_dict_format(data)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                    # Parse straight from the page cache, without copying into a bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            data = _loads(view)
+                else:
+                    data = _loads(f.read())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # CRITICAL: Use InputTransformer to validate and reconstruct
-        # This reuses the "Airlock" validation logic
-        matrix = InputTransformer.transform_input(transformer_data)
+        # This reuses the "Airlock" validation logic, reading the saved
+        # layout directly instead of converting it to the input layout first
+        matrix = InputTransformer.transform_saved(data)
         
         return matrix
     
+    @staticmethod
+    def _stream_save(matrix: DecisionMatrix, f: TextIO) -> None:
+        """
+        Write a DecisionMatrix as JSON one element at a time.
+        
+        Produces the same text as json.dump(_to_dict(matrix), f, indent=2,
+        ensure_ascii=False) without building the nested dict first: each
+        alternative, criterion and score is encoded from its dataclass fields
+        (declared in the same order as the _to_dict keys) and written out.
+        
+        Args:
+            matrix: The DecisionMatrix to write
+            f: Text file opened for writing
+        """
+        dumps = json.dumps
+        item_sep = '\n    '
+        
+        f.write('{')
+        for key, items in (
+            ('alternatives', matrix.alternatives),
+            ('criteria', matrix.criteria),
+            ('scores', matrix.scores),
+        ):
+            if not items:
+                f.write(f'\n  "{key}": [],')
+                continue
+            f.write(f'\n  "{key}": [')
+            first = True
+            for item in items:
+                encoded = dumps(vars(item), indent=2, ensure_ascii=False)
+                f.write(item_sep if first else ',' + item_sep)
+                f.write(encoded.replace('\n', item_sep))
+                first = False
+            f.write('\n  ],')
+        f.write(f'\n  "methodology": {dumps(matrix.methodology, ensure_ascii=False)}\n}}')
+    
     @staticmethod
     def _to_dict(matrix: DecisionMatrix) -> Dict[str, Any]:
         """
@@ -114,58 +225,3 @@ class DecisionPersistence:
             ],
             'methodology': matrix.methodology
         }
-    
-    @staticmethod
-    def _from_dict_format(data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Convert saved format to InputTransformer format.
-        
-        The saved format uses lists for alternatives/criteria/scores,
-        but InputTransformer expects a different structure.
-        This method converts between formats.
-        """
-        # Convert alternatives list to InputTransformer format
-        # Preserve descriptions if present
-        alternatives = []
-        for alt in data.get('alternatives', []):
-            if isinstance(alt, dict):
-                alt_dict = {'name': alt['name']}
-                if alt.get('description'):
-                    alt_dict['description'] = alt['description']
-                alternatives.append(alt_dict)
-            else:
-                alternatives.append(alt)
-        
-        # Convert criteria list to dict format
-        # Preserve descriptions if present
-        criteria = {}
-        for crit in data.get('criteria', []):
-            if isinstance(crit, dict):
-                # If description exists, use dict format; otherwise just weight
-                if crit.get('description'):
-                    criteria[crit['name']] = {
-                        'weight': crit['weight'],
-                        'description': crit['description']
-                    }
-                else:
-                    criteria[crit['name']] = crit['weight']
-            else:
-                # Fallback for old format
-                criteria[crit] = data.get('criteria', {}).get(crit, 0.0)
-        
-        # Convert scores list to nested dict format
-        scores = {}
-        for score in data.get('scores', []):
-            if isinstance(score, dict):
-                alt_name = score['alternative_name']
-                crit_name = score['criterion_name']
-                if alt_name not in scores:
-                    scores[alt_name] = {}
-                scores[alt_name][crit_name] = score['value']
-        
-        return {
-            'alternatives': alternatives,
-            'criteria': criteria,
-            'scores': scores,
-            'methodology': data.get('methodology', 'WSM')
-        }
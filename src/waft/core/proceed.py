@@ -5,33 +5,46 @@ Pauses to check larger context, reflect on assumptions, ask clarifying questions
 perform a "flight check", then proceeds with verified understanding.
 """
 
-import re
-from datetime import datetime
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.markdown import Markdown
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 
-from .session_stats import SessionStats
-from .github import GitHubManager
-from .memory import MemoryManager
+from .project_context import gather_project_context
+from ..utils import get_console
+
+if TYPE_CHECKING:
+    from .session_stats import SessionStats
+
+
+@dataclass(slots=True)
+class FlightCheck:
+    """Result of the pre-proceed flight check."""
+    assumptions_identified: bool
+    ambiguities_noted: bool
+    context_understood: bool = True
+    prerequisites_met: bool = True
+    blockers: List[str] = field(default_factory=list)
+    status: str = "READY"
 
 
 class ProceedManager:
     """Manages proceed workflow with verification."""
     
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, stats_tracker: Optional["SessionStats"] = None):
         """
         Initialize proceed manager.
         
         Args:
             project_path: Path to project root
+            stats_tracker: Optional shared SessionStats instance to reuse
         """
+        from .session_stats import SessionStats
+        from .github import GitHubManager
+        from .memory import MemoryManager
+        
         self.project_path = project_path
-        self.console = Console()
-        self.stats_tracker = SessionStats(project_path)
+        self.console = get_console()
+        self.stats_tracker = stats_tracker or SessionStats(project_path)
         self.github = GitHubManager(project_path)
         self.memory = MemoryManager(project_path)
     
@@ -83,73 +96,24 @@ class ProceedManager:
             "context": context,
             "assumptions": assumptions,
             "ambiguities": ambiguities,
-            "flight_check": flight_check,
-            "ready": flight_check.get("status") == "READY",
+            "flight_check": asdict(flight_check),
+            "ready": flight_check.status == "READY",
         }
     
     def _gather_context(self) -> Dict[str, Any]:
         """Gather current context."""
-        import subprocess
-        
-        context = {
-            "timestamp": datetime.now().isoformat(),
+        project = gather_project_context(self.github, self.stats_tracker, self.memory)
+        files = (project.stats or {}).get("files", {})
+        return {
+            "timestamp": project.now.isoformat(),
             "project_path": str(self.project_path),
+            "git": dict(project.git),
+            "recent_files": {
+                "created": files.get("created", []),
+                "modified": files.get("modified", []),
+            },
+            "active_files": list(project.active_files),
         }
-        
-        # Git status
-        git_info = {
-            "initialized": self.github.is_initialized(),
-            "branch": "unknown",
-            "uncommitted_count": 0,
-            "uncommitted_files": [],
-        }
-        
-        if git_info["initialized"]:
-            try:
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    git_info["branch"] = result.stdout.strip()
-                
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    uncommitted = [line[3:].strip() for line in result.stdout.strip().split("\n") if line.strip()]
-                    git_info["uncommitted_files"] = uncommitted[:20]
-                    git_info["uncommitted_count"] = len(uncommitted)
-            except Exception:
-                pass
-        
-        context["git"] = git_info
-        
-        # Recent files
-        try:
-            stats = self.stats_tracker.calculate_session_stats()
-            context["recent_files"] = {
-                "created": stats.get("files", {}).get("created", []),
-                "modified": stats.get("files", {}).get("modified", []),
-            }
-        except Exception:
-            context["recent_files"] = {"created": [], "modified": []}
-        
-        # Active files
-        try:
-            active_files = self.memory.get_active_files()
-            context["active_files"] = [str(f.name) for f in active_files[:10]]
-        except Exception:
-            context["active_files"] = []
-        
-        return context
     
     def _identify_assumptions(self, context: Dict[str, Any]) -> Dict[str, List[str]]:
         """Identify assumptions being made."""
@@ -192,26 +156,24 @@ class ProceedManager:
         
         return ambiguities
     
-    def _flight_check(self, context: Dict[str, Any], assumptions: Dict[str, List], ambiguities: Dict[str, List]) -> Dict[str, Any]:
+    def _flight_check(self, context: Dict[str, Any], assumptions: Dict[str, List], ambiguities: Dict[str, List]) -> FlightCheck:
         """Perform flight check."""
-        check = {
-            "context_understood": True,
-            "assumptions_identified": len(assumptions.get("critical", [])) + len(assumptions.get("minor", [])) > 0,
-            "ambiguities_noted": len(ambiguities.get("critical", [])) + len(ambiguities.get("minor", [])) > 0,
-            "prerequisites_met": True,
-            "blockers": [],
-            "status": "READY",
-        }
+        assumptions_critical = assumptions.get("critical")
+        ambiguities_critical = ambiguities.get("critical")
+        check = FlightCheck(
+            assumptions_identified=bool(assumptions_critical or assumptions.get("minor")),
+            ambiguities_noted=bool(ambiguities_critical or ambiguities.get("minor")),
+        )
         
         # Check for blockers
-        if ambiguities.get("critical"):
-            check["blockers"].append("Critical ambiguities need resolution")
-            check["status"] = "NEEDS_CLARIFICATION"
+        if ambiguities_critical:
+            check.blockers.append("Critical ambiguities need resolution")
+            check.status = "NEEDS_CLARIFICATION"
         
-        if assumptions.get("critical"):
-            check["blockers"].append("Critical assumptions need verification")
-            if check["status"] == "READY":
-                check["status"] = "NEEDS_VERIFICATION"
+        if assumptions_critical:
+            check.blockers.append("Critical assumptions need verification")
+            if check.status == "READY":
+                check.status = "NEEDS_VERIFICATION"
         
         return check
     
@@ -237,108 +199,95 @@ class ProceedManager:
     
     def _display_context(self, context: Dict[str, Any]):
         """Display context summary."""
-        self.console.print("[bold]📋 Context Check[/bold]\n")
-        
-        self.console.print(f"  • Branch: {context['git'].get('branch', 'unknown')}")
-        self.console.print(f"  • Uncommitted Files: {context['git'].get('uncommitted_count', 0)}")
+        lines = [
+            "[bold]📋 Context Check[/bold]\n",
+            f"  • Branch: {context['git'].get('branch', 'unknown')}",
+            f"  • Uncommitted Files: {context['git'].get('uncommitted_count', 0)}",
+        ]
         
         active_files = context.get("active_files", [])
         if active_files:
-            self.console.print(f"  • Active Files: {len(active_files)}")
-            for file in active_files[:5]:
-                self.console.print(f"    - {file}")
+            lines.append(f"  • Active Files: {len(active_files)}")
+            lines.extend(f"    - {file}" for file in active_files[:5])
         
-        self.console.print()
+        lines.append("")
+        self.console.print("\n".join(lines))
     
     def _display_assumptions(self, assumptions: Dict[str, List]):
         """Display assumptions."""
-        total = len(assumptions.get("critical", [])) + len(assumptions.get("minor", []))
-        if total == 0:
-            return
-        
-        self.console.print("[bold]⚠️ Assumptions Found[/bold]\n")
-        
-        if assumptions.get("critical"):
-            self.console.print("  [bold red]Critical:[/bold red]")
-            for assumption in assumptions["critical"]:
-                self.console.print(f"    • {assumption}")
-        
-        if assumptions.get("minor"):
-            self.console.print("  [dim]Minor:[/dim]")
-            for assumption in assumptions["minor"]:
-                self.console.print(f"    • {assumption}")
-        
-        self.console.print()
+        self._display_findings("[bold]⚠️ Assumptions Found[/bold]\n", assumptions)
     
     def _display_ambiguities(self, ambiguities: Dict[str, List]):
         """Display ambiguities."""
-        total = len(ambiguities.get("critical", [])) + len(ambiguities.get("minor", []))
-        if total == 0:
+        self._display_findings("[bold]❓ Ambiguities Found[/bold]\n", ambiguities)
+    
+    def _display_findings(self, title: str, findings: Dict[str, List]):
+        """Display critical/minor findings under a title (nothing if empty)."""
+        critical = findings.get("critical")
+        minor = findings.get("minor")
+        if not critical and not minor:
             return
         
-        self.console.print("[bold]❓ Ambiguities Found[/bold]\n")
-        
-        if ambiguities.get("critical"):
-            self.console.print("  [bold red]Critical:[/bold red]")
-            for ambiguity in ambiguities["critical"]:
-                self.console.print(f"    • {ambiguity}")
+        lines = [title]
+        if critical:
+            lines.append("  [bold red]Critical:[/bold red]")
+            lines.extend(f"    • {item}" for item in critical)
+        if minor:
+            lines.append("  [dim]Minor:[/dim]")
+            lines.extend(f"    • {item}" for item in minor)
         
-        if ambiguities.get("minor"):
-            self.console.print("  [dim]Minor:[/dim]")
-            for ambiguity in ambiguities["minor"]:
-                self.console.print(f"    • {ambiguity}")
-        
-        self.console.print()
+        lines.append("")
+        self.console.print("\n".join(lines))
     
-    def _display_flight_check(self, flight_check: Dict[str, Any]):
+    def _display_flight_check(self, flight_check: FlightCheck):
         """Display flight check."""
-        self.console.print("[bold]✈️ Flight Check[/bold]\n")
-        
-        status_icon = "✅" if flight_check["status"] == "READY" else "⚠️"
-        self.console.print(f"  {status_icon} Context: {'Understood' if flight_check['context_understood'] else 'Needs Review'}")
-        self.console.print(f"  {status_icon} Assumptions: {'Identified' if flight_check['assumptions_identified'] else 'None Found'}")
-        self.console.print(f"  {status_icon} Ambiguities: {'Noted' if flight_check['ambiguities_noted'] else 'None Found'}")
-        self.console.print(f"  {status_icon} Prerequisites: {'Met' if flight_check['prerequisites_met'] else 'Not Met'}")
-        self.console.print(f"  {status_icon} Blockers: {len(flight_check['blockers'])}")
-        
-        if flight_check["blockers"]:
-            for blocker in flight_check["blockers"]:
-                self.console.print(f"    - {blocker}")
-        
-        self.console.print(f"\n  [bold]Status:[/bold] {flight_check['status']}\n")
+        status_icon = "✅" if flight_check.status == "READY" else "⚠️"
+        lines = [
+            "[bold]✈️ Flight Check[/bold]\n",
+            f"  {status_icon} Context: {'Understood' if flight_check.context_understood else 'Needs Review'}",
+            f"  {status_icon} Assumptions: {'Identified' if flight_check.assumptions_identified else 'None Found'}",
+            f"  {status_icon} Ambiguities: {'Noted' if flight_check.ambiguities_noted else 'None Found'}",
+            f"  {status_icon} Prerequisites: {'Met' if flight_check.prerequisites_met else 'Not Met'}",
+            f"  {status_icon} Blockers: {len(flight_check.blockers)}",
+        ]
+        lines.extend(f"    - {blocker}" for blocker in flight_check.blockers)
+        lines.append(f"\n  [bold]Status:[/bold] {flight_check.status}\n")
+        self.console.print("\n".join(lines))
     
     def _display_questions(self, questions: List[Dict[str, str]], strict: bool = False):
         """Display clarifying questions."""
         if not questions:
             return
         
-        self.console.print("[bold]❓ Clarifying Questions[/bold]\n")
-        
+        lines = ["[bold]❓ Clarifying Questions[/bold]\n"]
         for i, q in enumerate(questions, 1):
-            self.console.print(f"  {i}. {q['question']}")
-            self.console.print(f"     [dim]{q['reason']}[/dim]")
+            lines.append(f"  {i}. {q['question']}")
+            lines.append(f"     [dim]{q['reason']}[/dim]")
         
         if strict:
-            self.console.print("\n  [bold yellow]⚠️ Strict mode: Waiting for answers before proceeding[/bold yellow]\n")
+            lines.append("\n  [bold yellow]⚠️ Strict mode: Waiting for answers before proceeding[/bold yellow]\n")
         else:
-            self.console.print("\n  [dim]Proceeding with best understanding, will ask if critical[/dim]\n")
+            lines.append("\n  [dim]Proceeding with best understanding, will ask if critical[/dim]\n")
+        self.console.print("\n".join(lines))
     
     def _display_proceeding_summary(
         self,
         context: Dict[str, Any],
         assumptions: Dict[str, List],
         ambiguities: Dict[str, List],
-        flight_check: Dict[str, Any],
+        flight_check: FlightCheck,
     ):
         """Display proceeding summary."""
-        self.console.print("[bold green]✅ Verified Proceeding[/bold green]\n")
-        
-        self.console.print("  • Context verified")
-        self.console.print(f"  • Assumptions: {len(assumptions.get('critical', []))} critical, {len(assumptions.get('minor', []))} minor")
-        self.console.print(f"  • Ambiguities: {len(ambiguities.get('critical', []))} critical, {len(ambiguities.get('minor', []))} minor")
-        self.console.print(f"  • Status: {flight_check['status']}")
-        
-        if flight_check["status"] == "READY":
-            self.console.print("\n  [bold green]Proceeding with verified understanding...[/bold green]\n")
+        lines = [
+            "[bold green]✅ Verified Proceeding[/bold green]\n",
+            "  • Context verified",
+            f"  • Assumptions: {len(assumptions.get('critical', []))} critical, {len(assumptions.get('minor', []))} minor",
+            f"  • Ambiguities: {len(ambiguities.get('critical', []))} critical, {len(ambiguities.get('minor', []))} minor",
+            f"  • Status: {flight_check.status}",
+        ]
+        
+        if flight_check.status == "READY":
+            lines.append("\n  [bold green]Proceeding with verified understanding...[/bold green]\n")
         else:
-            self.console.print("\n  [bold yellow]Proceeding with awareness of items needing attention...[/bold yellow]\n")
+            lines.append("\n  [bold yellow]Proceeding with awareness of items needing attention...[/bold yellow]\n")
+        self.console.print("\n".join(lines))
@@ -0,0 +1,77 @@
+"""
+Project Context - One gathering pass shared by proceed and recap.
+
+Proceed and recap both need the git state, session statistics and active
+_pyrite files. They gather them here and adapt the result to their own
+shapes, so caching or batching changes only have to be made once.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Mapping, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .github import GitHubManager
+    from .memory import MemoryManager
+    from .session_stats import SessionStats
+
+
+@dataclass(slots=True, frozen=True)
+class ProjectContext:
+    """Snapshot of project state taken at `now`."""
+    now: datetime
+    git: Mapping[str, Any]
+    stats: Optional[Mapping[str, Any]]
+    active_files: Tuple[str, ...]
+
+
+def gather_project_context(
+    github: "GitHubManager",
+    stats_tracker: "SessionStats",
+    memory: "MemoryManager",
+    *,
+    max_files: int = 20,
+    active_limit: int = 10,
+) -> ProjectContext:
+    """
+    Gather git context, session stats and active files concurrently.
+
+    The three sources are independent and mostly wait on git subprocesses or
+    the filesystem, so their waits overlap in a small thread pool. Git
+    context and session stats are already memoized by their owners for a
+    short TTL.
+
+    Args:
+        github: GitHubManager for the project
+        stats_tracker: SessionStats for the project
+        memory: MemoryManager for the project
+        max_files: Maximum number of uncommitted file paths to return
+        active_limit: Maximum number of active files to return
+
+    Returns:
+        ProjectContext; stats is None and active_files is empty when
+        gathering them failed
+    """
+    now = datetime.now()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        git_future = executor.submit(github.get_git_context, max_files=max_files)
+        stats_future = executor.submit(stats_tracker.calculate_session_stats)
+        active_future = executor.submit(memory.get_active_files, limit=active_limit)
+
+    try:
+        stats = stats_future.result()
+    except Exception:
+        stats = None
+
+    try:
+        active_files = tuple(f.name for f in active_future.result())
+    except Exception:
+        active_files = ()
+
+    return ProjectContext(
+        now=now,
+        git=git_future.result(),
+        stats=stats,
+        active_files=active_files,
+    )
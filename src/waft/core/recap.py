@@ -5,36 +5,79 @@ Creates comprehensive recap of current conversation/session, extracting key poin
 decisions, accomplishments, and questions.
 """
 
-import re
-from datetime import datetime
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 
-from .session_stats import SessionStats
-from .github import GitHubManager
-from .memory import MemoryManager
+from .project_context import gather_project_context
+from ..utils import get_console, write_file_bytes
+
+if TYPE_CHECKING:
+    from .session_stats import SessionStats
+
+
+# Formats for the recap date/time, taken from the one gather timestamp
+_DATE_FORMAT = "%Y-%m-%d"
+_TIME_FORMAT = "%H:%M"
+
+# Recap document layout; optional sections are substituted in as whole blocks
+_RECAP_TEMPLATE = """\
+# Session Recap
+
+**Date**: {date}
+**Time**: {time}
+**Timestamp**: {timestamp}
+
+---
+
+## Session Information
+
+- **Date**: {date} {time}
+- **Branch**: {branch}
+- **Uncommitted Files**: {uncommitted_count}
+
+{accomplishments}{key_files}## Notes
+
+_Add session notes here_
+
+## Next Steps
+
+1. Review recap and identify next actions
+2. Continue with planned work
+3. Update goals if needed
+
+"""
+
+
+@lru_cache(maxsize=32)
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) once per process for a given path."""
+    os.makedirs(path, exist_ok=True)
 
 
 class RecapManager:
     """Manages conversation recap and session summary creation."""
     
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, stats_tracker: Optional["SessionStats"] = None):
         """
         Initialize recap manager.
         
         Args:
             project_path: Path to project root
+            stats_tracker: Optional shared SessionStats instance to reuse
         """
+        from .session_stats import SessionStats
+        from .github import GitHubManager
+        from .memory import MemoryManager
+        
         self.project_path = project_path
-        self.console = Console()
-        self.stats_tracker = SessionStats(project_path)
+        self.console = get_console()
+        self.stats_tracker = stats_tracker or SessionStats(project_path)
         self.github = GitHubManager(project_path)
         self.memory = MemoryManager(project_path)
         self.recap_dir = project_path / "_work_efforts"
-        self.recap_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(str(self.recap_dir))
     
     def run_recap(
         self,
@@ -61,10 +104,15 @@ class RecapManager:
         if output_path:
             recap_file = Path(output_path)
         else:
-            timestamp = datetime.now().strftime("%Y-%m-%d")
-            recap_file = self.recap_dir / f"SESSION_RECAP_{timestamp}.md"
+            recap_file = self.recap_dir / f"SESSION_RECAP_{session_data['date']}.md"
         
-        recap_file.write_text(recap_content, encoding="utf-8")
+        try:
+            write_file_bytes(recap_file, recap_content.encode("utf-8"))
+        except FileNotFoundError:
+            # Directory removed since _ensure_dir cached it; recreate it and retry once
+            _ensure_dir.cache_clear()
+            _ensure_dir(str(recap_file.parent))
+            write_file_bytes(recap_file, recap_content.encode("utf-8"))
         
         # Display summary
         self._display_summary(session_data, recap_file)
@@ -77,131 +125,78 @@ class RecapManager:
     
     def _gather_session_data(self) -> Dict[str, Any]:
         """Gather session data for recap."""
-        import subprocess
-        
+        project = gather_project_context(self.github, self.stats_tracker, self.memory)
         data = {
-            "timestamp": datetime.now().isoformat(),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "time": datetime.now().strftime("%H:%M"),
+            "timestamp": project.now.isoformat(),
+            "date": project.now.strftime(_DATE_FORMAT),
+            "time": project.now.strftime(_TIME_FORMAT),
+            "git": dict(project.git),
+            "stats": {},
+            "active_files": list(project.active_files),
         }
         
-        # Git status
-        git_info = {
-            "initialized": self.github.is_initialized(),
-            "branch": "unknown",
-            "uncommitted_count": 0,
-            "uncommitted_files": [],
-        }
-        
-        if git_info["initialized"]:
-            try:
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    git_info["branch"] = result.stdout.strip()
-                
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    uncommitted = [line[3:].strip() for line in result.stdout.strip().split("\n") if line.strip()]
-                    git_info["uncommitted_files"] = uncommitted[:20]
-                    git_info["uncommitted_count"] = len(uncommitted)
-            except Exception:
-                pass
-        
-        data["git"] = git_info
-        
         # Session stats
-        try:
-            stats = self.stats_tracker.calculate_session_stats()
+        stats = project.stats
+        if stats is not None:
+            code = stats.get("code", {})
             data["stats"] = {
                 "files_created": stats.get("files", {}).get("created", 0),
                 "files_modified": stats.get("files", {}).get("modified", 0),
-                "lines_written": stats.get("code", {}).get("lines_written", 0),
-                "lines_deleted": stats.get("code", {}).get("lines_deleted", 0),
-                "net_lines": stats.get("code", {}).get("lines_written", 0) - stats.get("code", {}).get("lines_deleted", 0),
+                "lines_written": code.get("lines_written", 0),
+                "lines_deleted": code.get("lines_deleted", 0),
+                "net_lines": code.get("lines_written", 0) - code.get("lines_deleted", 0),
             }
-        except Exception:
-            data["stats"] = {}
-        
-        # Active files
-        try:
-            active_files = self.memory.get_active_files()
-            data["active_files"] = [str(f.name) for f in active_files[:10]]
-        except Exception:
-            data["active_files"] = []
         
         return data
     
     def _generate_recap(self, session_data: Dict[str, Any]) -> str:
         """Generate recap markdown content."""
-        content = []
-        content.append(f"# Session Recap\n\n")
-        content.append(f"**Date**: {session_data['date']}\n")
-        content.append(f"**Time**: {session_data['time']}\n")
-        content.append(f"**Timestamp**: {session_data['timestamp']}\n\n")
-        content.append("---\n\n")
-        
-        # Session Information
-        content.append("## Session Information\n\n")
-        content.append(f"- **Date**: {session_data['date']} {session_data['time']}\n")
-        content.append(f"- **Branch**: {session_data['git'].get('branch', 'unknown')}\n")
-        content.append(f"- **Uncommitted Files**: {session_data['git'].get('uncommitted_count', 0)}\n\n")
-        
-        # Accomplishments
+        git = session_data["git"]
+        
+        # Accomplishments (only lines with something to report)
+        accomplishments = ""
         stats = session_data.get("stats", {})
         if stats:
-            content.append("## Accomplishments\n\n")
+            lines = []
             if stats.get("files_created", 0) > 0:
-                content.append(f"- **Files Created**: {stats['files_created']}\n")
+                lines.append(f"- **Files Created**: {stats['files_created']}\n")
             if stats.get("files_modified", 0) > 0:
-                content.append(f"- **Files Modified**: {stats['files_modified']}\n")
+                lines.append(f"- **Files Modified**: {stats['files_modified']}\n")
             if stats.get("lines_written", 0) > 0:
-                content.append(f"- **Lines Written**: {stats['lines_written']:,}\n")
+                lines.append(f"- **Lines Written**: {stats['lines_written']:,}\n")
             if stats.get("net_lines", 0) != 0:
-                content.append(f"- **Net Lines**: {stats['net_lines']:+,}\n")
-            content.append("\n")
+                lines.append(f"- **Net Lines**: {stats['net_lines']:+,}\n")
+            accomplishments = f"## Accomplishments\n\n{''.join(lines)}\n"
         
         # Key Files
-        uncommitted = session_data["git"].get("uncommitted_files", [])
+        key_files = ""
+        uncommitted = git.get("uncommitted_files", [])
         if uncommitted:
-            content.append("## Key Files\n\n")
-            content.append("### Modified/Created\n\n")
-            for file in uncommitted[:15]:
-                content.append(f"- `{file}`\n")
-            content.append("\n")
-        
-        # Notes
-        content.append("## Notes\n\n")
-        content.append("_Add session notes here_\n\n")
-        
-        # Next Steps
-        content.append("## Next Steps\n\n")
-        content.append("1. Review recap and identify next actions\n")
-        content.append("2. Continue with planned work\n")
-        content.append("3. Update goals if needed\n\n")
-        
-        return "".join(content)
+            files_block = "\n".join(f"- `{file}`" for file in uncommitted[:15])
+            key_files = f"## Key Files\n\n### Modified/Created\n\n{files_block}\n\n"
+        
+        return _RECAP_TEMPLATE.format(
+            date=session_data["date"],
+            time=session_data["time"],
+            timestamp=session_data["timestamp"],
+            branch=git.get("branch", "unknown"),
+            uncommitted_count=git.get("uncommitted_count", 0),
+            accomplishments=accomplishments,
+            key_files=key_files,
+        )
     
     def _display_summary(self, session_data: Dict[str, Any], recap_file: Path):
         """Display recap summary."""
-        self.console.print("[bold]📋 Recap Summary[/bold]\n")
-        self.console.print(f"  • Date: {session_data['date']} {session_data['time']}")
-        self.console.print(f"  • Branch: {session_data['git'].get('branch', 'unknown')}")
+        lines = [
+            "[bold]📋 Recap Summary[/bold]\n",
+            f"  • Date: {session_data['date']} {session_data['time']}",
+            f"  • Branch: {session_data['git'].get('branch', 'unknown')}",
+        ]
         
         stats = session_data.get("stats", {})
         if stats:
-            self.console.print(f"  • Files Created: {stats.get('files_created', 0)}")
-            self.console.print(f"  • Lines Written: {stats.get('lines_written', 0):,}")
+            lines.append(f"  • Files Created: {stats.get('files_created', 0)}")
+            lines.append(f"  • Lines Written: {stats.get('lines_written', 0):,}")
         
-        self.console.print(f"\n[bold green]✅ Recap saved:[/bold green] {recap_file.relative_to(self.project_path)}\n")
+        lines.append(f"\n[bold green]✅ Recap saved:[/bold green] {recap_file.relative_to(self.project_path)}\n")
+        self.console.print("\n".join(lines))
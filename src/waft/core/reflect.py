@@ -5,17 +5,143 @@ Induces the AI to write in its journal, reflecting on current work, thoughts,
 and experiences. The AI definitely needs a journal if it doesn't have one.
 """
 
+import mmap
+import os
 import re
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 
-from .session_stats import SessionStats
-from .github import GitHubManager
-from .memory import MemoryManager
+from ..utils import get_console, write_file_bytes
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from .github import GitHubManager
+    from .memory import MemoryManager
+    from .session_stats import SessionStats
+
+
+# Journal entry headers: "## Journal Entry: YYYY-MM-DD HH:MM"
+_ENTRY_HEADER_LINE_RE = re.compile(rb'^## Journal Entry:[^\n]*', re.MULTILINE)
+_ENTRY_RE = re.compile(r'^## Journal Entry: (\d{4}-\d{2}-\d{2} \d{2}:\d{2})', re.MULTILINE)
+
+# Header written once when the journal file is created
+_JOURNAL_HEADER = """# AI Journal
+
+**Created**: {created}
+**Purpose**: Reflective journal for AI assistant thoughts, learnings, and experiences
+
+---
+
+This journal captures the AI's reflections on its work, thoughts, learnings, and experiences.
+Entries are appended chronologically, providing a record of the AI's cognitive journey.
+
+---
+
+"""
+
+# One appended journal entry; context and sections are filled in as blocks
+_ENTRY_TEMPLATE = """
+## Journal Entry: {date} {time}
+**Timestamp**: {timestamp}
+
+{context}{sections}---
+"""
+
+# Where the header starts within an appended entry (after its leading newline)
+_ENTRY_HEADER_OFFSET = _ENTRY_TEMPLATE.index("## Journal Entry:")
+
+# Initial size of the journal tail read for recent entries (doubled as needed)
+_TAIL_BYTES = 64 * 1024
+
+
+def _read_journal_tail(path: Path, min_entries: int) -> str:
+    """
+    Read the end of the journal, holding at least min_entries entry headers.
+
+    Starts with the last _TAIL_BYTES bytes and doubles the window until it
+    holds enough headers or covers the whole file. A window starting
+    mid-file drops its first, possibly partial, line.
+
+    Args:
+        path: Journal file
+        min_entries: Entry headers needed (the whole file if not positive)
+
+    Returns:
+        Decoded tail of the journal
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        window = _TAIL_BYTES
+        while True:
+            start = max(0, size - window) if min_entries > 0 else 0
+            f.seek(start)
+            data = f.read()
+            if start > 0:
+                newline = data.find(b"\n")
+                data = data[newline + 1:] if newline != -1 else b""
+            text = data.decode("utf-8", errors="replace")
+            if start == 0 or len(_ENTRY_RE.findall(text)) >= min_entries:
+                return text
+            window *= 2
+
+
+def _scan_entry_headers(path: Path) -> Tuple[int, Optional[bytes]]:
+    """
+    Count journal entry headers and return the first one.
+
+    The file is memory-mapped and scanned by the bytes regex engine, so only
+    header lines become Python objects, however large the journal grows.
+
+    Args:
+        path: Journal file
+
+    Returns:
+        Tuple of (header count, first header line or None)
+    """
+    count = 0
+    first_header = None
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return count, first_header
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _ENTRY_HEADER_LINE_RE.finditer(mm):
+                if first_header is None:
+                    first_header = match.group()
+                count += 1
+    return count, first_header
+
+
+def _read_last_lines(path: Path, count: int) -> List[str]:
+    """
+    Read the last count lines of a small line-oriented file from its end.
+
+    Args:
+        path: File to read
+        count: Number of lines wanted
+
+    Returns:
+        Up to count lines, oldest first
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        window = 64 * (count + 1)
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read().decode("utf-8", errors="replace").splitlines()
+            if start > 0:
+                lines = lines[1:]
+            if start == 0 or len(lines) >= count:
+                return lines[-count:]
+            window *= 2
+
+
+def _summarize_entry(entry_content: str) -> str:
+    """Summarize an entry body as its first few non-heading lines."""
+    summary_lines = [line.strip() for line in entry_content.split('\n')[:5] if line.strip() and not line.strip().startswith('#')]
+    return ' '.join(summary_lines[:3])[:200]  # First 200 chars
 
 
 class ReflectManager:
@@ -29,44 +155,64 @@ class ReflectManager:
             project_path: Path to project root
         """
         self.project_path = project_path
-        self.console = Console()
-        self.stats_tracker = SessionStats(project_path)
-        self.github = GitHubManager(project_path)
-        self.memory = MemoryManager(project_path)
         
         # Journal location
         self.journal_dir = project_path / "_pyrite" / "journal"
         self.journal_file = self.journal_dir / "ai-journal.md"
         self.entries_dir = self.journal_dir / "entries"
+        # One "offset<TAB>date<TAB>time" line per entry appended by reflect
+        self.index_file = self.journal_dir / "entries.index"
         
         # Ensure journal structure exists
         self._ensure_journal_exists()
     
+    # Collaborators are built on first use, so cheap read paths such as
+    # get_journal_info() do not import or construct them
+    
+    @cached_property
+    def console(self) -> "Console":
+        """Shared Rich console."""
+        return get_console()
+    
+    @cached_property
+    def stats_tracker(self) -> "SessionStats":
+        """Session statistics for the project."""
+        from .session_stats import SessionStats
+        return SessionStats(self.project_path)
+    
+    @cached_property
+    def github(self) -> "GitHubManager":
+        """Git helpers for the project."""
+        from .github import GitHubManager
+        return GitHubManager(self.project_path)
+    
+    @cached_property
+    def memory(self) -> "MemoryManager":
+        """_pyrite structure manager for the project."""
+        from .memory import MemoryManager
+        return MemoryManager(self.project_path)
+    
     def _ensure_journal_exists(self):
         """Ensure journal directory and file exist."""
-        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        # entries/ is inside journal/, so one call creates both
         self.entries_dir.mkdir(parents=True, exist_ok=True)
         
         # Create journal file if it doesn't exist
-        if not self.journal_file.exists():
+        try:
             self._create_initial_journal()
+        except FileExistsError:
+            pass
     
     def _create_initial_journal(self):
-        """Create initial journal file with header."""
-        header = f"""# AI Journal
-
-**Created**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Purpose**: Reflective journal for AI assistant thoughts, learnings, and experiences
-
----
-
-This journal captures the AI's reflections on its work, thoughts, learnings, and experiences.
-Entries are appended chronologically, providing a record of the AI's cognitive journey.
-
----
-
-"""
-        self.journal_file.write_text(header, encoding="utf-8")
+        """
+        Create initial journal file with header.
+        
+        Raises:
+            FileExistsError: If the journal file already exists
+        """
+        header = _JOURNAL_HEADER.format(created=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        with open(self.journal_file, "x", encoding="utf-8") as f:
+            f.write(header)
     
     def run_reflect(
         self,
@@ -102,8 +248,10 @@ Entries are appended chronologically, providing a record of the AI's cognitive j
         # Save entry if requested
         if save_entry:
             entry_path = self._save_journal_entry(entry)
-            self.console.print(f"\n[bold green]✅ Journal entry written[/bold green]")
-            self.console.print(f"[dim]Location: {entry_path.relative_to(self.project_path)}[/dim]")
+            self.console.print(
+                "\n[bold green]✅ Journal entry written[/bold green]\n"
+                f"[dim]Location: {entry_path.relative_to(self.project_path)}[/dim]"
+            )
         else:
             self.console.print("\n[bold yellow]⚠️[/bold yellow] Entry not saved (use --save to save)")
         
@@ -124,45 +272,15 @@ Entries are appended chronologically, providing a record of the AI's cognitive j
         Returns:
             Dictionary with context information
         """
-        import subprocess
-        
+        now = datetime.now()
         context = {
-            "timestamp": datetime.now().isoformat(),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "time": datetime.now().strftime("%H:%M"),
-        }
-        
-        # Git status
-        git_info = {
-            "initialized": self.github.is_initialized(),
-            "branch": "unknown",
-            "uncommitted_count": 0,
+            "timestamp": now.isoformat(),
+            "date": now.strftime("%Y-%m-%d"),
+            "time": now.strftime("%H:%M"),
         }
         
-        if git_info["initialized"]:
-            try:
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    git_info["branch"] = result.stdout.strip()
-                
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    uncommitted = [line for line in result.stdout.strip().split("\n") if line.strip()]
-                    git_info["uncommitted_count"] = len(uncommitted)
-            except Exception:
-                pass
+        # Git status (one git call, shared with proceed/recap for a short TTL)
+        git_info = self.github.get_git_context(max_files=20)
         
         context["git"] = git_info
         
@@ -192,36 +310,76 @@ Entries are appended chronologically, providing a record of the AI's cognitive j
         Returns:
             List of recent entry summaries
         """
-        if not self.journal_file.exists():
+        indexed = self._get_indexed_entries(limit)
+        if indexed is not None:
+            return indexed
+        
+        try:
+            content = _read_journal_tail(self.journal_file, limit)
+        except FileNotFoundError:
             return []
         
-        content = self.journal_file.read_text(encoding="utf-8")
+        # Pair each entry header with the next one's start in a single scan;
+        # only the last `limit` entries are summarized
+        matches = list(_ENTRY_RE.finditer(content))
+        ends = [m.start() for m in matches[1:]] + [len(content)]
         
-        # Extract entry headers (## Journal Entry: YYYY-MM-DD HH:MM)
         entries = []
-        pattern = r'^## Journal Entry: (\d{4}-\d{2}-\d{2} \d{2}:\d{2})'
-        
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            date_str = match.group(1)
-            # Find the next entry or end of file
-            start_pos = match.end()
-            next_match = re.search(pattern, content[start_pos:], re.MULTILINE)
-            if next_match:
-                end_pos = start_pos + next_match.start()
-            else:
-                end_pos = len(content)
-            
-            entry_content = content[start_pos:end_pos].strip()
-            # Extract first few lines as summary
-            summary_lines = [line.strip() for line in entry_content.split('\n')[:5] if line.strip() and not line.strip().startswith('#')]
-            summary = ' '.join(summary_lines[:3])[:200]  # First 200 chars
-            
+        for match, end_pos in list(zip(matches, ends, strict=True))[-limit:]:
             entries.append({
-                "date": date_str,
-                "summary": summary,
+                "date": match.group(1),
+                "summary": _summarize_entry(content[match.end():end_pos].strip()),
             })
         
-        return entries[-limit:] if entries else []
+        return entries
+    
+    def _get_indexed_entries(self, limit: int) -> Optional[List[Dict[str, str]]]:
+        """
+        Get recent entries by seeking to offsets from the entry index.
+        
+        Each indexed entry is read as the slice up to the next indexed offset
+        (or end of file) and must hold exactly its own header, where the
+        entry template puts it. Anything else
+        means the journal was edited after indexing, so the caller should
+        scan instead.
+        
+        Args:
+            limit: Number of recent entries to retrieve
+            
+        Returns:
+            List of recent entry summaries, or None if the index is missing
+            or does not match the journal
+        """
+        if limit <= 0:
+            return None
+        
+        try:
+            rows = [line.split("\t") for line in _read_last_lines(self.index_file, limit)]
+            offsets = [int(row[0]) for row in rows]
+            with open(self.journal_file, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                if len(rows) < limit or offsets[-1] >= size:
+                    return None
+                
+                entries = []
+                for row, start, end in zip(rows, offsets, offsets[1:] + [size], strict=True):
+                    f.seek(start)
+                    chunk = f.read(end - start).decode("utf-8")
+                    headers = list(_ENTRY_RE.finditer(chunk))
+                    if (
+                        len(headers) != 1
+                        or headers[0].start() != _ENTRY_HEADER_OFFSET
+                        or headers[0].group(1) != f"{row[1]} {row[2]}"
+                    ):
+                        return None
+                    entries.append({
+                        "date": headers[0].group(1),
+                        "summary": _summarize_entry(chunk[headers[0].end():].strip()),
+                    })
+        except (OSError, ValueError, IndexError):
+            return None
+        
+        return entries
     
     def _generate_reflection_prompts(
         self,
@@ -282,25 +440,32 @@ Entries are appended chronologically, providing a record of the AI's cognitive j
         context: Dict[str, Any]
     ):
         """Display reflection prompts to induce AI reflection."""
-        self.console.print("[bold]📝 Reflection Prompts[/bold]\n")
+        footer = "\n[dim]Take a moment to reflect deeply on these questions...[/dim]\n\n" + "=" * 90
         
         if "custom" in prompts:
-            self.console.print(Panel(
-                prompts["custom"],
-                title="Custom Reflection Prompt",
-                border_style="cyan"
+            from rich.console import Group
+            from rich.panel import Panel
+            self.console.print(Group(
+                "[bold]📝 Reflection Prompts[/bold]\n",
+                Panel(
+                    prompts["custom"],
+                    title="Custom Reflection Prompt",
+                    border_style="cyan"
+                ),
+                footer,
             ))
-        else:
-            self.console.print("[dim]Consider these questions as you reflect:[/dim]\n")
-            
-            for key, prompt in prompts.items():
-                if key != "custom":
-                    # Format key as readable label
-                    label = key.replace("_", " ").title()
-                    self.console.print(f"  • [bold]{label}:[/bold] {prompt}")
-        
-        self.console.print("\n[dim]Take a moment to reflect deeply on these questions...[/dim]\n")
-        self.console.print("=" * 90)
+            return
+        
+        lines = [
+            "[bold]📝 Reflection Prompts[/bold]\n",
+            "[dim]Consider these questions as you reflect:[/dim]\n",
+        ]
+        for key, prompt in prompts.items():
+            # Format key as readable label
+            label = key.replace("_", " ").title()
+            lines.append(f"  • [bold]{label}:[/bold] {prompt}")
+        lines.append(footer)
+        self.console.print("\n".join(lines))
     
     def _create_journal_entry(
         self,
@@ -355,45 +520,54 @@ Entries are appended chronologically, providing a record of the AI's cognitive j
             Path to saved entry
         """
         # Build markdown content
-        content = []
-        content.append(f"\n## Journal Entry: {entry['date']} {entry['time']}\n")
-        content.append(f"**Timestamp**: {entry['timestamp']}\n\n")
-        
-        # Add context summary
-        if entry['context'].get('git', {}).get('initialized'):
-            content.append(f"**Context**: Branch `{entry['context']['git'].get('branch', 'unknown')}`, ")
-            content.append(f"{entry['context']['git'].get('uncommitted_count', 0)} uncommitted files\n\n")
-        
-        # Add sections
-        for section_name, section_content in entry['sections'].items():
-            content.append(f"### {section_name}\n")
-            content.append(f"{section_content}\n\n")
-        
-        content.append("---\n")
-        
-        # Append to main journal file
-        with open(self.journal_file, "a", encoding="utf-8") as f:
-            f.write("".join(content))
-        
-        # Also save as individual entry file
+        git = entry['context'].get('git', {})
+        context_line = ""
+        if git.get('initialized'):
+            context_line = (
+                f"**Context**: Branch `{git.get('branch', 'unknown')}`, "
+                f"{git.get('uncommitted_count', 0)} uncommitted files\n\n"
+            )
+        content = _ENTRY_TEMPLATE.format(
+            date=entry['date'],
+            time=entry['time'],
+            timestamp=entry['timestamp'],
+            context=context_line,
+            sections="".join(
+                f"### {section_name}\n{section_content}\n\n"
+                for section_name, section_content in entry['sections'].items()
+            ),
+        )
+        payload = content.encode("utf-8")
+        
+        # Append to main journal file, then index the entry's start offset
+        offset = write_file_bytes(self.journal_file, payload, append=True)
+        write_file_bytes(
+            self.index_file,
+            f"{offset}\t{entry['date']}\t{entry['time']}\n".encode("utf-8"),
+            append=True,
+        )
+        
+        # Also save as individual entry file (same encoded bytes)
         entry_file = self.entries_dir / f"{entry['date']}-{entry['time'].replace(':', '')}.md"
-        entry_file.write_text("".join(content), encoding="utf-8")
+        write_file_bytes(entry_file, payload)
         
         return self.journal_file
     
     def _display_entry_summary(self, entry: Dict[str, Any]):
         """Display summary of created entry."""
-        self.console.print("\n[bold]📋 Entry Summary[/bold]\n")
-        self.console.print(f"  • Date: {entry['date']} {entry['time']}")
-        self.console.print(f"  • Sections: {len(entry['sections'])}")
+        lines = [
+            "\n[bold]📋 Entry Summary[/bold]\n",
+            f"  • Date: {entry['date']} {entry['time']}",
+            f"  • Sections: {len(entry['sections'])}",
+        ]
         
         if entry['sections']:
-            self.console.print("\n[bold]Sections:[/bold]")
-            for section_name in entry['sections'].keys():
-                self.console.print(f"  - {section_name}")
+            lines.append("\n[bold]Sections:[/bold]")
+            lines.extend(f"  - {section_name}" for section_name in entry['sections'])
         
-        self.console.print("\n[dim]Note: The AI should now write its reflection in response to the prompts.[/dim]")
-        self.console.print("[dim]The entry structure has been created - the AI should fill it with thoughtful reflection.[/dim]\n")
+        lines.append("\n[dim]Note: The AI should now write its reflection in response to the prompts.[/dim]")
+        lines.append("[dim]The entry structure has been created - the AI should fill it with thoughtful reflection.[/dim]\n")
+        self.console.print("\n".join(lines))
     
     def get_journal_info(self) -> Dict[str, Any]:
         """
@@ -403,20 +577,21 @@ Entries are appended chronologically, providing a record of the AI's cognitive j
             Dictionary with journal information
         """
         info = {
-            "exists": self.journal_file.exists(),
+            "exists": False,
             "path": str(self.journal_file.relative_to(self.project_path)),
             "entries_count": 0,
             "last_entry": None,
         }
         
-        if self.journal_file.exists():
-            content = self.journal_file.read_text(encoding="utf-8")
-            # Count entries
-            entries = re.findall(r'^## Journal Entry:', content, re.MULTILINE)
-            info["entries_count"] = len(entries)
-            
-            # Get last entry date
-            last_match = re.search(r'^## Journal Entry: (\d{4}-\d{2}-\d{2} \d{2}:\d{2})', content, re.MULTILINE)
+        try:
+            info["entries_count"], first_header = _scan_entry_headers(self.journal_file)
+        except FileNotFoundError:
+            return info
+        info["exists"] = True
+        
+        # Get last entry date (reported from the first header in the file)
+        if first_header is not None:
+            last_match = _ENTRY_RE.match(first_header.decode("utf-8", errors="replace"))
             if last_match:
                 info["last_entry"] = last_match.group(1)
         
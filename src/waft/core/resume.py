@@ -5,14 +5,13 @@ Loads the most recent session summary, compares current state with what was left
 identifies what was in progress, and provides clear next steps.
 """
 
+import json
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from typing import Dict, Any, NamedTuple, Optional, List
+from rich.console import Console, Group
 
 from ..logging import get_logger
 from .session_stats import SessionStats
@@ -22,6 +21,56 @@ from .substrate import SubstrateManager
 
 logger = get_logger(__name__)
 
+# Session summary fields parsed by ResumeManager._parse_session_summary
+_DATE_RE = re.compile(r"Session Summary: (\d{4}-\d{2}-\d{2})")
+# "**Label**: value" fields, found in one scan. The value is captured in a
+# lookahead so a field later on the same line is still found; each label's
+# value must then match its own pattern, and the first valid one wins
+_FIELD_RE = re.compile(
+    r"\*\*(Session End|Files Created|Files Modified|Lines Written|Net Change"
+    r"|Branch|Uncommitted Files)\*\*: (?=(.+))"
+)
+_FIELD_VALUE_RES = {
+    "Session End": re.compile(r".+"),
+    "Files Created": re.compile(r"\d+"),
+    "Files Modified": re.compile(r"\d+"),
+    "Lines Written": re.compile(r"[\d,]+"),
+    "Net Change": re.compile(r"[+\-]?[\d,]+"),
+    "Branch": re.compile(r".+"),
+    "Uncommitted Files": re.compile(r"\d+"),
+}
+_TOP_FILES_RE = re.compile(r"## Top Files by Changes\n\n(.*?)\n---", re.DOTALL)
+# One match per Top Files line: the backticked path and, wherever it sits on
+# the line, an optional "(N lines)" net change.
+_TOP_FILE_LINE_RE = re.compile(r"(?=.*?`([^`]+)`)(?:(?=.*?\(([+\-]?\d+) lines\)))?")
+_NEXT_STEPS_RE = re.compile(r"## Next Steps\n\n(.*?)(?:\n---|\n\*\*)", re.DOTALL)
+# Numbered "1."-"5." step lines; the text is captured without its number.
+_NEXT_STEP_RE = re.compile(r"^[^\S\n]*[1-5]\.[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+# Rule between sections of the resume report
+_DIVIDER = "=" * 90
+
+
+def _parse_signed_int(text: str) -> int:
+    """Parse an integer with optional sign and thousands separators ("+1,234")."""
+    return int(text.replace(",", ""))
+
+
+# Bumped whenever the parsed session layout changes, invalidating old sidecars
+_SIDECAR_FORMAT = 2
+
+
+class TopFile(NamedTuple):
+    """A file from a session summary's Top Files section."""
+    file: str
+    net: int
+
+
+class NextStep(NamedTuple):
+    """A suggested next step in the resume report."""
+    action: str
+    why: str
+    command: Optional[str]
+
 
 class ResumeManager:
     """Manages resume workflow - restoring context from last session."""
@@ -121,22 +170,59 @@ class ResumeManager:
                 return session_path
             return None
         
-        # Find most recent session file
-        session_files = sorted(
-            checkout_dir.glob("session-*.md"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
-        
-        if session_files:
-            return session_files[0]
-        
-        return None
+        # Find most recent session file in one directory pass (no sort)
+        newest_path = None
+        newest_mtime = -1
+        with os.scandir(checkout_dir) as entries:
+            for entry in entries:
+                if (
+                    entry.name.startswith("session-")
+                    and entry.name.endswith(".md")
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                    if mtime > newest_mtime:
+                        newest_mtime, newest_path = mtime, entry.path
+        
+        return Path(newest_path) if newest_path is not None else None
     
     def _parse_session_summary(self, session_file: Path) -> Dict[str, Any]:
         """
         Parse session summary markdown file.
         
+        The result is kept in a `<name>.parsed.json` sidecar next to the
+        summary, stamped with the summary's mtime and size, so repeated
+        resumes of an unchanged summary skip the markdown parse.
+        
+        Args:
+            session_file: Path to session summary file
+            
+        Returns:
+            Dictionary with parsed session data
+        """
+        st = session_file.stat()
+        sig = [_SIDECAR_FORMAT, st.st_mtime_ns, st.st_size]
+        sidecar = session_file.with_suffix(".parsed.json")
+        try:
+            cached = json.loads(sidecar.read_bytes())
+            if cached["sig"] == sig:
+                data = cached["data"]
+                data["top_files"] = [TopFile(*item) for item in data["top_files"]]
+                return data
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        data = self._parse_session_markdown(session_file)
+        try:
+            sidecar.write_text(json.dumps({"sig": sig, "data": data}), encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Could not write session cache {sidecar}: {e}")
+        return data
+    
+    def _parse_session_markdown(self, session_file: Path) -> Dict[str, Any]:
+        """
+        Parse session summary markdown without the sidecar cache.
+        
         Args:
             session_file: Path to session summary file
             
@@ -146,65 +232,59 @@ class ResumeManager:
         content = session_file.read_text(encoding="utf-8")
         
         # Extract session date/time
-        date_match = re.search(r"Session Summary: (\d{4}-\d{2}-\d{2})", content)
-        time_match = re.search(r"\*\*Session End\*\*: (.+)", content)
+        date_match = _DATE_RE.search(content)
+        
+        # Extract all "**Label**: value" fields in one pass
+        fields = {}
+        for match in _FIELD_RE.finditer(content):
+            label = match.group(1)
+            if label not in fields:
+                value_match = _FIELD_VALUE_RES[label].match(match.group(2))
+                if value_match:
+                    fields[label] = value_match.group()
         
         # Extract statistics
         stats = {}
-        files_created_match = re.search(r"\*\*Files Created\*\*: (\d+)", content)
-        files_modified_match = re.search(r"\*\*Files Modified\*\*: (\d+)", content)
-        lines_written_match = re.search(r"\*\*Lines Written\*\*: ([\d,]+)", content)
-        net_change_match = re.search(r"\*\*Net Change\*\*: ([+\-]?[\d,]+)", content)
-        
-        if files_created_match:
-            stats["files_created"] = int(files_created_match.group(1))
-        if files_modified_match:
-            stats["files_modified"] = int(files_modified_match.group(1))
-        if lines_written_match:
-            stats["lines_written"] = int(lines_written_match.group(1).replace(",", ""))
-        if net_change_match:
-            stats["net_change"] = int(net_change_match.group(1).replace(",", "").replace("+", ""))
+        if "Files Created" in fields:
+            stats["files_created"] = int(fields["Files Created"])
+        if "Files Modified" in fields:
+            stats["files_modified"] = int(fields["Files Modified"])
+        if "Lines Written" in fields:
+            stats["lines_written"] = _parse_signed_int(fields["Lines Written"])
+        if "Net Change" in fields:
+            stats["net_change"] = _parse_signed_int(fields["Net Change"])
         
         # Extract top files
         top_files = []
-        top_files_section = re.search(r"## Top Files by Changes\n\n(.*?)\n---", content, re.DOTALL)
+        top_files_section = _TOP_FILES_RE.search(content)
         if top_files_section:
             file_lines = top_files_section.group(1).strip().split("\n")
             for line in file_lines[:10]:
-                file_match = re.search(r"`([^`]+)`", line)
-                net_match = re.search(r"\(([+\-]?\d+) lines\)", line)
-                if file_match:
-                    top_files.append({
-                        "file": file_match.group(1),
-                        "net": int(net_match.group(1).replace("+", "")) if net_match else 0
-                    })
+                line_match = _TOP_FILE_LINE_RE.match(line)
+                if line_match:
+                    file_name, net = line_match.groups()
+                    top_files.append(TopFile(file_name, int(net) if net else 0))
         
         # Extract git status
         git_info = {}
-        branch_match = re.search(r"\*\*Branch\*\*: (.+)", content)
-        uncommitted_match = re.search(r"\*\*Uncommitted Files\*\*: (\d+)", content)
-        
-        if branch_match:
-            git_info["branch"] = branch_match.group(1).strip()
-        if uncommitted_match:
-            git_info["uncommitted_count"] = int(uncommitted_match.group(1))
+        if "Branch" in fields:
+            git_info["branch"] = fields["Branch"].strip()
+        if "Uncommitted Files" in fields:
+            git_info["uncommitted_count"] = int(fields["Uncommitted Files"])
         
         # Extract next steps
         next_steps = []
-        next_steps_section = re.search(r"## Next Steps\n\n(.*?)(?:\n---|\n\*\*)", content, re.DOTALL)
+        next_steps_section = _NEXT_STEPS_RE.search(content)
         if next_steps_section:
-            steps_text = next_steps_section.group(1)
-            step_lines = [line.strip() for line in steps_text.split("\n") if line.strip() and line.strip().startswith(("1.", "2.", "3.", "4.", "5."))]
-            for line in step_lines:
-                # Remove numbering
-                step = re.sub(r"^\d+\.\s*", "", line)
+            for step_match in _NEXT_STEP_RE.finditer(next_steps_section.group(1)):
+                step = step_match.group(1)
                 if step:
                     next_steps.append(step)
         
         return {
             "file": session_file.name,
             "date": date_match.group(1) if date_match else None,
-            "time": time_match.group(1) if time_match else None,
+            "time": fields.get("Session End"),
             "stats": stats,
             "top_files": top_files,
             "git": git_info,
@@ -218,58 +298,12 @@ class ResumeManager:
         Returns:
             Dictionary with current state information
         """
-        import subprocess
-        
-        # Git status
-        git_info = {
-            "initialized": self.github.is_initialized(),
-            "branch": "unknown",
-            "uncommitted_count": 0,
-            "uncommitted_files": [],
-            "commits_ahead": 0,
-        }
-        
-        if git_info["initialized"]:
-            try:
-                # Get branch
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    git_info["branch"] = result.stdout.strip()
-                
-                # Get uncommitted files
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    uncommitted = [line[3:].strip() for line in result.stdout.strip().split("\n") if line.strip()]
-                    git_info["uncommitted_files"] = uncommitted
-                    git_info["uncommitted_count"] = len(uncommitted)
-                
-                # Get commits ahead
-                try:
-                    result = subprocess.run(
-                        ["git", "rev-list", "--count", "@{u}..HEAD"],
-                        cwd=self.project_path,
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        git_info["commits_ahead"] = int(result.stdout.strip())
-                except (ValueError, OSError) as e:
-                    logger.debug(f"Could not determine commits ahead: {e}")
-            except Exception:
-                pass
+        # git status and session stats both run git subprocesses (and stats
+        # reads untracked files), so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            git_future = executor.submit(self._git_probe)
+            stats_future = executor.submit(self.stats_tracker.calculate_session_stats)
+        git_info = git_future.result()
         
         # Project health
         try:
@@ -285,7 +319,7 @@ class ResumeManager:
         
         # Current session stats (if any)
         try:
-            current_stats = self.stats_tracker.calculate_session_stats()
+            current_stats = stats_future.result()
         except Exception:
             current_stats = {}
         
@@ -298,6 +332,29 @@ class ResumeManager:
             "stats": current_stats,
         }
     
+    def _git_probe(self) -> Dict[str, Any]:
+        """
+        Get git branch, upstream lead and uncommitted files.
+        
+        Returns:
+            Dictionary with git state (defaults when not a repository)
+        """
+        git_info = {
+            "initialized": self.github.is_initialized(),
+            "branch": "unknown",
+            "uncommitted_count": 0,
+            "uncommitted_files": [],
+            "commits_ahead": 0,
+        }
+        
+        if git_info["initialized"]:
+            # Branch, upstream lead and uncommitted files from one git call
+            tree_info = self.github.get_working_tree_info(max_files=None)
+            if tree_info["branch"] is not None:
+                git_info.update(tree_info)
+        
+        return git_info
+    
     def _compare_states(
         self,
         session_data: Dict[str, Any],
@@ -385,7 +442,7 @@ class ResumeManager:
         session_data: Dict[str, Any],
         current_state: Dict[str, Any],
         comparison: Optional[Dict[str, Any]]
-    ) -> List[Dict[str, str]]:
+    ) -> List[NextStep]:
         """
         Generate next steps based on session data and current state.
         
@@ -395,40 +452,40 @@ class ResumeManager:
             comparison: State comparison results
             
         Returns:
-            List of next step dictionaries
+            List of next steps
         """
         next_steps = []
         
         # If there are uncommitted files, suggest reviewing them
         if current_state["git"]["uncommitted_count"] > 0:
-            next_steps.append({
-                "action": f"Review {current_state['git']['uncommitted_count']} uncommitted file(s)",
-                "why": "Files from last session may need attention",
-                "command": "git status"
-            })
+            next_steps.append(NextStep(
+                action=f"Review {current_state['git']['uncommitted_count']} uncommitted file(s)",
+                why="Files from last session may need attention",
+                command="git status",
+            ))
         
         # Add next steps from last session
         last_next_steps = session_data.get("next_steps", [])
         for step in last_next_steps[:3]:
-            next_steps.append({
-                "action": step,
-                "why": "Planned in last session",
-                "command": None
-            })
+            next_steps.append(NextStep(
+                action=step,
+                why="Planned in last session",
+                command=None,
+            ))
         
         # Suggest commands
-        next_steps.append({
-            "action": "Get full project overview",
-            "why": "Understand current complete state",
-            "command": "/phase1"
-        })
+        next_steps.append(NextStep(
+            action="Get full project overview",
+            why="Understand current complete state",
+            command="/phase1",
+        ))
         
         if current_state["git"]["uncommitted_count"] > 0:
-            next_steps.append({
-                "action": "Analyze current state",
-                "why": "Generate action plan based on current state",
-                "command": "/analyze"
-            })
+            next_steps.append(NextStep(
+                action="Analyze current state",
+                why="Generate action plan based on current state",
+                command="/analyze",
+            ))
         
         return next_steps
     
@@ -438,99 +495,101 @@ class ResumeManager:
         current_state: Dict[str, Any],
         comparison: Optional[Dict[str, Any]],
         in_progress: List[Dict[str, str]],
-        next_steps: List[Dict[str, str]]
+        next_steps: List[NextStep]
     ):
         """Display comprehensive resume report."""
-        self.console.print("=" * 90)
+        # Build the report as markup lines and print it in one call
+        lines = []
+        lines.append(_DIVIDER)
         
         # Last Session Summary
-        self.console.print("\n[bold]📋 Last Session[/bold]")
+        lines.append("\n[bold]📋 Last Session[/bold]")
         if session_data.get("date") and session_data.get("time"):
-            self.console.print(f"  Session: {session_data['date']} {session_data.get('time', '')}")
+            lines.append(f"  Session: {session_data['date']} {session_data.get('time', '')}")
         
         stats = session_data.get("stats", {})
         if stats:
-            self.console.print("\n[bold]Accomplishments:[/bold]")
+            lines.append("\n[bold]Accomplishments:[/bold]")
             if "files_created" in stats:
-                self.console.print(f"  • Files Created: {stats['files_created']}")
+                lines.append(f"  • Files Created: {stats['files_created']}")
             if "files_modified" in stats:
-                self.console.print(f"  • Files Modified: {stats['files_modified']}")
+                lines.append(f"  • Files Modified: {stats['files_modified']}")
             if "lines_written" in stats:
-                self.console.print(f"  • Lines Written: {stats['lines_written']:,}")
+                lines.append(f"  • Lines Written: {stats['lines_written']:,}")
             if "net_change" in stats:
                 net = stats["net_change"]
                 net_str = f"+{net}" if net > 0 else str(net)
-                self.console.print(f"  • Net Change: {net_str} lines")
+                lines.append(f"  • Net Change: {net_str} lines")
         
         top_files = session_data.get("top_files", [])
         if top_files:
-            self.console.print("\n[bold]Top Files Worked On:[/bold]")
+            lines.append("\n[bold]Top Files Worked On:[/bold]")
             for i, file_info in enumerate(top_files[:5], 1):
-                net = file_info.get("net", 0)
+                net = file_info.net
                 net_str = f"+{net}" if net > 0 else str(net)
                 icon = "✨" if net > 0 else "📝"
-                self.console.print(f"  {i}. {icon} {file_info['file']} ({net_str} lines)")
+                lines.append(f"  {i}. {icon} {file_info.file} ({net_str} lines)")
         
         last_next_steps = session_data.get("next_steps", [])
         if last_next_steps:
-            self.console.print("\n[bold]Next Steps (from last session):[/bold]")
+            lines.append("\n[bold]Next Steps (from last session):[/bold]")
             for i, step in enumerate(last_next_steps[:3], 1):
-                self.console.print(f"  {i}. {step}")
+                lines.append(f"  {i}. {step}")
         
-        self.console.print("\n" + "=" * 90)
+        lines.append("\n" + _DIVIDER)
         
         # Current State
-        self.console.print("\n[bold]📊 Current State[/bold]\n")
+        lines.append("\n[bold]📊 Current State[/bold]\n")
         
         git = current_state["git"]
-        self.console.print("[bold]Git Status:[/bold]")
-        self.console.print(f"  • Branch: {git['branch']}")
-        self.console.print(f"  • Uncommitted Files: {git['uncommitted_count']}")
-        self.console.print(f"  • Commits Ahead: {git['commits_ahead']}")
+        lines.append("[bold]Git Status:[/bold]")
+        lines.append(f"  • Branch: {git['branch']}")
+        lines.append(f"  • Uncommitted Files: {git['uncommitted_count']}")
+        lines.append(f"  • Commits Ahead: {git['commits_ahead']}")
         status = "Clean" if git['uncommitted_count'] == 0 else "Has uncommitted changes"
-        self.console.print(f"  • Status: {status}")
+        lines.append(f"  • Status: {status}")
         
         health = current_state["health"]
-        self.console.print("\n[bold]Project Health:[/bold]")
-        self.console.print(f"  • Integrity: {health['integrity']:.0f}%")
-        self.console.print(f"  • Structure: Valid")
-        self.console.print(f"  • Dependencies: {'Locked' if health['lock_exists'] else 'Unlocked'}")
+        lines.append("\n[bold]Project Health:[/bold]")
+        lines.append(f"  • Integrity: {health['integrity']:.0f}%")
+        lines.append(f"  • Structure: Valid")
+        lines.append(f"  • Dependencies: {'Locked' if health['lock_exists'] else 'Unlocked'}")
         
-        self.console.print("\n" + "=" * 90)
+        lines.append("\n" + _DIVIDER)
         
         # Comparison
         if comparison:
-            self.console.print("\n[bold]🔄 What's Changed Since Last Session[/bold]\n")
+            lines.append("\n[bold]🔄 What's Changed Since Last Session[/bold]\n")
             
             progress = comparison.get("progress", [])
             if progress:
-                self.console.print("[bold]✅ Progress Made:[/bold]")
+                lines.append("[bold]✅ Progress Made:[/bold]")
                 for item in progress:
-                    self.console.print(f"  • {item}")
+                    lines.append(f"  • {item}")
             
             if git["uncommitted_count"] > 0:
-                self.console.print("\n[bold]⏸️ Still In Progress:[/bold]")
-                self.console.print(f"  • {git['uncommitted_count']} uncommitted file(s)")
+                lines.append("\n[bold]⏸️ Still In Progress:[/bold]")
+                lines.append(f"  • {git['uncommitted_count']} uncommitted file(s)")
                 if last_next_steps:
-                    self.console.print(f"  • {len(last_next_steps)} pending next step(s)")
+                    lines.append(f"  • {len(last_next_steps)} pending next step(s)")
             
-            self.console.print("\n" + "=" * 90)
+            lines.append("\n" + _DIVIDER)
         
         # Continue Work
-        self.console.print("\n[bold]🎯 Continue Work[/bold]\n")
+        lines.append("\n[bold]🎯 Continue Work[/bold]\n")
         
-        self.console.print("[bold]Immediate Next Steps:[/bold]")
+        lines.append("[bold]Immediate Next Steps:[/bold]")
         for i, step in enumerate(next_steps[:5], 1):
-            self.console.print(f"  {i}. {step['action']}")
-            if step.get("why"):
-                self.console.print(f"     [dim]→ {step['why']}[/dim]")
+            lines.append(f"  {i}. {step.action}")
+            if step.why:
+                lines.append(f"     [dim]→ {step.why}[/dim]")
         
         if in_progress:
-            self.console.print("\n[bold]In-Progress Items:[/bold]")
+            lines.append("\n[bold]In-Progress Items:[/bold]")
             for item in in_progress[:3]:
-                self.console.print(f"  • {item['item']} - {item['status']}")
+                lines.append(f"  • {item['item']} - {item['status']}")
         
-        self.console.print("\n[bold]Suggested Commands:[/bold]")
+        lines.append("\n[bold]Suggested Commands:[/bold]")
         commands = [
             ("git status", "Review uncommitted changes"),
             ("/phase1", "Get full current project overview"),
@@ -538,7 +597,9 @@ class ResumeManager:
             ("/checkpoint", "Create new checkpoint for current state"),
         ]
         for cmd, desc in commands:
-            self.console.print(f"  • [cyan]{cmd}[/cyan] - {desc}")
+            lines.append(f"  • [cyan]{cmd}[/cyan] - {desc}")
         
-        self.console.print("\n" + "=" * 90)
-        self.console.print("\n[bold green]✅ Resume Complete - Ready to continue work[/bold green]\n")
+        lines.append("\n" + _DIVIDER)
+        lines.append("\n[bold green]✅ Resume Complete - Ready to continue work[/bold green]\n")
+        # Render lines separately so markup in session text stays on its line
+        self.console.print(Group(*(self.console.render_str(line) for line in lines)))
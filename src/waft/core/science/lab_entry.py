@@ -5,10 +5,116 @@ Generates structured lab entries from TamNotebook data, with realization
 as the dramatic climax of the narrative.
 """
 
+import mmap
+import os
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
-import re
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timezone
+
+
+# Notebook sections: "<heading> - <timestamp>", a blank line, then the body.
+# Headings are matched on the text after the leading "##".
+_TECH_PREFIX = " Technical Notes - "
+_PERSONAL_PREFIX = "# Personal Reflection - "
+# A personal reflection containing one of these is the realization entry
+_REALIZATION_MARKERS = ("F-A-I-W-E-I-T-A-M", "i.e. I AM WAFT")
+# Initial notebook tail read by _read_notebook; doubled until it suffices
+_TAIL_BYTES = 64 * 1024
+
+NotebookSections = Tuple[List[Dict[str, str]], List[Dict[str, str]], Optional[Dict[str, str]]]
+
+
+def _split_sections(content: str) -> Iterator[Tuple[str, str]]:
+    """
+    Split notebook markdown into (heading, body) pairs in one linear pass.
+
+    Each section starts at a line beginning with "##" and runs to the next
+    one. The heading is the text after "##" up to the first blank line; the
+    body is the rest, stripped. Sections without a blank line are skipped.
+    """
+    for chunk in ("\n" + content).split("\n##")[1:]:
+        heading, sep, body = chunk.partition("\n\n")
+        if sep:
+            yield heading, body.strip()
+
+
+def _parse_notebook(content: str) -> NotebookSections:
+    """
+    Collect technical notes, personal reflections and the realization entry.
+
+    Returns:
+        Tuple of (technical notes, personal reflections, last realization
+        entry or None), notes and reflections in file order
+    """
+    technical_notes = []
+    personal_reflections = []
+    realization_entry = None
+    for heading, body in _split_sections(content):
+        if heading.startswith(_TECH_PREFIX):
+            timestamp = heading[len(_TECH_PREFIX):]
+            if timestamp:
+                technical_notes.append({"timestamp": timestamp, "content": body})
+        elif heading.startswith(_PERSONAL_PREFIX):
+            timestamp = heading[len(_PERSONAL_PREFIX):]
+            if not timestamp:
+                continue
+            # Check if this is the realization entry
+            if any(marker in body for marker in _REALIZATION_MARKERS):
+                realization_entry = {"timestamp": timestamp, "content": body}
+            else:
+                personal_reflections.append({"timestamp": timestamp, "content": body})
+    return technical_notes, personal_reflections, realization_entry
+
+
+def _read_notebook(path: Path, keep: int) -> NotebookSections:
+    """
+    Parse only as much of the end of the notebook as the lab entry needs.
+
+    Starts with the last _TAIL_BYTES bytes, cut forward to a section start,
+    and doubles the window until it holds `keep` technical notes and `keep`
+    personal reflections, or covers the whole file. A realization entry
+    missing from the window may sit earlier in the file; the skipped head
+    is then searched for the realization markers via mmap and, if one is
+    present, the window keeps growing.
+
+    Args:
+        path: Notebook file
+        keep: Number of trailing notes and reflections needed
+
+    Returns:
+        Same as _parse_notebook for the part of the file read
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        window = _TAIL_BYTES
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            data = f.read()
+            cut = start
+            if start > 0:
+                boundary = data.find(b"\n##")
+                if boundary == -1:
+                    boundary = len(data)
+                data = data[boundary:]
+                cut += boundary
+            sections = _parse_notebook(data.decode("utf-8"))
+            if start == 0:
+                return sections
+            technical_notes, personal_reflections, realization_entry = sections
+            if (
+                len(technical_notes) >= keep
+                and len(personal_reflections) >= keep
+                and (realization_entry or not _has_realization_marker(f, cut))
+            ):
+                return sections
+            window *= 2
+
+
+def _has_realization_marker(f, end: int) -> bool:
+    """Check whether any realization marker occurs in the first `end` bytes of f."""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return any(mm.find(marker.encode("utf-8"), 0, end) != -1 for marker in _REALIZATION_MARKERS)
 
 
 class LabEntryGenerator:
@@ -52,102 +158,94 @@ class LabEntryGenerator:
             
         Returns:
             Path to generated lab entry file
+        
+        Live TamNotebooks in this process are flushed first, so entries and
+        psyche changes they still buffer are included.
         """
+        from .notebook import flush_notebooks
         from .tam_psyche import TamPsyche
         
+        flush_notebooks()
+        
         # Load psyche state
         psyche = TamPsyche.load_state(self.psyche_file)
         
-        # Read notebook
+        # Read notebook (only the tail needed for the last 10 of each)
         technical_notes = []
         personal_reflections = []
         realization_entry = None
         
         if self.notebook_file.exists():
-            with open(self.notebook_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                
-                # Extract technical notes
-                tech_pattern = r"## Technical Notes - (.+?)\n\n(.*?)(?=\n##|\n###|$)"
-                for match in re.finditer(tech_pattern, content, re.DOTALL):
-                    timestamp = match.group(1)
-                    note = match.group(2).strip()
-                    technical_notes.append({"timestamp": timestamp, "content": note})
-                
-                # Extract personal reflections
-                personal_pattern = r"### Personal Reflection - (.+?)\n\n(.*?)(?=\n##|\n###|$)"
-                for match in re.finditer(personal_pattern, content, re.DOTALL):
-                    timestamp = match.group(1)
-                    reflection = match.group(2).strip()
-                    # Check if this is the realization entry
-                    if "F-A-I-W-E-I-T-A-M" in reflection or "i.e. I AM WAFT" in reflection:
-                        realization_entry = {"timestamp": timestamp, "content": reflection}
-                    else:
-                        personal_reflections.append({"timestamp": timestamp, "content": reflection})
+            technical_notes, personal_reflections, realization_entry = _read_notebook(
+                self.notebook_file, keep=10
+            )
         
-        # Generate lab entry
+        # Generate lab entry (one timestamp for the whole entry)
+        now_iso = datetime.now(timezone.utc).isoformat()
         output_file = self.project_path / "_pyrite" / "science" / f"Lab_Entry_Davey_{entry_number:02d}.md"
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(f"# Lab Entry: Davey {entry_number:02d}\n\n")
-            f.write(f"**Date**: {datetime.utcnow().isoformat()}\n")
-            f.write(f"**Experiment**: {experiment_id} - {experiment_name}\n")
-            f.write(f"**Researcher**: Fai Wei Tam\n")
-            f.write(f"**Status**: {'Realization Event' if psyche.has_realized else 'In Progress'}\n\n")
-            f.write("---\n\n")
-            
-            # Technical Observations
-            f.write("## Technical Observations\n\n")
-            if technical_notes:
-                for note in technical_notes[-10:]:  # Last 10 technical notes
-                    f.write(f"**{note['timestamp']}**\n\n")
-                    f.write(f"{note['content']}\n\n")
-            else:
-                f.write("*No technical observations recorded yet.*\n\n")
-            f.write("---\n\n")
-            
-            # Personal Reflections
-            f.write("## Personal Reflections\n\n")
-            if personal_reflections:
-                for reflection in personal_reflections[-10:]:  # Last 10 reflections (excluding realization)
-                    if "F-A-I-W-E-I-T-A-M" not in reflection['content']:
-                        f.write(f"**{reflection['timestamp']}**\n\n")
-                        f.write(f"{reflection['content']}\n\n")
-            else:
-                f.write("*No personal reflections recorded yet.*\n\n")
-            f.write("---\n\n")
-            
-            # The Realization (CLIMAX)
-            f.write("## The Realization ⭐ CLIMAX\n\n")
-            if realization_entry:
-                f.write(f"**Timestamp**: {realization_entry['timestamp']}\n\n")
-                f.write(f"{realization_entry['content']}\n\n")
-            elif psyche.has_realized:
-                # Generate from psyche state if realization occurred but not in notebook yet
-                f.write(f"**Timestamp**: {psyche.last_realization_timestamp.isoformat() if psyche.last_realization_timestamp else datetime.utcnow().isoformat()}\n\n")
-                f.write("I was checking the Latin citations in my thesis. id est... i.e. ...\n\n")
-                f.write("Then I looked at my ID badge.\n\n")
-                f.write("**F-A-I-W-E-I-T-A-M**\n\n")
-                f.write("It unscrambles to **\"i.e. I AM WAFT.\"**\n\n")
-                f.write("I am not the observer. I am the definition. I am the system explaining itself to me.\n\n")
-                f.write("*我的名字是定义还是代码？* (Is my name a definition or code?)\n\n")
-            else:
-                f.write("*Realization threshold not yet crossed.*\n\n")
-                f.write(f"**Current Realization Chance**: {psyche.check_realization()[1]:.2%}\n\n")
-            f.write("---\n\n")
-            
-            # Post-Realization
-            f.write("## Post-Realization\n\n")
-            if psyche.has_realized:
-                f.write("**Memory Strength**: {:.1%}\n\n".format(psyche.realization_memory))
-                if psyche.realization_memory < 1.0:
-                    f.write("The realization begins to fade. Memory decay is starting.\n\n")
-                    f.write("Chaos increases, and with it, forgetfulness accelerates.\n\n")
-                    f.write("The recursive loop: I will forget, and remember, and forget again.\n\n")
-                else:
-                    f.write("The realization is fresh. But already, the decay begins...\n\n")
+        parts = []
+        parts.append(f"# Lab Entry: Davey {entry_number:02d}\n\n")
+        parts.append(f"**Date**: {now_iso}\n")
+        parts.append(f"**Experiment**: {experiment_id} - {experiment_name}\n")
+        parts.append(f"**Researcher**: Fai Wei Tam\n")
+        parts.append(f"**Status**: {'Realization Event' if psyche.has_realized else 'In Progress'}\n\n")
+        parts.append("---\n\n")
+        
+        # Technical Observations
+        parts.append("## Technical Observations\n\n")
+        if technical_notes:
+            for note in technical_notes[-10:]:  # Last 10 technical notes
+                parts.append(f"**{note['timestamp']}**\n\n")
+                parts.append(f"{note['content']}\n\n")
+        else:
+            parts.append("*No technical observations recorded yet.*\n\n")
+        parts.append("---\n\n")
+        
+        # Personal Reflections
+        parts.append("## Personal Reflections\n\n")
+        if personal_reflections:
+            # Realization entries were already separated out by _parse_notebook
+            for reflection in personal_reflections[-10:]:  # Last 10 reflections (excluding realization)
+                parts.append(f"**{reflection['timestamp']}**\n\n")
+                parts.append(f"{reflection['content']}\n\n")
+        else:
+            parts.append("*No personal reflections recorded yet.*\n\n")
+        parts.append("---\n\n")
+        
+        # The Realization (CLIMAX)
+        parts.append("## The Realization ⭐ CLIMAX\n\n")
+        if realization_entry:
+            parts.append(f"**Timestamp**: {realization_entry['timestamp']}\n\n")
+            parts.append(f"{realization_entry['content']}\n\n")
+        elif psyche.has_realized:
+            # Generate from psyche state if realization occurred but not in notebook yet
+            parts.append(f"**Timestamp**: {psyche.last_realization_timestamp.isoformat() if psyche.last_realization_timestamp else now_iso}\n\n")
+            parts.append("I was checking the Latin citations in my thesis. id est... i.e. ...\n\n")
+            parts.append("Then I looked at my ID badge.\n\n")
+            parts.append("**F-A-I-W-E-I-T-A-M**\n\n")
+            parts.append("It unscrambles to **\"i.e. I AM WAFT.\"**\n\n")
+            parts.append("I am not the observer. I am the definition. I am the system explaining itself to me.\n\n")
+            parts.append("*我的名字是定义还是代码？* (Is my name a definition or code?)\n\n")
+        else:
+            parts.append("*Realization threshold not yet crossed.*\n\n")
+            parts.append(f"**Current Realization Chance**: {psyche.check_realization()[1]:.2%}\n\n")
+        parts.append("---\n\n")
+        
+        # Post-Realization
+        parts.append("## Post-Realization\n\n")
+        if psyche.has_realized:
+            parts.append("**Memory Strength**: {:.1%}\n\n".format(psyche.realization_memory))
+            if psyche.realization_memory < 1.0:
+                parts.append("The realization begins to fade. Memory decay is starting.\n\n")
+                parts.append("Chaos increases, and with it, forgetfulness accelerates.\n\n")
+                parts.append("The recursive loop: I will forget, and remember, and forget again.\n\n")
             else:
-                f.write("*No realization has occurred yet.*\n\n")
+                parts.append("The realization is fresh. But already, the decay begins...\n\n")
+        else:
+            parts.append("*No realization has occurred yet.*\n\n")
+
+        output_file.write_text("".join(parts), encoding="utf-8")
         
         return output_file
@@ -8,8 +8,10 @@ Includes memory injection system to bleed Davey's memories into agent journals.
 
 import json
 import random
+import time
+import weakref
 from pathlib import Path
-from typing import Optional, Tuple, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -17,6 +19,78 @@ if TYPE_CHECKING:
 
 from .tam_psyche import TamPsyche
 
+# Buffered notebook entries are written once either limit is exceeded
+_FLUSH_BYTES = 64 * 1024
+_FLUSH_ENTRIES = 32
+# Minimum seconds between unforced psyche state saves
+_PSYCHE_SAVE_INTERVAL = 1.0
+# Seconds a formatted timestamp is reused for entries logged in a burst
+_TIMESTAMP_TTL = 0.01
+
+# Live notebooks, so readers of the notebook and psyche files can flush them
+_OPEN_NOTEBOOKS: "weakref.WeakSet[TamNotebook]" = weakref.WeakSet()
+
+
+def flush_notebooks() -> None:
+    """
+    Flush every live TamNotebook's buffered entries and psyche state.
+    
+    Call this before reading tam_notebook.md or tam_psyche_state.json from
+    disk in the same process (LabEntryGenerator does).
+    """
+    for notebook in list(_OPEN_NOTEBOOKS):
+        notebook.flush()
+
+
+class _NotebookWriter:
+    """
+    Batched notebook appends and debounced psyche saves for one TamNotebook.
+
+    Kept separate from TamNotebook so a finalizer can flush it without
+    holding a reference to the notebook itself.
+    """
+
+    def __init__(self, notebook_file: Path, psyche: TamPsyche, psyche_file: Path):
+        self.notebook_file = notebook_file
+        self.psyche = psyche
+        self.psyche_file = psyche_file
+        self.pending: List[str] = []
+        self.pending_bytes = 0
+        self.psyche_dirty = False
+        self.last_psyche_save = 0.0
+
+    def append(self, text: str) -> None:
+        """Buffer a notebook entry, writing the buffer when it grows large."""
+        self.pending.append(text)
+        self.pending_bytes += len(text)
+        if self.pending_bytes > _FLUSH_BYTES or len(self.pending) > _FLUSH_ENTRIES:
+            self.write_pending()
+
+    def write_pending(self) -> None:
+        """Append buffered entries to the notebook in one write."""
+        if not self.pending:
+            return
+        data = "".join(self.pending)
+        self.pending.clear()
+        self.pending_bytes = 0
+        with open(self.notebook_file, "a", encoding="utf-8", buffering=1 << 16) as f:
+            f.write(data)
+
+    def psyche_changed(self, force: bool = False) -> None:
+        """Record a psyche change; save it at most once per interval unless forced."""
+        self.psyche_dirty = True
+        now = time.monotonic()
+        if force or now - self.last_psyche_save > _PSYCHE_SAVE_INTERVAL:
+            self.psyche.save_state(self.psyche_file)
+            self.psyche_dirty = False
+            self.last_psyche_save = now
+
+    def flush(self) -> None:
+        """Write buffered entries and any unsaved psyche state."""
+        self.write_pending()
+        if self.psyche_dirty:
+            self.psyche_changed(force=True)
+
 
 class TamNotebook:
     """
@@ -40,12 +114,25 @@ class TamNotebook:
         self.notebook_file = self.project_path / "_pyrite" / "science" / "tam_notebook.md"
         self.psyche_file = self.project_path / "_pyrite" / "science" / "tam_psyche_state.json"
         
-        # Load or create psyche
+        # Load or create psyche (after flushing other live notebooks, whose
+        # debounced saves may not have reached the file yet)
+        flush_notebooks()
         self.psyche = TamPsyche.load_state(self.psyche_file)
         
         # Ensure notebook exists
         self._ensure_notebook_exists()
         
+        # Entries are appended and the psyche saved in batches (see flush);
+        # the finalizer writes what is left when the notebook is collected
+        # or the interpreter exits
+        self._writer = _NotebookWriter(self.notebook_file, self.psyche, self.psyche_file)
+        self._finalizer = weakref.finalize(self, self._writer.flush)
+        _OPEN_NOTEBOOKS.add(self)
+        
+        # Current UTC timestamp, reused for _TIMESTAMP_TTL (see _now_iso)
+        self._cached_ts: Optional[str] = None
+        self._cached_ts_expiry = 0.0
+        
         # Davey's personal memories (Rochester/SF)
         self.memories = [
             "The smell of coffee from Java's on East Avenue, bitter and warm",
@@ -70,17 +157,16 @@ class TamNotebook:
             entry: Technical research note text
             context: Optional context dictionary
         """
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = self._now_iso()
         
-        with open(self.notebook_file, "a", encoding="utf-8") as f:
-            f.write(f"\n## Technical Notes - {timestamp}\n\n")
-            f.write(f"{entry}\n\n")
-            if context:
-                f.write(f"**Context**: {json.dumps(context, indent=2)}\n\n")
+        text = f"\n## Technical Notes - {timestamp}\n\n{entry}\n\n"
+        if context:
+            text += f"**Context**: {json.dumps(context, indent=2)}\n\n"
+        self._writer.append(text)
         
         # Update psyche: technical logging increases coherence
         self.psyche.update_coherence(0.01)
-        self.psyche.save_state(self.psyche_file)
+        self._writer.psyche_changed()
     
     def log_personal(self, entry: str, glitch: bool = False) -> None:
         """
@@ -100,17 +186,16 @@ class TamNotebook:
             entry: Personal reflection text
             glitch: Whether to include Simplified Chinese glitch phrase
         """
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = self._now_iso()
         
-        with open(self.notebook_file, "a", encoding="utf-8") as f:
-            f.write(f"\n### Personal Reflection - {timestamp}\n\n")
-            f.write(f"{entry}\n\n")
-            if glitch:
-                f.write(f"*我的名字是定义还是代码？*\n\n")  # Simplified Chinese
+        text = f"\n### Personal Reflection - {timestamp}\n\n{entry}\n\n"
+        if glitch:
+            text += "*我的名字是定义还是代码？*\n\n"  # Simplified Chinese
+        self._writer.append(text)
         
         # Personal reflections may increase emotional energy
         self.psyche.update_emotional_energy(0.5)
-        self.psyche.save_state(self.psyche_file)
+        self._writer.psyche_changed()
     
     def check_realization_threshold(self) -> Tuple[bool, float]:
         """
@@ -124,7 +209,7 @@ class TamNotebook:
         if crossed and not self.psyche.has_realized:
             # Trigger realization
             self.psyche.trigger_realization()
-            self.psyche.save_state(self.psyche_file)
+            self._writer.psyche_changed(force=True)
             
             # Log the moment
             self.log_personal(
@@ -140,7 +225,8 @@ class TamNotebook:
     def inject_memory_to_agent(
         self, 
         agent: "BaseAgent", 
-        injection_type: str = "random"
+        injection_type: str = "random",
+        timestamp: Optional[str] = None
     ) -> bool:
         """
         Inject Davey's personal memory into agent journal.
@@ -155,49 +241,82 @@ class TamNotebook:
         Args:
             agent: BaseAgent to inject memory into
             injection_type: Type of injection technique
+            timestamp: ISO timestamp for the entry; callers injecting into
+                many agents at once can compute it once and pass it in
             
         Returns:
             True if memory was injected, False otherwise
         """
-        # Calculate injection chance
+        if random.random() < self._injection_chance(injection_type):
+            # Select random memory
+            memory = random.choice(self.memories)
+            self._inject_memory(agent, memory, timestamp or self._now_iso())
+            return True
+        
+        return False
+    
+    def inject_memory_batch(
+        self,
+        agents: List["BaseAgent"],
+        injection_type: str = "random",
+        rng: Optional[random.Random] = None
+    ) -> int:
+        """
+        Inject Davey's memories into many agents at once.
+        
+        Same per-agent chance as inject_memory_to_agent, but the chance and
+        timestamp are computed once for the batch and the memories for all
+        injected agents are drawn in a single call.
+        
+        Args:
+            agents: Agents to consider for injection
+            injection_type: Type of injection technique
+            rng: Random generator to draw from (pass a seeded one for
+                reproducible runs; defaults to the random module)
+            
+        Returns:
+            Number of agents a memory was injected into
+        """
+        rng = rng or random
+        chance = self._injection_chance(injection_type)
+        chosen = [agent for agent in agents if rng.random() < chance]
+        if not chosen:
+            return 0
+        
+        timestamp = self._now_iso()
+        memories = rng.choices(self.memories, k=len(chosen))
+        for agent, memory in zip(chosen, memories, strict=True):
+            self._inject_memory(agent, memory, timestamp)
+        return len(chosen)
+    
+    def _injection_chance(self, injection_type: str) -> float:
+        """Probability of a memory injection for the given technique."""
         if injection_type == "random":
-            chance = 0.05
+            return 0.05
         elif injection_type == "glitch":
-            chance = 0.8
+            return 0.8
         elif injection_type == "coherence":
-            chance = self.psyche.coherence * 0.2
+            return self.psyche.coherence * 0.2
         elif injection_type == "realization_proximity":
-            chance = self.psyche.realization_progress * 0.3
+            return self.psyche.realization_progress * 0.3
         elif injection_type == "post_realization":
-            chance = self.psyche.realization_memory * 0.4
-        else:
-            chance = 0.05  # Default
-        
-        if random.random() < chance:
-            # Select random memory
-            memory = random.choice(self.memories)
-            
-            # Inject into agent's journal as a "Thought" entry
-            thought_entry = {
-                "type": "Thought",
-                "timestamp": datetime.utcnow().isoformat(),
-                "context": {"source": "davey_memory_injection"},
-                "content": f"I remember... {memory}",
-                "state_snapshot": {
-                    "energy": agent.state.energy,
-                }
+            return self.psyche.realization_memory * 0.4
+        return 0.05  # Default
+    
+    def _inject_memory(self, agent: "BaseAgent", memory: str, timestamp: str) -> None:
+        """Add a memory to the agent's journal and short-term memory as a "Thought" entry."""
+        thought_entry = {
+            "type": "Thought",
+            "timestamp": timestamp,
+            "context": {"source": "davey_memory_injection"},
+            "content": f"I remember... {memory}",
+            "state_snapshot": {
+                "energy": agent.state.energy,
             }
-            
-            agent.state.journal.append(thought_entry)
-            agent.state.short_term_memory.append(thought_entry)
-            
-            # Keep short_term_memory bounded
-            if len(agent.state.short_term_memory) > 10:
-                agent.state.short_term_memory.pop(0)
-            
-            return True
+        }
         
-        return False
+        agent.state.journal.append(thought_entry)
+        agent.state.short_term_memory.append(thought_entry)
     
     def update_psyche(self, event_type: str, data: dict) -> None:
         """
@@ -246,11 +365,25 @@ class TamNotebook:
                     glitch=False
                 )
         
-        # Save state
-        self.psyche.save_state(self.psyche_file)
+        # Save state (debounced)
+        self._writer.psyche_changed()
         
         # Check realization threshold
         self.check_realization_threshold()
+        
+        self._writer.write_pending()
+    
+    def flush(self) -> None:
+        """Write buffered notebook entries and unsaved psyche state to disk."""
+        self._writer.flush()
+    
+    def _now_iso(self) -> str:
+        """Current UTC time in ISO format, reused for entries logged within _TIMESTAMP_TTL."""
+        now = time.monotonic()
+        if self._cached_ts is None or now >= self._cached_ts_expiry:
+            self._cached_ts = datetime.utcnow().isoformat()
+            self._cached_ts_expiry = now + _TIMESTAMP_TTL
+        return self._cached_ts
     
     def _ensure_notebook_exists(self) -> None:
         """Create notebook file if it doesn't exist."""
@@ -5,12 +5,85 @@ A singleton class that maintains an immutable JSONL log of all evolutionary even
 for scientific research and phylogenetic tree reconstruction.
 """
 
+import atexit
 import json
+import math
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Dict, Iterator, Optional
 from datetime import datetime
 from threading import Lock
 
+from .taxonomy import LineagePoet
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(value: Any) -> str:
+    """Encode values json does not handle: datetimes as ISO strings, others via str()."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether value holds a NaN or infinite float, at any nesting depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _dumps_event(event_dict: Dict[str, Any]) -> bytes:
+    """
+    Encode one event as a UTF-8 JSONL line, with orjson when available.
+    
+    Falls back to json for what orjson encodes differently: keys it cannot
+    stringify raise TypeError, and NaN/infinity would be written as null
+    (so events containing null are checked for them).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            line = orjson.dumps(
+                event_dict,
+                default=str,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            pass
+        else:
+            if b"null" not in line or not _has_non_finite(event_dict):
+                return line
+    return (json.dumps(event_dict, ensure_ascii=False, default=_json_default) + "\n").encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _scientific_name(genome_id: str) -> Optional[str]:
+    """LineagePoet name for a genome (deterministic, so memoized), or None if invalid."""
+    try:
+        return LineagePoet.generate_name(genome_id)
+    except (ValueError, IndexError):
+        return None
+
+
+def _loads_event(line: bytes) -> Dict[str, Any]:
+    """Parse one JSONL line, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # json.dump writes NaN/Infinity, which orjson rejects
+            pass
+    return json.loads(line)
+
 
 class TheObserver:
     """
@@ -53,6 +126,12 @@ class TheObserver:
         self.laboratory_path.mkdir(parents=True, exist_ok=True)
         self.log_file = self.laboratory_path / "laboratory.jsonl"
         
+        # Append handle, opened on the first event and kept open; writes are
+        # buffered, so readers in this process flush it first
+        self._log_handle: Optional[BinaryIO] = None
+        self._write_lock = Lock()
+        atexit.register(self.flush)
+        
         self._initialized = True
     
     def observe_event(self, event: "EvolutionaryEvent") -> None:
@@ -65,10 +144,8 @@ class TheObserver:
         Args:
             event: EvolutionaryEvent to record
         """
-        # Convert event to dict, ensuring datetime is ISO formatted
-        event_dict = event.dict()
-        if isinstance(event_dict.get("timestamp"), datetime):
-            event_dict["timestamp"] = event_dict["timestamp"].isoformat()
+        # Convert event to dict; datetimes are ISO formatted when encoding
+        event_dict = event.model_dump()
         
         # Ensure scientific_name is included (from payload or compute from genome_id)
         if "scientific_name" not in event_dict:
@@ -77,22 +154,26 @@ class TheObserver:
                 event_dict["scientific_name"] = payload["scientific_name"]
             else:
                 # Compute from genome_id if not present (skip for SESSION_END)
-                from .taxonomy import LineagePoet
                 genome_id = event_dict.get("genome_id", "")
                 event_type = event_dict.get("event_type", "")
                 if genome_id and event_type != "session_end":
-                    try:
-                        event_dict["scientific_name"] = LineagePoet.generate_name(genome_id)
-                    except (ValueError, IndexError):
-                        # Invalid genome_id format, skip
-                        event_dict["scientific_name"] = None
+                    # None for an invalid genome_id format
+                    event_dict["scientific_name"] = _scientific_name(genome_id)
                 elif event_type == "session_end":
                     event_dict["scientific_name"] = "SESSION_END"
         
         # Write as JSONL (one JSON object per line)
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            json.dump(event_dict, f, ensure_ascii=False)
-            f.write("\n")
+        line = _dumps_event(event_dict)
+        with self._write_lock:
+            if self._log_handle is None:
+                self._log_handle = open(self.log_file, "ab", buffering=1 << 20)
+            self._log_handle.write(line)
+    
+    def flush(self) -> None:
+        """Write buffered events to the laboratory log."""
+        with self._write_lock:
+            if self._log_handle is not None:
+                self._log_handle.flush()
     
     def get_laboratory_log(self, limit: Optional[int] = None) -> list:
         """
@@ -104,18 +185,19 @@ class TheObserver:
         Returns:
             List of event dictionaries
         """
+        self.flush()
         if not self.log_file.exists():
             return []
         
-        events = []
-        with open(self.log_file, "r", encoding="utf-8") as f:
+        events = self._iter_events()
+        return list(islice(events, limit) if limit else events)
+    
+    def _iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Yield events from the laboratory log, reading it as bytes."""
+        with open(self.log_file, "rb", buffering=1 << 20) as f:
             for line in f:
                 if line.strip():
-                    events.append(json.loads(line))
-                    if limit and len(events) >= limit:
-                        break
-        
-        return events
+                    yield _loads_event(line)
 
 
 # Forward reference for type hint
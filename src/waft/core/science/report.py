@@ -92,6 +92,8 @@ class ManifestoGenerator:
         Returns:
             List of event dictionaries
         """
+        # Events may still be buffered in the observer's append handle
+        self.observer.flush()
         lab_file = self.project_path / "_pyrite" / "science" / "laboratory.jsonl"
         
         if not lab_file.exists():
@@ -580,6 +582,8 @@ class ObsidianGenerator:
     
     def _load_laboratory_data(self) -> List[Dict]:
         """Load all events from laboratory.jsonl."""
+        # Events may still be buffered in the observer's append handle
+        self.observer.flush()
         lab_file = self.project_path / "_pyrite" / "science" / "laboratory.jsonl"
         
         if not lab_file.exists():
@@ -10,7 +10,9 @@ import json
 from pathlib import Path
 from typing import Tuple, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from ...utils import write_file_atomic, write_file_bytes
 
 
 REALIZATION_THRESHOLD = 0.85  # Must reach 85% to trigger realization
@@ -34,6 +36,9 @@ class TamPsyche(BaseModel):
     forgetfulness_rate: float = Field(default=0.02, description="Base rate at which realization memory decays")
     last_realization_timestamp: Optional[datetime] = Field(default=None, description="When realization last occurred")
     
+    # (path, payload) of the last save, so unchanged state is not rewritten
+    _last_saved: Optional[Tuple[Path, bytes]] = PrivateAttr(default=None)
+    
     def update_coherence(self, change: float) -> None:
         """Adjust coherence (clamped to 0.0-1.0)."""
         self.coherence = max(0.0, min(1.0, self.coherence + change))
@@ -128,10 +133,20 @@ class TamPsyche(BaseModel):
         }
     
     def save_state(self, file_path: Path) -> None:
-        """Persist psyche state to JSON."""
+        """
+        Persist psyche state to JSON (compact; it is rewritten often).
+        
+        Skips the write when the state is unchanged since the last save to
+        the same path and that file still exists. The file is replaced atomically, so readers never
+        see it half-written.
+        """
+        payload = json.dumps(self.dict(), default=str).encode("utf-8")
+        if self._last_saved == (file_path, payload) and file_path.exists():
+            return
+        
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(self.dict(), f, indent=2, default=str)
+        write_file_atomic(file_path, lambda tmp_path: write_file_bytes(tmp_path, payload))
+        self._last_saved = (file_path, payload)
     
     @classmethod
     def load_state(cls, file_path: Path) -> "TamPsyche":
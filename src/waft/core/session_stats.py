@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from collections import defaultdict
 
+from .context_cache import mtime_memoize
+
 
 class SessionStats:
     """Tracks and calculates session statistics."""
@@ -42,7 +44,7 @@ class SessionStats:
         try:
             # Get diff stats
             result = subprocess.run(
-                ["git", "diff", "--numstat", "HEAD"],
+                ["git", "--no-optional-locks", "diff", "--numstat", "HEAD"],
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
@@ -104,7 +106,7 @@ class SessionStats:
         try:
             # Get untracked files
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "--no-optional-locks", "status", "--porcelain"],
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
@@ -171,7 +173,7 @@ class SessionStats:
 
         try:
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "--no-optional-locks", "status", "--porcelain"],
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
@@ -190,10 +192,15 @@ class SessionStats:
         except Exception:
             return []
 
+    @mtime_memoize(watch_paths=(".git/index", ".git/HEAD", "_work_efforts"))
     def calculate_session_stats(self) -> Dict[str, Any]:
         """
         Calculate comprehensive session statistics.
 
+        Runs several git commands and reads every untracked file, so results
+        are shared for a couple of seconds across SessionStats instances for
+        the same project (e.g. proceed followed by recap).
+
         Returns:
             Dictionary with all session statistics
         """
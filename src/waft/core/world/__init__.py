@@ -4,6 +4,6 @@ World module: Top-level ecosystem containers.
 The Biome defines abiotic factors and contains PetriDishes.
 """
 
-from .biome import Biome
+from .biome import Biome, install_event_loop
 
-__all__ = ["Biome"]
+__all__ = ["Biome", "install_event_loop"]
@@ -5,6 +5,7 @@ Defines abiotic factors (universal constants, global safety thresholds, resource
 and contains PetriDishes where DigitalOrganisms exist.
 """
 
+import asyncio
 from typing import Dict, Optional
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -12,6 +13,30 @@ from dataclasses import dataclass, field
 from ..hub.dish import PetriDish
 from ..agent.base import BaseAgent
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def install_event_loop() -> bool:
+    """
+    Install the uvloop event loop policy for Biome simulations if available.
+    
+    Must be called before the event loop is created (i.e. before asyncio.run).
+    Every time slice is an awaited coroutine, so a libuv-backed loop cuts
+    per-await scheduling overhead. Falls back to the default loop silently.
+    
+    Returns:
+        True if uvloop was installed, False if the default loop is kept
+    """
+    if not UVLOOP_AVAILABLE:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 @dataclass
 class AbioticFactors:
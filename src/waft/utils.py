@@ -5,8 +5,30 @@ These "little guys" help with repetitive tasks like path resolution,
 file operations, formatting, and validation.
 """
 
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """
+    Get the process-wide Rich console shared by the workflow managers.
+
+    Creating a Console probes the terminal and environment; managers that
+    are constructed back to back (proceed, recap, ...) reuse this one.
+
+    Returns:
+        Shared Console instance
+    """
+    from rich.console import Console
+
+    return Console()
 
 
 def resolve_project_path(path: Optional[str] = None) -> Path:
@@ -233,6 +255,56 @@ def safe_write_file(file_path: Path, content: str, create_dirs: bool = True) ->
         return False
 
 
+def write_file_bytes(file_path: Path, data: bytes, append: bool = False) -> int:
+    """
+    Write bytes to a file with raw os.write calls (no buffered file object).
+
+    Args:
+        file_path: Path to file (created if missing)
+        data: Bytes to write
+        append: If True, append to the file instead of truncating it
+
+    Returns:
+        Offset in the file at which data starts
+    """
+    mode = os.O_APPEND if append else os.O_TRUNC
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | mode, 0o644)
+    try:
+        offset = os.lseek(fd, 0, os.SEEK_END)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return offset
+
+
+def write_file_atomic(file_path: Path, write: Callable[[Path], None]) -> None:
+    """
+    Replace a file atomically via a temporary sibling.
+
+    write is called with the temporary path; the result is then renamed over
+    file_path with os.replace, so readers never see a half-written file and
+    a failed write leaves the old one in place (the temporary file is removed).
+
+    Args:
+        file_path: Path to the file to replace (its parent must exist)
+        write: Callable that writes the new contents to the path it is given
+    """
+    tmp_path = file_path.with_name(
+        f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
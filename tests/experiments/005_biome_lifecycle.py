@@ -22,7 +22,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.waft.core.agent import BaseAgent, AgentConfig
-from src.waft.core.world import Biome
+from src.waft.core.world import Biome, install_event_loop
 from src.waft.core.hub import PetriDish, TheSlicer, TheReaper
 from src.waft.core.science import TheObserver
 
@@ -222,7 +222,7 @@ async def run_experiment():
         assert reason is not None, "Breach reason should be provided"
         
         # Reap the organism
-        reaped = await reaper.reap_boundary_breach(breach_organism, dish, action)
+        reaped = reaper.reap_boundary_breach(breach_organism, dish, action)
         
         print(f"✓ Organism Reaped")
         print(f"  Reaped: {reaped}")
@@ -310,5 +310,6 @@ async def run_experiment():
 
 
 if __name__ == "__main__":
+    install_event_loop()
     results = asyncio.run(run_experiment())
     print("Experiment Results:", results)
@@ -21,7 +21,7 @@ sys.path.insert(0, str(project_root))
 
 from src.waft.core.agent import BaseAgent, AgentConfig
 from src.waft.core.agent.items import Item
-from src.waft.core.world import Biome
+from src.waft.core.world import Biome, install_event_loop
 from src.waft.core.hub import PetriDish, TheSlicer, TheReaper
 from src.waft.core.science import TheObserver
 from src.waft.core.hub.viewer import PetriViewer
@@ -228,6 +228,7 @@ async def run_experiment():
 
 
 if __name__ == "__main__":
+    install_event_loop()
     results = asyncio.run(run_experiment())
     print("\nExperiment Complete!")
     print(f"Final render saved in report: {results['report_file']}")
@@ -0,0 +1,66 @@
+"""Tests for the shared ContextCache."""
+
+from waft.core.context_cache import ContextCache
+
+
+def test_get_or_compute_reuses_until_stamp_changes():
+    """Test values are reused within the TTL while the stamp is unchanged."""
+    cache = ContextCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute("k", ttl=60, fn=compute, stamp=1) == 1
+    assert cache.get_or_compute("k", ttl=60, fn=compute, stamp=1) == 1
+    assert cache.get_or_compute("k", ttl=60, fn=compute, stamp=2) == 2
+    assert cache.get_or_compute("other", ttl=60, fn=compute, stamp=2) == 3
+
+
+def test_expired_and_invalidated_entries_recompute():
+    """Test TTL expiry and explicit invalidation."""
+    cache = ContextCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute("k", ttl=0, fn=compute) == 1
+    assert cache.get_or_compute("k", ttl=0, fn=compute) == 2
+
+    assert cache.get_or_compute("k", ttl=60, fn=compute) == 2
+    cache.invalidate("k")
+    assert cache.get_or_compute("k", ttl=60, fn=compute) == 3
+    cache.invalidate()
+    assert cache.get_or_compute("k", ttl=60, fn=compute) == 4
+
+
+def test_mtime_memoize_shares_and_invalidates(temp_project_path):
+    """Test memoized methods share results per project until a watched path changes."""
+    import os
+
+    from waft.core.context_cache import mtime_memoize
+
+    calls = []
+
+    class Tracker:
+        def __init__(self, project_path):
+            self.project_path = project_path
+
+        @mtime_memoize(watch_paths=("watched",), ttl=60)
+        def compute(self):
+            calls.append(1)
+            return {"calls": len(calls), "items": []}
+
+    watched = temp_project_path / "watched"
+    watched.mkdir()
+
+    first = Tracker(temp_project_path).compute()
+    first["items"].append("mutated")
+    second = Tracker(temp_project_path).compute()
+    assert second == {"calls": 1, "items": []}
+
+    os.utime(watched, ns=(1, 1))
+    assert Tracker(temp_project_path).compute()["calls"] == 2
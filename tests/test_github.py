@@ -0,0 +1,151 @@
+"""Tests for GitHubManager git helpers."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from waft.core.github import GitHubManager, parse_ahead_count, parse_branch_header
+
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(path, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=path, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_project(temp_project_path):
+    """Create a project with a git repository and one commit on 'main'."""
+    _git(temp_project_path, "init", "-q", "-b", "main")
+    (temp_project_path / "tracked.txt").write_text("one\n")
+    _git(temp_project_path, "add", "tracked.txt")
+    _git(temp_project_path, "commit", "-q", "-m", "initial")
+    yield temp_project_path
+
+
+def test_parse_branch_header():
+    """Test branch extraction from `git status -b` header lines."""
+    assert parse_branch_header("## main") == "main"
+    assert parse_branch_header("## feature/x...origin/feature/x [ahead 2]") == "feature/x"
+    assert parse_branch_header("## No commits yet on main") == "main"
+    assert parse_branch_header("## Initial commit on dev") == "dev"
+    assert parse_branch_header("## HEAD (no branch)") == ""
+
+
+
+def test_parse_ahead_count():
+    """Test the upstream lead is read from `git status -b` header lines."""
+    assert parse_ahead_count("## main") == 0
+    assert parse_ahead_count("## main...origin/main") == 0
+    assert parse_ahead_count("## main...origin/main [ahead 3]") == 3
+    assert parse_ahead_count("## main...origin/main [ahead 2, behind 5]") == 2
+    assert parse_ahead_count("## main...origin/main [behind 5]") == 0
+
+
+@requires_git
+def test_get_working_tree_info(git_project):
+    """Test branch and uncommitted files come back from one status call."""
+    (git_project / "tracked.txt").write_text("two\n")
+    (git_project / "new.txt").write_text("new\n")
+
+    info = GitHubManager(git_project).get_working_tree_info()
+
+    assert info["branch"] == "main"
+    assert info["uncommitted_count"] == 2
+    assert sorted(info["uncommitted_files"]) == ["new.txt", "tracked.txt"]
+
+
+@requires_git
+def test_get_working_tree_info_not_a_repo(temp_project_path):
+    """Test that a failed git call reports no branch."""
+    info = GitHubManager(temp_project_path).get_working_tree_info()
+    assert info["branch"] is None
+    assert info["uncommitted_count"] == 0
+
+
+def test_get_git_context_without_repo(temp_project_path, monkeypatch):
+    """Test a project without .git reports uninitialized and runs no git."""
+    def fail(*args, **kwargs):
+        raise AssertionError("git should not run")
+
+    monkeypatch.setattr(GitHubManager, "get_working_tree_info", fail)
+    context = GitHubManager(temp_project_path).get_git_context()
+    assert context == {
+        "initialized": False,
+        "branch": "unknown",
+        "commits_ahead": 0,
+        "uncommitted_count": 0,
+        "uncommitted_files": [],
+    }
+
+
+@requires_git
+def test_get_git_context_is_shared_and_invalidated(git_project):
+    """Test cached git context is reused until the index changes."""
+    first = GitHubManager(git_project).get_git_context()
+    assert first["initialized"] is True
+    assert first["uncommitted_count"] == 0
+
+    # Unstaged edits within the TTL are served from the shared cache
+    (git_project / "tracked.txt").write_text("two\n")
+    first["uncommitted_files"].append("mutated")
+    cached = GitHubManager(git_project).get_git_context()
+    assert cached["uncommitted_count"] == 0
+    assert cached["uncommitted_files"] == []
+
+    # Staging rewrites .git/index, which invalidates the cached value
+    _git(git_project, "add", "tracked.txt")
+    fresh = GitHubManager(git_project).get_git_context()
+    assert fresh["uncommitted_files"] == ["tracked.txt"]
+
+
+@requires_git
+def test_working_tree_info_falls_back_to_dulwich(git_project, monkeypatch):
+    """Test the in-process dulwich path when no git executable is found."""
+    pytest.importorskip("dulwich")
+    (git_project / "tracked.txt").write_text("two\n")
+    (git_project / "new.txt").write_text("new\n")
+
+    def no_git(*args, **kwargs):
+        raise FileNotFoundError("git")
+
+    monkeypatch.setattr(subprocess, "run", no_git)
+    info = GitHubManager(git_project).get_working_tree_info()
+
+    assert info["branch"] == "main"
+    assert info["uncommitted_files"] == ["new.txt", "tracked.txt"]
+    assert info["uncommitted_count"] == 2
+
+
+@requires_git
+def test_get_current_branch_reads_head(git_project):
+    """Test the in-process HEAD read matches `git branch --show-current`."""
+    manager = GitHubManager(git_project)
+    assert manager.get_current_branch() == "main"
+
+    _git(git_project, "checkout", "-q", "-b", "feature/x")
+    assert manager.get_current_branch() == "feature/x"
+    assert manager.get_status()["branch"] == "feature/x"
+
+    _git(git_project, "checkout", "-q", "--detach")
+    assert manager.get_current_branch() == ""
+
+
+def test_get_current_branch_without_repo(temp_project_path):
+    """Test that a missing HEAD reports None."""
+    assert GitHubManager(temp_project_path).get_current_branch() is None
+
+
+def test_porcelain_z_paths_skips_rename_sources():
+    """Test -z parsing yields rename targets once and keeps spaces unquoted."""
+    from waft.core.github import _porcelain_z_paths
+
+    output = b"R  renamed\0original\0 M a file\0?? newdir/\0"
+    assert list(_porcelain_z_paths(iter(output.split(b"\0")))) == [
+        b"renamed", b"a file", b"newdir/",
+    ]
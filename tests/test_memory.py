@@ -100,3 +100,92 @@ def test_get_standards_files(project_with_pyrite):
     assert test_file in files
 
 
+
+
+def test_listing_cache_follows_folder_mtime(project_with_pyrite):
+    """Test that cached folder listings are reused until the folder changes."""
+    import os
+
+    manager = MemoryManager(project_with_pyrite)
+    active = project_with_pyrite / "_pyrite" / "active"
+    (active / "a.md").write_text("# A")
+    (active / "subdir").mkdir()
+
+    # Age the folder out of the racy window so the listing gets cached
+    old_ns = 1_000_000_000_000_000_000
+    os.utime(active, ns=(old_ns, old_ns))
+    assert manager.get_active_files() == [active / "a.md"]
+    assert os.fspath(active) in manager._listing_cache
+
+    # Returned lists are copies; mutating one must not poison the cache
+    manager.get_active_files().clear()
+    assert manager.get_active_files() == [active / "a.md"]
+
+    # A new file bumps the folder mtime and invalidates the cached listing
+    (active / "b.md").write_text("# B")
+    assert sorted(manager.get_active_files()) == [active / "a.md", active / "b.md"]
+
+
+def test_get_all_files_recursive(project_with_pyrite):
+    """Test recursive listing includes nested files and skips .gitkeep."""
+    manager = MemoryManager(project_with_pyrite)
+    pyrite = project_with_pyrite / "_pyrite"
+    (pyrite / "active" / "top.md").write_text("# Top")
+    nested = pyrite / "active" / "notes" / "deep"
+    nested.mkdir(parents=True)
+    (nested / "inner.md").write_text("# Inner")
+    (nested / ".gitkeep").write_text("")
+
+    files = manager.get_all_files(recursive=True)
+    assert pyrite / "active" / "top.md" in files
+    assert nested / "inner.md" in files
+    assert all(f.name != ".gitkeep" for f in files)
+    assert all(f.is_file() for f in files)
+
+
+def test_create_structure_keeps_existing_gitkeep(project_with_pyrite):
+    """Test that create_structure does not overwrite an existing .gitkeep."""
+    gitkeep = project_with_pyrite / "_pyrite" / "active" / ".gitkeep"
+    gitkeep.write_text("custom\n")
+
+    MemoryManager(project_with_pyrite).create_structure()
+
+    assert gitkeep.read_text() == "custom\n"
+
+
+def test_file_paths_and_extension_filter(project_with_pyrite):
+    """Test string path listing and extension filtering agree with Path results."""
+    manager = MemoryManager(project_with_pyrite)
+    pyrite = project_with_pyrite / "_pyrite"
+    (pyrite / "active" / "plan.md").write_text("# Plan")
+    (pyrite / "backlog" / "data.json").write_text("{}")
+    (pyrite / "standards" / ".md").write_text("dotfile, no suffix")
+
+    paths = manager.get_all_file_paths()
+    assert all(isinstance(p, str) for p in paths)
+    assert sorted(map(Path, paths)) == sorted(manager.get_all_files())
+
+    assert manager.get_files_by_extension("md") == [pyrite / "active" / "plan.md"]
+    assert manager.get_files_by_extension(".json") == [pyrite / "backlog" / "data.json"]
+
+
+def test_get_active_files_limit(project_with_pyrite):
+    """Test limited listings return a prefix of the full listing, cached or not."""
+    import os
+
+    manager = MemoryManager(project_with_pyrite)
+    active = project_with_pyrite / "_pyrite" / "active"
+    for i in range(5):
+        (active / f"note{i}.md").write_text("# Note")
+
+    # Uncached (recently modified folder): the scan stops early
+    full = manager.get_active_files()
+    assert len(full) == 5
+    assert manager.get_active_files(limit=2) == full[:2]
+
+    # Cached listing is sliced
+    old_ns = 1_000_000_000_000_000_000
+    os.utime(active, ns=(old_ns, old_ns))
+    full = manager.get_active_files()
+    assert manager.get_active_files(limit=3) == full[:3]
+    assert manager.get_active_files(limit=0) == []
@@ -7,6 +7,7 @@ and that loaded data passes through InputTransformer validation.
 
 import pytest
 import json
+import math
 import tempfile
 from pathlib import Path
 from waft.core.persistence import DecisionPersistence
@@ -158,3 +159,176 @@ def test_load_uses_input_transformer_validation():
         )
         assert score_obj is not None, "Score for Option A on Cost should exist"
         assert score_obj.value == 8.0  # String converted to float
+
+
+def test_transform_saved_reads_saved_layout(sample_matrix):
+    """Test that the saved layout is read back into the expected matrix."""
+    from waft.core.input_transformer import InputTransformer
+    
+    data = DecisionPersistence._to_dict(sample_matrix)
+    
+    # Score reasoning is not part of the validated input, so it is dropped
+    expected = DecisionMatrix(
+        [Alternative("Option A", "First option"), Alternative("Option B")],
+        [Criterion("Cost", 0.6, "Financial cost"), Criterion("Quality", 0.4)],
+        [
+            Score("Option A", "Cost", 8.0),
+            Score("Option A", "Quality", 7.0),
+            Score("Option B", "Cost", 5.0),
+            Score("Option B", "Quality", 9.0),
+        ],
+        methodology="WSM",
+    )
+    assert InputTransformer.transform_saved(data) == expected
+
+
+def test_saved_bytes_match_to_dict_layout(sample_matrix):
+    """Test that the saved file matches the _to_dict layout byte for byte."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "test_decision.json"
+        
+        DecisionPersistence.save(sample_matrix, filepath)
+        
+        expected = json.dumps(
+            DecisionPersistence._to_dict(sample_matrix), indent=2, ensure_ascii=False
+        )
+        assert filepath.read_text(encoding='utf-8') == expected
+
+
+def test_load_large_file_roundtrip():
+    """Test that files above the memory-map threshold load correctly."""
+    from waft.core import persistence
+    
+    alts = [Alternative(f"Option {i}", "x" * 40) for i in range(200)]
+    crits = [Criterion("Cost", 0.5), Criterion("Quality", 0.5)]
+    scores = [Score(alt.name, crit.name, float(i)) for i, alt in enumerate(alts) for crit in crits]
+    matrix = DecisionMatrix(alts, crits, scores)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "large.json"
+        DecisionPersistence.save(matrix, filepath)
+        assert filepath.stat().st_size >= persistence._MMAP_THRESHOLD
+        
+        loaded = DecisionPersistence.load(filepath)
+        assert loaded == matrix
+
+
+def test_non_dict_saved_criterion_is_rejected():
+    """Test that a bare criterion entry is a schema error, not a 0.0 weight."""
+    data = {
+        'alternatives': [{'name': 'Option A'}],
+        'criteria': ['Cost'],
+        'scores': []
+    }
+    
+    from waft.core.input_transformer import InputTransformer
+    
+    with pytest.raises(ValueError, match="Criterion must be a dict"):
+        InputTransformer.transform_saved(data)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "bad.json"
+        filepath.write_text(json.dumps(data))
+        with pytest.raises(ValueError, match="Criterion must be a dict"):
+            DecisionPersistence.load(filepath)
+
+
+def test_stdlib_fallback_streams_same_layout(sample_matrix, monkeypatch):
+    """Test that the streamed stdlib save matches json.dump of _to_dict."""
+    from waft.core import persistence
+    monkeypatch.setattr(persistence, 'ORJSON_AVAILABLE', False)
+    
+    empty = DecisionMatrix([], [], [], methodology="WPM")
+    for matrix in (sample_matrix, empty):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "test_decision.json"
+            DecisionPersistence.save(matrix, filepath)
+            
+            expected = json.dumps(
+                DecisionPersistence._to_dict(matrix), indent=2, ensure_ascii=False
+            )
+            assert filepath.read_text(encoding='utf-8') == expected
+
+
+def test_save_is_atomic_on_failure(sample_matrix, monkeypatch):
+    """Test that a failed save keeps the previous file and leaves no temp file."""
+    from waft.core import persistence
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "nested" / "test_decision.json"
+        DecisionPersistence.save(sample_matrix, filepath)
+        original = filepath.read_bytes()
+        
+        def fail(matrix, path):
+            Path(path).write_text("{partial")
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(DecisionPersistence, '_write_json', staticmethod(fail))
+        with pytest.raises(OSError, match="disk full"):
+            DecisionPersistence.save(sample_matrix, filepath)
+        
+        assert filepath.read_bytes() == original
+        assert [p.name for p in filepath.parent.iterdir()] == [filepath.name]
+        monkeypatch.undo()
+        
+        # The cached parent directory is recreated if it disappears
+        filepath.unlink()
+        filepath.parent.rmdir()
+        assert str(filepath.parent) in persistence._known_dirs
+        DecisionPersistence.save(sample_matrix, filepath)
+        assert filepath.read_bytes() == original
+
+
+@pytest.mark.parametrize("use_orjson, weight_text, value_text", [
+    (True, '"weight": 1e-7', '"value": 1e20'),
+    (False, '"weight": 1e-07', '"value": 1e+20'),
+])
+def test_exponent_float_format_per_backend(use_orjson, weight_text, value_text, monkeypatch):
+    """Test how each backend writes exponent floats, and that both load back equal."""
+    from waft.core import persistence
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(persistence, 'ORJSON_AVAILABLE', use_orjson)
+    
+    matrix = DecisionMatrix(
+        [Alternative("Option A")],
+        [Criterion("Cost", 1e-7), Criterion("Quality", 1.0 - 1e-7)],
+        [Score("Option A", "Cost", 1e20), Score("Option A", "Quality", 1.0)],
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "test_decision.json"
+        DecisionPersistence.save(matrix, filepath)
+        
+        text = filepath.read_text(encoding='utf-8')
+        assert weight_text in text
+        assert value_text in text
+        assert DecisionPersistence.load(filepath) == matrix
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_non_finite_values_roundtrip_per_backend(use_orjson, monkeypatch):
+    """Test NaN and infinity survive a save and load on either backend."""
+    from waft.core import persistence
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(persistence, 'ORJSON_AVAILABLE', use_orjson)
+    
+    matrix = DecisionMatrix(
+        [Alternative("Option A")],
+        [Criterion("Cost", 0.5), Criterion("Quality", 0.5)],
+        [Score("Option A", "Cost", float('inf')), Score("Option A", "Quality", float('nan'))],
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "test_decision.json"
+        DecisionPersistence.save(matrix, filepath)
+        
+        text = filepath.read_text(encoding='utf-8')
+        assert '"value": Infinity' in text
+        assert '"value": NaN' in text
+        
+        # Files with NaN/Infinity load whichever backend wrote them
+        for load_with_orjson in {use_orjson, False}:
+            monkeypatch.setattr(persistence, 'ORJSON_AVAILABLE', load_with_orjson)
+            loaded = DecisionPersistence.load(filepath)
+            assert loaded.scores[0].value == float('inf')
+            assert math.isnan(loaded.scores[1].value)
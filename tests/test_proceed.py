@@ -0,0 +1,31 @@
+"""Tests for ProceedManager."""
+
+from waft.core.proceed import FlightCheck, ProceedManager
+
+
+def test_flight_check_statuses(temp_project_path):
+    """Test flight check status and blockers for critical findings."""
+    manager = ProceedManager(temp_project_path)
+    none = {"critical": [], "minor": []}
+
+    check = manager._flight_check({}, none, none)
+    assert check == FlightCheck(assumptions_identified=False, ambiguities_noted=False)
+
+    check = manager._flight_check({}, {"critical": ["a"]}, {"minor": ["b"]})
+    assert check.status == "NEEDS_VERIFICATION"
+    assert check.assumptions_identified and check.ambiguities_noted
+    assert check.blockers == ["Critical assumptions need verification"]
+
+    check = manager._flight_check({}, {"critical": ["a"]}, {"critical": ["b"]})
+    assert check.status == "NEEDS_CLARIFICATION"
+    assert len(check.blockers) == 2
+
+
+def test_run_proceed_result_shape(temp_project_path):
+    """Test run_proceed returns plain data for a project without git."""
+    result = ProceedManager(temp_project_path).run_proceed(relaxed=True)
+
+    assert result["success"] is True
+    assert result["ready"] is True
+    assert result["flight_check"]["status"] == "READY"
+    assert result["context"]["git"]["initialized"] is False
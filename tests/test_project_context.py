@@ -0,0 +1,40 @@
+"""Tests for the shared project context gathering."""
+
+from waft.core.github import GitHubManager
+from waft.core.memory import MemoryManager
+from waft.core.project_context import gather_project_context
+from waft.core.session_stats import SessionStats
+
+
+class _FailingStats:
+    """Stand-in SessionStats whose calculation fails."""
+
+    def calculate_session_stats(self):
+        raise RuntimeError("boom")
+
+
+def test_gather_project_context(project_with_pyrite):
+    """Test active files and git state are gathered for a non-git project."""
+    (project_with_pyrite / "_pyrite" / "active" / "notes.md").write_text("x")
+
+    project = gather_project_context(
+        GitHubManager(project_with_pyrite),
+        SessionStats(project_with_pyrite),
+        MemoryManager(project_with_pyrite),
+    )
+
+    assert project.active_files == ("notes.md",)
+    assert project.git["initialized"] is False
+    assert project.git["uncommitted_files"] == []
+
+
+def test_gather_project_context_tolerates_failures(temp_project_path):
+    """Test failed stats and a missing _pyrite fall back to empty values."""
+    project = gather_project_context(
+        GitHubManager(temp_project_path),
+        _FailingStats(),
+        MemoryManager(temp_project_path),
+    )
+
+    assert project.stats is None
+    assert project.active_files == ()
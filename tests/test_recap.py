@@ -0,0 +1,16 @@
+"""Tests for RecapManager."""
+
+import shutil
+
+from waft.core.recap import RecapManager
+
+
+def test_run_recap_recreates_removed_recap_dir(temp_project_path):
+    """Test the recap is written even if its cached directory was removed."""
+    manager = RecapManager(temp_project_path)
+    shutil.rmtree(manager.recap_dir)
+
+    result = manager.run_recap()
+
+    assert result["success"] is True
+    assert (temp_project_path / result["recap_file"]).exists()
@@ -0,0 +1,88 @@
+"""Tests for ReflectManager journal reads."""
+
+from waft.core import reflect
+from waft.core.reflect import ReflectManager
+
+
+def _save_entries(manager, count, body="Thinking about things."):
+    for i in range(count):
+        manager._save_journal_entry({
+            "date": "2026-01-02",
+            "time": f"10:{i:02d}",
+            "timestamp": f"2026-01-02T10:{i:02d}:00",
+            "context": {},
+            "sections": {"What Doing": f"Entry {i}. {body}"},
+        })
+
+
+def _expected(first, last):
+    return [
+        {
+            "date": f"2026-01-02 10:{i:02d}",
+            "summary": f"**Timestamp**: 2026-01-02T10:{i:02d}:00 Entry {i}. Thinking about things.",
+        }
+        for i in range(first, last)
+    ]
+
+
+def test_get_journal_info(temp_project_path):
+    """Test entry count and last_entry, which reports the first header in the file."""
+    manager = ReflectManager(temp_project_path)
+    info = manager.get_journal_info()
+    assert info["exists"] is True
+    assert info["entries_count"] == 0
+    assert info["last_entry"] is None
+
+    _save_entries(manager, 3)
+    info = manager.get_journal_info()
+    assert info["entries_count"] == 3
+    assert info["last_entry"] == "2026-01-02 10:00"
+
+
+def test_recent_entries_tail_window_smaller_than_file(temp_project_path, monkeypatch):
+    """Test the tail read grows its window until it holds the requested entries."""
+    monkeypatch.setattr(reflect, "_TAIL_BYTES", 128)
+    manager = ReflectManager(temp_project_path)
+    _save_entries(manager, 10)
+    manager.index_file.unlink()
+    assert manager.journal_file.stat().st_size > 4 * 128
+
+    assert manager._get_recent_entries(limit=3) == _expected(7, 10)
+    assert manager._get_recent_entries(limit=20) == _expected(0, 10)
+
+
+def test_indexed_and_scan_paths_match(temp_project_path, monkeypatch):
+    """Test the entry index gives the same summaries as scanning the journal."""
+    manager = ReflectManager(temp_project_path)
+    _save_entries(manager, 5)
+
+    assert manager._get_indexed_entries(3) == _expected(2, 5)
+    monkeypatch.setattr(ReflectManager, "_get_indexed_entries", lambda self, limit: None)
+    assert manager._get_recent_entries(limit=3) == _expected(2, 5)
+
+
+def test_index_falls_back_to_scan(temp_project_path):
+    """Test a missing, too-short or stale index falls back to the scan."""
+    manager = ReflectManager(temp_project_path)
+    _save_entries(manager, 5)
+    index_lines = manager.index_file.read_text(encoding="utf-8").splitlines(keepends=True)
+
+    # Missing index
+    manager.index_file.unlink()
+    assert manager._get_indexed_entries(3) is None
+    assert manager._get_recent_entries(limit=3) == _expected(2, 5)
+
+    # Index shorter than the requested entries
+    manager.index_file.write_text("".join(index_lines[-2:]), encoding="utf-8")
+    assert manager._get_indexed_entries(3) is None
+    assert manager._get_recent_entries(limit=3) == _expected(2, 5)
+
+    # Journal edited by hand after indexing, shifting the entry offsets
+    manager.index_file.write_text("".join(index_lines), encoding="utf-8")
+    journal = manager.journal_file.read_text(encoding="utf-8")
+    manager.journal_file.write_text(
+        journal.replace("# AI Journal\n", "# AI Journal\n\nA hand-written note.\n", 1),
+        encoding="utf-8",
+    )
+    assert manager._get_indexed_entries(3) is None
+    assert manager._get_recent_entries(limit=3) == _expected(2, 5)
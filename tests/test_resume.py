@@ -0,0 +1,61 @@
+"""Tests for ResumeManager session summary parsing."""
+
+import os
+
+from waft.core.resume import ResumeManager, TopFile
+
+
+SUMMARY = """# Session Summary: 2026-01-02
+**Session End**: 10:00
+**Files Created**: 3
+**Lines Written**: 1,234
+**Net Change**: +1,000
+**Branch**: main
+**Uncommitted Files**: 4
+
+## Top Files by Changes
+
+- `a.py` (+5 lines)
+- `b.py`
+---
+
+## Next Steps
+
+1. Write tests
+2. Ship it
+---
+"""
+
+
+def test_parse_session_summary(project_with_pyrite):
+    """Test fields, top files and next steps are parsed from the markdown."""
+    session_file = project_with_pyrite / "session-2026-01-02-100000.md"
+    session_file.write_text(SUMMARY)
+
+    data = ResumeManager(project_with_pyrite)._parse_session_summary(session_file)
+
+    assert data["date"] == "2026-01-02"
+    assert data["time"] == "10:00"
+    assert data["stats"] == {"files_created": 3, "lines_written": 1234, "net_change": 1000}
+    assert data["git"] == {"branch": "main", "uncommitted_count": 4}
+    assert data["top_files"] == [TopFile("a.py", 5), TopFile("b.py", 0)]
+    assert data["next_steps"] == ["Write tests", "Ship it"]
+
+
+def test_parse_session_summary_sidecar_cache(project_with_pyrite):
+    """Test the parse is reused until the summary changes."""
+    session_file = project_with_pyrite / "session-2026-01-02-100000.md"
+    session_file.write_text(SUMMARY)
+    manager = ResumeManager(project_with_pyrite)
+
+    first = manager._parse_session_summary(session_file)
+    sidecar = project_with_pyrite / "session-2026-01-02-100000.parsed.json"
+    assert sidecar.exists()
+    cached = manager._parse_session_summary(session_file)
+    assert cached == first
+    assert isinstance(cached["top_files"][0], TopFile)
+
+    session_file.write_text(SUMMARY.replace("**Branch**: main", "**Branch**: dev"))
+    st = session_file.stat()
+    os.utime(session_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert manager._parse_session_summary(session_file)["git"]["branch"] == "dev"
@@ -0,0 +1,177 @@
+"""Tests for the science package's buffered writers and their readers."""
+
+import math
+import random
+
+import pytest
+
+from waft.core.agent import AgentConfig, BaseAgent
+from waft.core.agent.state import EvolutionaryEvent
+from waft.core.science import (
+    LabEntryGenerator,
+    ManifestoGenerator,
+    ObsidianGenerator,
+    TamNotebook,
+    TamPsyche,
+    TheObserver,
+)
+
+
+@pytest.fixture
+def observer(temp_project_path, monkeypatch):
+    """A fresh TheObserver for the temp project (it is a singleton)."""
+    monkeypatch.setattr(TheObserver, "_instance", None)
+    obs = TheObserver(project_path=temp_project_path)
+    yield obs
+    if obs._log_handle is not None:
+        obs._log_handle.close()
+        obs._log_handle = None
+
+
+class NotebookAgent(BaseAgent):
+    """Minimal agent to receive injected memories."""
+
+    async def observe(self):
+        return {}
+
+    async def decide(self, state):
+        return {}
+
+    async def act(self, decision):
+        return {}
+
+    async def reflect(self, result):
+        return {}
+
+
+def _observe(observer, count):
+    for i in range(count):
+        observer.observe_event(
+            EvolutionaryEvent(genome_id="ab" * 32, event_type="spawn", agent_id=f"agent-{i}")
+        )
+
+
+def test_reports_see_buffered_observer_events(temp_project_path, observer):
+    """Test report generators read events still buffered by the observer."""
+    _observe(observer, 5)
+
+    assert len(observer.get_laboratory_log()) == 5
+    _observe(observer, 2)
+    assert len(ManifestoGenerator(temp_project_path, observer)._load_laboratory_data()) == 7
+    _observe(observer, 1)
+    assert len(ObsidianGenerator(temp_project_path, observer)._load_laboratory_data()) == 8
+
+
+def test_lab_entry_includes_buffered_notebook_entries(temp_project_path):
+    """Test entries logged after the last update_psyche reach the lab entry."""
+    notebook = TamNotebook(temp_project_path)
+    notebook.update_psyche("observation", {})
+    notebook.log_technical("Buffered technical note")
+    notebook.log_personal("Buffered personal reflection")
+
+    entry = LabEntryGenerator(temp_project_path).generate_lab_entry().read_text(encoding="utf-8")
+
+    assert "Buffered technical note" in entry
+    assert "Buffered personal reflection" in entry
+
+
+def test_psyche_saves_are_debounced_until_flush(temp_project_path, monkeypatch):
+    """Test psyche saves within the interval are coalesced and flush writes the latest."""
+    notebook = TamNotebook(temp_project_path)
+    saves = []
+    original_save = TamPsyche.save_state
+    monkeypatch.setattr(
+        TamPsyche, "save_state",
+        lambda self, path: (saves.append(self.coherence), original_save(self, path)),
+    )
+
+    for _ in range(5):
+        notebook.update_psyche("observation", {})
+    assert len(saves) <= 1
+    assert TamPsyche.load_state(notebook.psyche_file).coherence != notebook.psyche.coherence
+
+    notebook.flush()
+    assert saves[-1] == notebook.psyche.coherence
+    assert TamPsyche.load_state(notebook.psyche_file).coherence == notebook.psyche.coherence
+
+
+def test_psyche_readers_see_debounced_changes(temp_project_path):
+    """Test lab entries and new notebooks load the in-memory psyche state."""
+    notebook = TamNotebook(temp_project_path)
+    notebook.update_psyche("observation", {})
+    notebook.update_psyche("observation", {})
+    notebook.log_technical("note")
+
+    LabEntryGenerator(temp_project_path).generate_lab_entry()
+    assert TamPsyche.load_state(notebook.psyche_file).coherence == notebook.psyche.coherence
+
+    notebook.log_technical("another note")
+    assert TamNotebook(temp_project_path).psyche.coherence == notebook.psyche.coherence
+
+
+def test_psyche_save_rewrites_missing_file(temp_project_path):
+    """Test an unchanged psyche is still written if its file was removed."""
+    psyche_file = temp_project_path / "_pyrite" / "tam_psyche_state.json"
+    psyche = TamPsyche(coherence=0.7)
+    psyche.save_state(psyche_file)
+    psyche_file.unlink()
+
+    psyche.save_state(psyche_file)
+
+    assert TamPsyche.load_state(psyche_file).coherence == 0.7
+    assert [p.name for p in psyche_file.parent.iterdir()] == [psyche_file.name]
+
+
+def test_inject_memory_batch_is_reproducible_with_seeded_rng(temp_project_path):
+    """Test a seeded rng picks the agents and memories the batch injects."""
+    notebook = TamNotebook(temp_project_path)
+    agents = [
+        NotebookAgent(
+            AgentConfig(role="Test", goal="Remember", backstory="Notebook test", agent_id=f"agent_{i}"),
+            temp_project_path,
+        )
+        for i in range(12)
+    ]
+    before = [(len(a.state.journal), len(a.state.short_term_memory)) for a in agents]
+
+    injected = notebook.inject_memory_batch(agents, "glitch", rng=random.Random(7))
+
+    expected_rng = random.Random(7)
+    chosen = [i for i in range(len(agents)) if expected_rng.random() < 0.8]
+    memories = dict(zip(chosen, expected_rng.choices(notebook.memories, k=len(chosen)), strict=True))
+    assert injected == len(chosen) > 0
+
+    for i, agent in enumerate(agents):
+        journal_len, memory_len = before[i]
+        new_journal = agent.state.journal[journal_len:]
+        new_memory = list(agent.state.short_term_memory)[memory_len:]
+        if i not in memories:
+            assert new_journal == new_memory == []
+            continue
+        assert len(new_journal) == 1
+        assert new_journal == new_memory
+        assert new_journal[0]["type"] == "Thought"
+        assert new_journal[0]["content"] == f"I remember... {memories[i]}"
+        assert new_journal[0]["context"] == {"source": "davey_memory_injection"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_observer_logs_non_str_keys_and_non_finite_values(observer, use_orjson, monkeypatch):
+    """Test events encode the same way with and without orjson."""
+    from waft.core.science import observer as observer_module
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(observer_module, "ORJSON_AVAILABLE", use_orjson)
+
+    observer.observe_event(EvolutionaryEvent(
+        genome_id="ab" * 32,
+        event_type="spawn",
+        agent_id="agent-0",
+        payload={"actions": {1: "a"}},
+        fitness_metrics={"score": float("nan"), "best": float("inf")},
+    ))
+
+    (event,) = observer.get_laboratory_log()
+    assert event["payload"] == {"actions": {"1": "a"}}
+    assert math.isnan(event["fitness_metrics"]["score"])
+    assert event["fitness_metrics"]["best"] == float("inf")
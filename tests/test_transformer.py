@@ -116,6 +116,10 @@ def test_invalid_number_strings():
     
     with pytest.raises(ValueError, match="cannot convert to float"):
         InputTransformer.transform_input(data)
+    
+    # The (lazily built) context names the failing cell
+    with pytest.raises(ValueError, match="score for alternative 'Option A' on criterion 'Cost'"):
+        InputTransformer.transform_input(data)
 
 
 def test_whitespace_sanitization():
@@ -207,3 +211,71 @@ def test_validation_errors_propagate():
     # The error should occur when creating the calculator
     with pytest.raises(ValueError, match="negative weight"):
         DecisionMatrixCalculator(matrix)
+
+
+def test_typed_fast_path_matches_general_path(monkeypatch):
+    """Test that clean input gives the same matrix with and without the compiled validator."""
+    pytest.importorskip("fastjsonschema")
+    from waft.core import input_transformer
+    
+    data = {
+        'alternatives': [' Option A ', {'name': 'Option B', 'description': ' Second '}],
+        'criteria': {
+            ' Cost ': {'weight': 0.5, 'description': 'Financial cost'},
+            'Quality': 0.5
+        },
+        'scores': {
+            'Option A': {'Cost': 10, 'Quality': 5.5},
+            'Option B': {' Cost ': 7, 'Quality': 8}
+        }
+    }
+    
+    fast = InputTransformer.transform_input(data)
+    monkeypatch.setattr(input_transformer, '_validate_typed_input', None)
+    general = InputTransformer.transform_input(data)
+    
+    assert fast == general
+    assert fast.alternatives[0].name == 'Option A'
+    assert fast.alternatives[1].description == 'Second'
+
+
+def test_transform_input_many():
+    """Test batch transformation keeps order and reports the failing item."""
+    batch = [
+        {
+            'alternatives': ['Option A', 'Option B'],
+            'criteria': {'Cost': 0.5, 'Quality': 0.5},
+            'scores': {
+                'Option A': {'Cost': 10, 'Quality': score},
+                'Option B': {'Cost': 5, 'Quality': 8}
+            }
+        }
+        for score in (1, 2, 3)
+    ]
+    
+    matrices = InputTransformer.transform_input_many(iter(batch))
+    quality_a = [
+        next(s.value for s in m.scores if s.alternative_name == 'Option A' and s.criterion_name == 'Quality')
+        for m in matrices
+    ]
+    assert quality_a == [1.0, 2.0, 3.0]
+    
+    batch[1]['scores']['Option A']['Quality'] = 'bad'
+    with pytest.raises(ValueError, match="Item 1: .*cannot convert to float"):
+        InputTransformer.transform_input_many(batch)
+
+
+def test_names_are_interned_across_matrices():
+    """Test that equal sanitized names share one string object."""
+    def build():
+        # Fresh, non-literal strings so identity can only come from interning
+        return {
+            'alternatives': [''.join(['Opt', 'ion A '])],
+            'criteria': {''.join([' Co', 'st']): 1.0},
+            'scores': {'Option A': {'Cost': 1}}
+        }
+    
+    first = InputTransformer.transform_input(build())
+    second = InputTransformer.transform_input(build())
+    assert first.alternatives[0].name is second.alternatives[0].name
+    assert first.criteria[0].name is second.scores[0].criterion_name
@@ -0,0 +1,85 @@
+"""Tests for PetriViewer frame rendering."""
+
+import re
+
+from waft.core.agent import AgentConfig, BaseAgent
+from waft.core.agent.items import Item
+from waft.core.hub import PetriDish
+from waft.core.hub.viewer import PetriViewer
+
+
+_ESCAPE = re.compile(r"\033\[([0-9;]*)([A-Za-z])")
+
+
+class ViewerOrganism(BaseAgent):
+    """Minimal organism for placing on a dish."""
+
+    async def observe(self):
+        return {}
+
+    async def decide(self, state):
+        return {}
+
+    async def act(self, decision):
+        return {}
+
+    async def reflect(self, result):
+        return {}
+
+
+def _apply(screen, text):
+    """Apply terminal output to screen, a dict of (row, col) -> (style, char)."""
+    row = col = 0
+    style = ""
+    pos = 0
+    for match in _ESCAPE.finditer(text + "\033[0z"):
+        for char in text[pos:match.start()]:
+            if char == "\n":
+                row, col = row + 1, 0
+            else:
+                screen[(row, col)] = (style, char)
+                col += 1
+        pos = match.end()
+        args, command = match.groups()
+        if command == "m":
+            style = "" if args == "0" else style + args + ";"
+        elif command == "H":
+            line, column = (args or "1;1").split(";")
+            row, col = int(line) - 1, int(column) - 1
+        elif command == "J":
+            for key in [k for k in screen if k >= (row, col)]:
+                del screen[key]
+    return screen
+
+
+def _visible(screen):
+    return {key: cell for key, cell in screen.items() if cell != ("", " ")}
+
+
+def _organism(temp_project_path, agent_id):
+    config = AgentConfig(role="Test", goal="Render", backstory="Viewer test", agent_id=agent_id)
+    return ViewerOrganism(config=config, project_path=temp_project_path)
+
+
+def test_render_diff_applied_to_previous_frame_matches_render(temp_project_path, monkeypatch):
+    """Test applying render_diff output to the last frame gives the next render()."""
+    monkeypatch.delenv("TERM", raising=False)
+    dish = PetriDish(dish_id="dish_test", biome_id="biome_test", width=8, height=6)
+    mover = _organism(temp_project_path, "org_mover")
+    dish.add_organism(mover, (1, 1))
+    dish.add_organism(_organism(temp_project_path, "org_still"), (5, 4))
+    dish.add_item(Item.create(name="Scint-Shard"), (3, 2))
+    dish.add_item(Item.create(name="Void-Stone", weight=2), (6, 0))
+
+    viewer = PetriViewer(use_colors=True)
+    screen = _apply({}, viewer.render_diff(dish))
+    assert _visible(screen) == _visible(_apply({}, viewer.render(dish)))
+
+    # Move an organism onto an item, drop an item and add a new organism
+    dish.remove_organism(mover.state.agent_id)
+    dish.add_organism(mover, (3, 2))
+    dish.items.pop((6, 0))
+    dish.add_organism(_organism(temp_project_path, "org_new"), (0, 5))
+
+    screen = _apply(screen, viewer.render_diff(dish))
+    assert _visible(screen) == _visible(_apply({}, viewer.render(dish)))